@@ -0,0 +1,87 @@
+# --- external imports ---
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable, aio
+
+
+class Config(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['seed', 'weights'])
+        self.seed = kwargs.get('seed')
+        self.weights = kwargs.get('weights')
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @seed.setter
+    def seed(self, input_value):
+        self._seed = input_value
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @weights.setter
+    def weights(self, input_value):
+        self._weights = np.asarray(input_value) if input_value is not None else None
+
+
+async def load_blocking(path: Path):
+    Config().load_from_json(path)
+
+
+async def load_async(path: Path):
+    await Config().aload_from_json(path)
+
+
+async def measure(method, paths: list, interval: float) -> tuple:
+    """Loads every file concurrently while a ticker measures how late the event loop wakes it up."""
+    delays = list()
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            delays.append(time.perf_counter() - start - interval)
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(interval)
+    start = time.perf_counter()
+    await asyncio.gather(*(method(path) for path in paths))
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(2 * interval)  # let the ticker record the delay of its pending tick
+    task.cancel()
+    return elapsed, max(delays) if delays else float('nan')
+
+
+def run(count: int, size: int, max_workers: int, max_pending: int):
+    aio.configure(max_workers, max_pending)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [Config(seed=index, weights=np.random.default_rng(index).normal(size=size))
+                 .save_to_json(Path(directory) / f"config_{index}") for index in range(count)]
+        print("method   | files | seconds | max loop delay (ms)")
+        for name, method in (('blocking', load_blocking), ('async', load_async)):
+            elapsed, delay = asyncio.run(measure(method, paths, 0.001))
+            print(f"{name:8s} | {count:5d} | {elapsed:7.3f} | {delay * 1000:19.1f}")
+    aio.shutdown()
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event loop responsiveness while loading Parsables from JSON.")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=aio.default_max_workers)
+    parser.add_argument("--max-pending", type=int, default=aio.default_max_pending)
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.size, arguments.max_workers, arguments.max_pending)
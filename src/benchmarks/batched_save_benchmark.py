@@ -0,0 +1,58 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+from pathlib import Path
+# --- internal imports ---
+from plugnparse import Parsable
+
+
+class Parameters(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['step', 'values'])
+        self.step = kwargs.get('step')
+        self.values = kwargs.get('values')
+
+    @property
+    def step(self):
+        return self._step
+
+    @step.setter
+    def step(self, input_value):
+        self._step = input_value
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, input_value):
+        self._values = input_value
+
+
+def run(count: int, fsync: bool):
+    parameters = {f"parameters{index:05d}": Parameters(step=index, values=[index] * 16) for index in range(count)}
+    print("method          | files | seconds")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, atomic in (('in place', False), ('atomic', True)):
+            start = time.perf_counter()
+            for key, value in parameters.items():
+                value.save_to_json(Path(directory) / name / key, atomic=atomic, fsync=fsync)
+            print(f"{name:15s} | {count:5d} | {time.perf_counter() - start:7.3f}")
+
+        start = time.perf_counter()
+        Parsable.save_many_to_json(Path(directory) / "batch", parameters, fsync=fsync)
+        print(f"{'atomic batch':15s} | {count:5d} | {time.perf_counter() - start:7.3f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Saving many small Parsables one at a time versus as a batch.")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--fsync", action="store_true")
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.fsync)
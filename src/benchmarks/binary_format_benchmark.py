@@ -0,0 +1,60 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable
+
+
+class Weights(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['name', 'values'])
+        self.name = kwargs.get('name')
+        self.values = kwargs.get('values')
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, input_value):
+        self._name = input_value
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, input_value):
+        self._values = None if input_value is None else np.asarray(input_value)
+
+
+def run(size: int):
+    weights = Weights(name="weights", values=np.random.default_rng(0).normal(size=size))
+    print("format | save seconds | load seconds | megabytes")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, save, load in (('json', Weights.save_to_json, Weights.load_from_json),
+                                 ('binary', Weights.save_to_binary, Weights.load_from_binary),
+                                 ('mmap', Weights.save_to_binary,
+                                  lambda parsable, path: parsable.load_from_binary(path, mmap_mode='r'))):
+            start = time.perf_counter()
+            path = save(weights, Path(directory) / "weights")
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            load(Weights(), path)
+            loaded = time.perf_counter() - start
+            print(f"{name:6s} | {saved:12.3f} | {loaded:12.3f} | {path.stat().st_size / 1e6:9.1f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Saving and loading a large array as JSON versus the binary format.")
+    parser.add_argument("--size", type=int, default=2000000)
+    arguments = parser.parse_args()
+    run(arguments.size)
@@ -0,0 +1,51 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable, io
+
+
+class Table(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['values'])
+        self.values = kwargs.get('values')
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, input_value):
+        self._values = None if input_value is None else np.asarray(input_value)
+
+
+def run(size: int):
+    table = Table(values=np.round(np.random.default_rng(0).normal(size=size), 3))
+    print("extension | save seconds | load seconds | megabytes")
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in ('', *io.compression_formats):
+            if suffix and not io.compression_formats[suffix].is_available():
+                print(f"{suffix:9s} | not installed")
+                continue
+            start = time.perf_counter()
+            path = table.save_to_json(Path(directory) / ("table" + suffix))
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            Table().load_from_json(path)
+            loaded = time.perf_counter() - start
+            print(f"{suffix or '.json':9s} | {saved:12.3f} | {loaded:12.3f} | {path.stat().st_size / 1e6:9.2f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Saving and loading a Parsable with each compression format.")
+    parser.add_argument("--size", type=int, default=1000000)
+    arguments = parser.parse_args()
+    run(arguments.size)
@@ -0,0 +1,78 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+# --- internal imports ---
+from plugnparse import Parsable, io
+
+
+class Run(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['seed', 'learning_rate', 'layers'])
+        self.seed = kwargs.get('seed')
+        self.learning_rate = kwargs.get('learning_rate')
+        self.layers = kwargs.get('layers')
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @seed.setter
+    def seed(self, input_value):
+        self._seed = input_value
+
+    @property
+    def learning_rate(self):
+        return self._learning_rate
+
+    @learning_rate.setter
+    def learning_rate(self, input_value):
+        self._learning_rate = input_value
+
+    @property
+    def layers(self):
+        return self._layers
+
+    @layers.setter
+    def layers(self, input_value):
+        self._layers = input_value
+
+
+def run(count: int, workers: int):
+    print("method     | files | seconds")
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(count):
+            Run(seed=index, learning_rate=1e-3 * index, layers=[64, 64, index % 7]).save_to_json(
+                Path(directory) / f"run{index:06d}")
+        files = io.list_json_files(directory)
+
+        start = time.perf_counter()
+        for file in files:
+            Run().load_from_json(file)
+        print(f"serial     | {count:5d} | {time.perf_counter() - start:7.3f}")
+
+        start = time.perf_counter()
+        for _ in Run.load_many_from_json(files, max_workers=workers):
+            pass
+        print(f"threads    | {count:5d} | {time.perf_counter() - start:7.3f}")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            for _ in Run.load_many_from_json(files, executor=executor, chunk_size=256):
+                pass
+            print(f"processes  | {count:5d} | {time.perf_counter() - start:7.3f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Loading a directory of small Parsable JSON files.")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=8)
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.workers)
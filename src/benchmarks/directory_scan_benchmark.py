@@ -0,0 +1,43 @@
+# --- external imports ---
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+# --- internal imports ---
+from plugnparse import io
+
+
+def listdir_most_recent(directory: str) -> Path:
+    """The previous enumeration: a Path and two stats per entry, then a stat per subdirectory for the maximum."""
+    subdirectories = [Path(os.path.join(directory, name)) for name in os.listdir(directory)
+                      if io.is_directory(os.path.join(directory, name))]
+    return max(subdirectories, key=os.path.getctime)
+
+
+def scandir_most_recent(directory: str) -> Path:
+    return io.get_most_recently_created_subdirectory(directory)
+
+
+def run(count: int, repeat: int):
+    with tempfile.TemporaryDirectory() as directory:
+        for index in range(count):
+            os.mkdir(os.path.join(directory, f"run_{index}"))
+            open(os.path.join(directory, f"log_{index}.txt"), "w").close()
+        print("method  | entries | seconds")
+        for name, method in (('listdir', listdir_most_recent), ('scandir', scandir_most_recent)):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                method(directory)
+            print(f"{name:7s} | {2 * count:7d} | {(time.perf_counter() - start) / repeat:7.4f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Most recent subdirectory query with os.listdir versus os.scandir.")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.repeat)
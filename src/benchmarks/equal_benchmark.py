@@ -0,0 +1,55 @@
+# --- external imports ---
+import argparse
+import time
+# --- internal imports ---
+from plugnparse.equal import equal
+
+
+def legacy_sets_equal(a, b, **kwargs) -> bool:
+    """Reproduces the previous pairwise implementation of 'equal.sets_equal()'."""
+    if len(a) != len(b):
+        return False
+    for a_item in a:
+        if not any(equal(a_item, b_item, **kwargs) for b_item in b):
+            return False
+    return True
+
+
+def create_cases(size: int) -> dict:
+    """Creates pairs of equal sets holding `size` items each."""
+    floats = {index * 0.5 for index in range(size)}
+    return {
+        'strings': ({"tag" + str(index) for index in range(size)}, {"tag" + str(index) for index in range(size)}, {}),
+        'floats': (floats, set(floats), {}),
+        'floats (atol)': (floats, {value + 1e-6 for value in floats}, {'atol': 1e-3}),
+        'floats (rtol)': (floats, {value * (1 + 1e-7) for value in floats}, {'rtol': 1e-6, 'atol': 0}),
+        'tuples': ({("tag", index) for index in range(size)}, {("tag", float(index)) for index in range(size)}, {}),
+    }
+
+
+def measure(method, a, b, kwargs) -> float:
+    start = time.perf_counter()
+    assert method(a, b, **kwargs)
+    return time.perf_counter() - start
+
+
+def run(size: int, legacy_size: int):
+    print("case           | size   | bucketed (s) | legacy size | legacy (s)")
+    legacy_cases = create_cases(legacy_size)
+    for name, (a, b, kwargs) in create_cases(size).items():
+        legacy_a, legacy_b, _ = legacy_cases[name]
+        bucketed = measure(equal, a, b, kwargs)
+        legacy = measure(legacy_sets_equal, legacy_a, legacy_b, kwargs)
+        print(f"{name:14s} | {size:6d} | {bucketed:12.4f} | {legacy_size:11d} | {legacy:10.4f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Set equality with hash buckets versus pairwise comparison.")
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--legacy-size", type=int, default=500,
+                        help="The size of the sets compared pairwise, which scales quadratically.")
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.legacy_size)
@@ -0,0 +1,75 @@
+# --- external imports ---
+import argparse
+import time
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable
+
+
+class Config(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['seed', 'weights'])
+        self.seed = kwargs.get('seed')
+        self.weights = kwargs.get('weights')
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @seed.setter
+    def seed(self, input_value):
+        self._seed = input_value
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @weights.setter
+    def weights(self, input_value):
+        self._weights = input_value
+
+
+def create_configs(count: int, unique: int, size: int) -> list:
+    """Creates `count` configs holding `unique` distinct contents."""
+    weights = [np.random.default_rng(seed).normal(size=size) for seed in range(unique)]
+    return [Config(seed=index % unique, weights=weights[index % unique].copy()) for index in range(count)]
+
+
+def deduplicate_pairwise(configs: list) -> list:
+    unique = list()
+    for config in configs:
+        if not any(config.equals(other) for other in unique):
+            unique.append(config)
+    return unique
+
+
+def deduplicate_by_fingerprint(configs: list) -> list:
+    unique = dict()
+    for config in configs:
+        unique.setdefault(config.fingerprint(), config)
+    return list(unique.values())
+
+
+def run(count: int, unique: int, size: int):
+    print("method      | configs | unique | seconds")
+    for name, method in (('pairwise', deduplicate_pairwise), ('fingerprint', deduplicate_by_fingerprint),
+                         ('cached', deduplicate_by_fingerprint), ('pairwise-fp', deduplicate_pairwise)):
+        # --- the last two methods reuse the configs whose fingerprints are cached by the fingerprint method ---
+        configs = create_configs(count, unique, size) if name in ('pairwise', 'fingerprint') else configs
+        start = time.perf_counter()
+        result = method(configs)
+        print(f"{name:11s} | {count:7d} | {len(result):6d} | {time.perf_counter() - start:7.3f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deduplication of Parsable configs by fingerprint versus equals.")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--unique", type=int, default=500)
+    parser.add_argument("--size", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.unique, arguments.size)
@@ -0,0 +1,68 @@
+# --- external imports ---
+import argparse
+import time
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable
+
+
+class Checkpoint(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['step', 'loss', 'weights'])
+        self.step = kwargs.get('step')
+        self.loss = kwargs.get('loss')
+        self.weights = kwargs.get('weights')
+
+    @property
+    def step(self):
+        return self._step
+
+    @step.setter
+    def step(self, input_value):
+        self._step = input_value
+
+    @property
+    def loss(self):
+        return self._loss
+
+    @loss.setter
+    def loss(self, input_value):
+        self._loss = input_value
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @weights.setter
+    def weights(self, input_value):
+        self._weights = input_value
+
+
+class TrackedCheckpoint(Checkpoint):
+    track_changes = True
+
+
+def run(steps: int, size: int):
+    weights = np.random.default_rng(0).normal(size=size)
+    print("method    | steps | seconds")
+    for name, class_type in (('full', Checkpoint), ('tracked', TrackedCheckpoint)):
+        checkpoint = class_type(step=0, loss=0.0, weights=weights.copy())
+        start = time.perf_counter()
+        for step in range(steps):
+            checkpoint.step = step
+            checkpoint.loss = 1.0 / (step + 1)
+            checkpoint.to_string()
+        print(f"{name:9s} | {steps:5d} | {time.perf_counter() - start:7.3f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Repeated serialization of a Parsable whose scalars change.")
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--size", type=int, default=20000)
+    arguments = parser.parse_args()
+    run(arguments.steps, arguments.size)
@@ -0,0 +1,98 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable, io
+
+
+class Layer(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['name', 'weights'])
+        self._list_of_parsables.extend(['layers'])
+        self.name = kwargs.get('name')
+        self.weights = kwargs.get('weights')
+        self.layers = kwargs.get('layers')
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, input_value):
+        self._name = input_value
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @weights.setter
+    def weights(self, input_value):
+        self._weights = None if input_value is None else np.asarray(input_value)
+
+    @property
+    def has_layers(self):
+        return self._layers is not None
+
+    @property
+    def layers(self):
+        return self._layers
+
+    @layers.setter
+    def layers(self, input_value):
+        self._layers = input_value
+
+
+def create_tree(width: int, size: int) -> Layer:
+    """Creates a tree of `width` layers, each holding `width` layers with `size` weights."""
+    rng = np.random.default_rng(0)
+    return Layer(name="root", layers=[
+        Layer(name=f"layer{i}", weights=rng.normal(size=size),
+              layers=[Layer(name=f"layer{i}.{j}", weights=rng.normal(size=size)) for j in range(width)])
+        for i in range(width)])
+
+
+def run(width: int, size: int, repeats: int):
+    tree = create_tree(width, size)
+    print("backend | to_string | from_string | save_to_json | load_from_json")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in io.json_backends:
+            try:
+                io.set_json_backend(name)
+            except ImportError:
+                print(f"{name:7s} | not installed")
+                continue
+            timings = list()
+            start = time.perf_counter()
+            for _ in range(repeats):
+                text = tree.to_string()
+            timings.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                Layer().from_string(text)
+            timings.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                path = tree.save_to_json(Path(directory) / "tree")
+            timings.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                Layer().load_from_json(path)
+            timings.append(time.perf_counter() - start)
+            print(f"{name:7s} | {timings[0]:9.3f} | {timings[1]:11.3f} | {timings[2]:12.3f} | {timings[3]:14.3f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON encoding and decoding of a Parsable tree with each backend.")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=10)
+    arguments = parser.parse_args()
+    run(arguments.width, arguments.size, arguments.repeats)
@@ -0,0 +1,90 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+# --- internal imports ---
+from plugnparse import Parsable, io
+
+
+class Sample(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['index', 'seed', 'tags'])
+        self.index = kwargs.get('index')
+        self.seed = kwargs.get('seed')
+        self.tags = kwargs.get('tags')
+
+    @property
+    def index(self):
+        return self._index
+
+    @index.setter
+    def index(self, input_value):
+        self._index = input_value
+
+    @property
+    def seed(self):
+        return self._seed
+
+    @seed.setter
+    def seed(self, input_value):
+        self._seed = input_value
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, input_value):
+        self._tags = input_value
+
+
+def create_samples(count: int):
+    for index in range(count):
+        yield Sample(index=index, seed=index * 7919 % 104729, tags=["train", f"shard{index % 16}"])
+
+
+def run(count: int, workers: int):
+    print("method            | seconds")
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        io.write_to_json_file(Path(directory) / "samples.json", [sample.to_dict() for sample in create_samples(count)])
+        print(f"write list        | {time.perf_counter() - start:7.3f}")
+
+        start = time.perf_counter()
+        path = Sample.save_to_json_lines(Path(directory) / "samples", create_samples(count))
+        print(f"write json lines  | {time.perf_counter() - start:7.3f}")
+
+        start = time.perf_counter()
+        Sample.from_dicts(io.read_json_file(Path(directory) / "samples.json"))
+        print(f"read list         | {time.perf_counter() - start:7.3f}")
+
+        start = time.perf_counter()
+        first = next(Sample.iterate_from_json_lines(path))
+        print(f"first json line   | {time.perf_counter() - start:7.3f}")
+
+        start = time.perf_counter()
+        for _ in Sample.iterate_from_json_lines(path):
+            pass
+        print(f"read json lines   | {time.perf_counter() - start:7.3f}")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            for _ in Sample.iterate_from_json_lines(path, executor=executor, chunk_size=5000):
+                pass
+            print(f"read {workers:2d} processes | {time.perf_counter() - start:7.3f}")
+        assert first.index == 0
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming Parsables through JSON Lines versus a single JSON list.")
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=4)
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.workers)
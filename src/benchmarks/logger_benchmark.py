@@ -0,0 +1,49 @@
+# --- external imports ---
+import argparse
+import inspect
+import logging
+import time
+# --- internal imports ---
+from plugnparse import logger
+
+
+def legacy_log_and_raise(exception_type, *args):
+    """Reproduces the previous behaviour of 'logger.log_and_raise()', which captured the location with 'inspect.stack()'."""
+    raise exception_type(str(logger.error(*args, record_location=True, stack=inspect.stack()[1])))
+
+
+def measure(raise_method, iterations: int) -> float:
+    """Raises and handles `iterations` exceptions, returning the number of exceptions per second."""
+    start = time.perf_counter()
+    for index in range(iterations):
+        try:
+            raise_method(TypeError, "Invalid input type [", index, "].")
+        except TypeError:
+            pass
+    return iterations / (time.perf_counter() - start)
+
+
+def run(iterations: int):
+    # --- emit the messages to a handler that discards them, so the benchmark measures the logger itself ---
+    logging_logger = logger.get_logger(None)
+    logging_logger.addHandler(logging.NullHandler())
+    logging_logger.propagate = False
+
+    print("mode                      | exceptions/second")
+    print(f"inspect.stack (previous)  | {measure(legacy_log_and_raise, iterations):17.0f}")
+    print(f"frame capture             | {measure(logger.log_and_raise, iterations):17.0f}")
+    logger.set_location_capture(False)
+    try:
+        print(f"location capture disabled | {measure(logger.log_and_raise, iterations):17.0f}")
+    finally:
+        logger.set_location_capture(True)
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of raising errors through 'logger.log_and_raise()'.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    arguments = parser.parse_args()
+    run(arguments.iterations)
@@ -0,0 +1,41 @@
+# --- external imports ---
+import argparse
+import time
+import numpy as np
+# --- internal imports ---
+from plugnparse import equal as equal_module
+
+
+def measure(a, b, kwargs, vectorized: bool) -> float:
+    """Compares two lists, optionally disabling the vectorized comparison, and returns the elapsed seconds."""
+    min_size = equal_module.vectorized_min_size
+    equal_module.vectorized_min_size = min_size if vectorized else float('inf')
+    try:
+        start = time.perf_counter()
+        assert equal_module.equal(a, b, **kwargs)
+        return time.perf_counter() - start
+    finally:
+        equal_module.vectorized_min_size = min_size
+
+
+def run(size: int, element_wise_size: int):
+    generator = np.random.default_rng(0)
+    print("case                | size     | vectorized (s) | element-wise size | element-wise (s)")
+    for name, shape, kwargs in (('flat', (size,), {}), ('flat (atol)', (size,), {'atol': 1e-9}),
+                                ('nested (rtol)', (size // 10, 10), {'rtol': 1e-7})):
+        values = generator.normal(size=shape)
+        small_values = values.reshape(-1)[:element_wise_size].reshape((-1,) + shape[1:])
+        vectorized = measure(values.tolist(), values.tolist(), kwargs, True)
+        element_wise = measure(small_values.tolist(), small_values.tolist(), kwargs, False)
+        print(f"{name:19s} | {values.size:8d} | {vectorized:14.4f} | {small_values.size:17d} | {element_wise:16.4f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comparison of long numeric lists as arrays versus element-wise.")
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--element-wise-size", type=int, default=50000)
+    arguments = parser.parse_args()
+    run(arguments.size, arguments.element_wise_size)
@@ -0,0 +1,58 @@
+# --- external imports ---
+from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import random
+import time
+# --- internal imports ---
+from plugnparse import Plugin
+
+
+class BenchmarkPlugin(Plugin, ABC):
+    plugin_property_name = 'plugin_type'
+    plugin_module_property_name = 'plugin_module'
+
+
+def create_plugins(count: int) -> list:
+    """Defines `count` concrete plugin classes and returns their names."""
+    names = list()
+    for index in range(count):
+        name = "BenchmarkPlugin" + str(index)
+        type(name, (BenchmarkPlugin,), {'__module__': __name__})
+        names.append(name)
+    return names
+
+
+def lookup_worker(names: list, lookups: int, seed: int) -> int:
+    """Looks up and constructs random plugins, returning the number of lookups performed."""
+    generator = random.Random(seed)
+    for _ in range(lookups):
+        name = names[generator.randrange(len(names))]
+        BenchmarkPlugin.construct_from_parameters({'plugin_type': name, 'plugin_module': __name__})
+    return lookups
+
+
+def run(plugin_count: int, lookups_per_thread: int, thread_counts: list):
+    names = create_plugins(plugin_count)
+    print("plugins registered: ", len(BenchmarkPlugin.get_registry()))
+    print("threads | lookups | seconds | lookups/second")
+    for thread_count in thread_counts:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            futures = [executor.submit(lookup_worker, names, lookups_per_thread, seed)
+                       for seed in range(thread_count)]
+            total = sum(future.result() for future in futures)
+        elapsed = time.perf_counter() - start
+        print(f"{thread_count:7d} | {total:7d} | {elapsed:7.3f} | {total / elapsed:14.0f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plugin registry lookup throughput under concurrency.")
+    parser.add_argument("--plugins", type=int, default=3000)
+    parser.add_argument("--lookups", type=int, default=50000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    arguments = parser.parse_args()
+    run(arguments.plugins, arguments.lookups, arguments.threads)
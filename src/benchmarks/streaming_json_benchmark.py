@@ -0,0 +1,82 @@
+# --- external imports ---
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+# --- internal imports ---
+from plugnparse import Parsable
+
+
+class Entry(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['key', 'table'])
+        self._list_of_parsables.extend(['entries'])
+        self.key = kwargs.get('key')
+        self.table = kwargs.get('table')
+        self.entries = kwargs.get('entries')
+
+    @property
+    def key(self):
+        return self._key
+
+    @key.setter
+    def key(self, input_value):
+        self._key = input_value
+
+    @property
+    def has_table(self):
+        return self._table is not None
+
+    @property
+    def table(self):
+        return self._table
+
+    @table.setter
+    def table(self, input_value):
+        self._table = None if input_value is None else np.asarray(input_value)
+
+    @property
+    def has_entries(self):
+        return self._entries is not None
+
+    @property
+    def entries(self):
+        return self._entries
+
+    @entries.setter
+    def entries(self, input_value):
+        self._entries = input_value
+
+
+def run(count: int, size: int):
+    root = Entry(key="root", entries=[Entry(key=f"entry{index}", table=np.full(size, float(index))) for index in range(count)])
+    print("method    | seconds | peak megabytes")
+    with tempfile.TemporaryDirectory() as directory:
+        path = root.save_to_json(Path(directory) / "root")
+        del root
+        for name, streaming in (('json.load', False), ('streaming', True)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            loaded = Entry()
+            loaded.load_from_json(path, streaming=streaming)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del loaded
+            print(f"{name:9s} | {elapsed:7.3f} | {peak / 1e6:14.1f}")
+
+
+##########################################################################
+# Main Benchmark
+##########################################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak memory of loading a large JSON document with and without "
+                                                 "streaming.")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=500)
+    arguments = parser.parse_args()
+    run(arguments.count, arguments.size)
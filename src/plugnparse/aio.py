@@ -0,0 +1,132 @@
+# --- external imports ---
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+# --- local imports ---
+from . import logger
+
+default_max_workers = min(4, os.cpu_count() or 1)  # The default number of threads running blocking work
+default_max_pending = 16  # The default number of jobs that may be submitted to the executor at the same time
+
+__max_workers__ = default_max_workers
+__max_pending__ = default_max_pending
+__executor__: Optional[ThreadPoolExecutor] = None
+__executor_lock__ = threading.Lock()
+_limiters = weakref.WeakKeyDictionary()  # The semaphore bounding the pending jobs of each event loop
+
+
+##########################################################################
+# Executor Configuration
+##########################################################################
+def configure(max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+    """Configures the executor which runs the blocking work of the asynchronous API.
+
+    Notes:
+        The current executor finishes its pending jobs in the background; later jobs run on a new executor.
+
+    Args:
+        max_workers: Optional[int]
+            The number of threads running blocking work (default: 'default_max_workers').
+        max_pending: Optional[int]
+            The number of jobs that may be submitted to the executor at the same time, per event loop. Further jobs
+            wait on the event loop until a pending job completes (default: the larger of 'default_max_pending' and
+            'max_workers').
+
+    Raises:
+        ValueError:
+            If either value is less than 1, or 'max_pending' is less than 'max_workers'.
+    """
+    global __max_workers__, __max_pending__, __executor__
+    max_workers = default_max_workers if max_workers is None else max_workers
+    max_pending = max(default_max_pending, max_workers) if max_pending is None else max_pending
+    if max_workers < 1 or max_pending < max_workers:
+        logger.log_and_raise(ValueError, "Invalid executor limits [max_workers=", max_workers, ", max_pending=",
+                             max_pending, "], expected 1 <= max_workers <= max_pending.")
+    with __executor_lock__:
+        if __executor__ is not None:
+            __executor__.shutdown(wait=False)
+        __max_workers__ = max_workers
+        __max_pending__ = max_pending
+        __executor__ = None
+        _limiters.clear()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Returns the executor which runs the blocking work of the asynchronous API, creating it if needed."""
+    global __executor__
+    with __executor_lock__:
+        if __executor__ is None:
+            __executor__ = ThreadPoolExecutor(max_workers=__max_workers__, thread_name_prefix='plugnparse-aio')
+        return __executor__
+
+
+def shutdown(wait: bool = True):
+    """Shuts the executor down. A new executor is created by the next job.
+
+    Args:
+        wait: bool
+            Whether to wait for the pending jobs to complete (default: True).
+    """
+    global __executor__
+    with __executor_lock__:
+        executor, __executor__ = __executor__, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _get_limiter(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    """Returns the semaphore bounding the pending jobs of an event loop."""
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(__max_pending__)
+    return limiter
+
+
+##########################################################################
+# Running Blocking Work
+##########################################################################
+def _release(loop: asyncio.AbstractEventLoop, limiter: asyncio.Semaphore, future: Any):
+    """Releases the slot of a completed job on its event loop."""
+    try:
+        loop.call_soon_threadsafe(limiter.release)
+    except RuntimeError:
+        pass  # the event loop is closed
+
+
+async def run(function: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs a blocking function on the executor of the asynchronous API, without blocking the event loop.
+
+    Notes:
+        At most 'max_pending' jobs of an event loop are submitted to the executor at the same time (see
+        'configure()'); further calls wait on the event loop instead of queueing without bound. A slot is only freed
+        once its job completes, so cancelling the awaiting task does not let more blocking work pile up. The job runs
+        in a copy of the current context, so context variables such as 'binary.keep_arrays()' apply to it.
+
+    Args:
+        function: Callable[..., Any]
+            The blocking function.
+        *args:
+            The positional arguments of the function.
+        **kwargs:
+            The key-word arguments of the function.
+
+    Returns:
+        Any:
+            The output of the function.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _get_limiter(loop)
+    await limiter.acquire()
+    try:
+        context = contextvars.copy_context()
+        future = get_executor().submit(context.run, functools.partial(function, *args, **kwargs))
+    except BaseException:
+        limiter.release()
+        raise
+    future.add_done_callback(functools.partial(_release, loop, limiter))
+    return await asyncio.wrap_future(future)
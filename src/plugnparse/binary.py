@@ -0,0 +1,236 @@
+# --- external imports ---
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Union
+import numpy as np
+# --- local imports ---
+from . import io, logger
+
+magic = b'PNPBIN\x00\x01'  # The leading bytes of the binary container (format version 1)
+alignment = 64  # The alignment in bytes of the header end and of every array buffer
+file_suffix = '.pnb'  # The extension of binary container files
+array_key = '__plugnparse_array__'  # The key of the header placeholder which refers to an array buffer
+mmap_modes = (None, 'r', 'c', 'r+')  # The supported memory map modes when reading a binary container file
+
+_keep_arrays: ContextVar[bool] = ContextVar('plugnparse_keep_arrays', default=False)
+
+
+##########################################################################
+# Array Conversions
+##########################################################################
+@contextmanager
+def keep_arrays() -> Iterator[None]:
+    """Keeps NumPy arrays as is, instead of converting them to lists, while serializing Parsables within the context.
+
+    Examples:
+        with binary.keep_arrays():
+            output = parsable.to_dict()  # the arrays of 'output' are the arrays of 'parsable'
+    """
+    token = _keep_arrays.set(True)
+    try:
+        yield
+    finally:
+        _keep_arrays.reset(token)
+
+
+def are_arrays_kept() -> bool:
+    """Returns whether serialization currently keeps NumPy arrays (see 'keep_arrays()')."""
+    return _keep_arrays.get()
+
+
+def tolist(value: Any) -> Any:
+    """Converts a value with a 'tolist()' method, unless it is a NumPy array and arrays are being kept.
+
+    Args:
+        value: Any
+            A value with a 'tolist()' method.
+
+    Returns:
+        Any:
+            Either the value itself or the result of its 'tolist()'.
+    """
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject and _keep_arrays.get():
+        return value
+    return value.tolist()
+
+
+##########################################################################
+# Binary Container
+##########################################################################
+def _padding(offset: int) -> int:
+    """Returns the number of bytes needed to align an offset."""
+    return -offset % alignment
+
+
+def _extract_arrays(value: Any, arrays: List[np.ndarray]) -> Any:
+    """Replaces the arrays of a serialized value with placeholders, collecting the arrays in order."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return _extract_arrays(value.tolist(), arrays)
+        arrays.append(np.ascontiguousarray(value))
+        return {array_key: len(arrays) - 1}
+    if isinstance(value, dict):
+        return {key: _extract_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_extract_arrays(item, arrays) for item in value]
+    return value
+
+
+def _restore_arrays(value: Any, arrays: List[np.ndarray]) -> Any:
+    """Replaces the placeholders of a deserialized value with their arrays."""
+    if isinstance(value, dict):
+        if len(value) == 1 and array_key in value:
+            return arrays[value[array_key]]
+        return {key: _restore_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_arrays(item, arrays) for item in value]
+    return value
+
+
+def _encode_header(dictionary: dict) -> tuple:
+    """Builds the header bytes and the list of array buffers of a serialized dictionary."""
+    arrays = list()
+    data = _extract_arrays(dictionary, arrays)
+    descriptors = list()
+    offset = 0
+    for array in arrays:
+        offset += _padding(offset)
+        descriptors.append({'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset})
+        offset += array.nbytes
+    header = io.to_json_string({'arrays': descriptors, 'data': data}).encode('utf-8')
+    header += b' ' * _padding(len(magic) + 8 + len(header))
+    return magic + len(header).to_bytes(8, 'little') + header, arrays
+
+
+def _decode_header(prefix: bytes, source: Any) -> int:
+    """Parses the fixed prefix of a binary container and returns the header length."""
+    if len(prefix) < len(magic) + 8 or prefix[:len(magic)] != magic:
+        logger.log_and_raise(ValueError, "The input [", source, "] is not a binary Parsable container.")
+    return int.from_bytes(prefix[len(magic):len(magic) + 8], 'little')
+
+
+def _build_arrays(header: dict, buffer: Any) -> List[np.ndarray]:
+    """Creates the arrays described by a header as views of the buffer holding the array section."""
+    arrays = list()
+    for descriptor in header['arrays']:
+        dtype = np.dtype(descriptor['dtype'])
+        shape = tuple(descriptor['shape'])
+        count = int(np.prod(shape, dtype=np.int64))
+        array = np.frombuffer(buffer, dtype=dtype, count=count, offset=descriptor['offset'])
+        arrays.append(array.reshape(shape))
+    return arrays
+
+
+def to_bytes(dictionary: dict) -> bytes:
+    """Converts a serialized dictionary, whose arrays may be kept as NumPy arrays, to a binary container.
+
+    Notes:
+        The container holds the magic bytes, the length of the header, a JSON header and the raw array buffers. The
+        header holds the dictionary with each array replaced by a placeholder, along with the dtype, shape and offset
+        of every array. The header and every buffer are aligned to 'alignment' bytes.
+
+    Args:
+        dictionary: dict
+            The dictionary to convert (see 'keep_arrays()').
+
+    Returns:
+        bytes:
+            The binary container.
+    """
+    header, arrays = _encode_header(dictionary)
+    chunks = [header]
+    offset = 0
+    for array in arrays:
+        chunks.append(b'\x00' * _padding(offset))
+        offset += _padding(offset)
+        chunks.append(array.tobytes())
+        offset += array.nbytes
+    return b''.join(chunks)
+
+
+def from_bytes(data: Union[bytes, bytearray, memoryview]) -> dict:
+    """Converts a binary container to a dictionary holding NumPy arrays.
+
+    Args:
+        data: Union[bytes, bytearray, memoryview]
+            The binary container created by 'to_bytes()' or 'write_to_binary_file()'.
+
+    Returns:
+        dict:
+            The serialized dictionary. The arrays are views of 'data' if it is writable, otherwise copies of it.
+
+    Raises:
+        ValueError:
+            If the data is not a binary container.
+    """
+    view = memoryview(data)
+    header_length = _decode_header(bytes(view[:len(magic) + 8]), "bytes")
+    start = len(magic) + 8 + header_length
+    header = io.from_json_string(bytes(view[len(magic) + 8:start]).decode('utf-8'))
+    arrays = _build_arrays(header, view[start:])
+    if view.readonly:
+        arrays = [array.copy() for array in arrays]
+    return _restore_arrays(header['data'], arrays)
+
+
+def write_to_binary_file(file: Union[str, Path], dictionary: dict):
+    """Writes a serialized dictionary to a binary container file.
+
+    Args:
+        file: Union[str, Path]
+            The file to write to.
+        dictionary: dict
+            The dictionary to write (see 'to_bytes()').
+    """
+    header, arrays = _encode_header(dictionary)
+    with open(str(file), "wb") as f:
+        f.write(header)
+        offset = 0
+        for array in arrays:
+            f.write(b'\x00' * _padding(offset))
+            offset += _padding(offset)
+            # --- write the buffer of the array without copying it ---
+            f.write(array.reshape(-1).view(np.uint8).data)
+            offset += array.nbytes
+
+
+def read_binary_file(file: Union[str, Path], mmap_mode: Optional[str] = None) -> dict:
+    """Reads a binary container file.
+
+    Notes:
+        With a 'mmap_mode', only the header is read. The arrays are views of a memory map of the file, so their pages
+        are only read from disk when they are accessed, and processes mapping the same file share those pages.
+
+    Args:
+        file: Union[str, Path]
+            The file to read.
+        mmap_mode: Optional[str]
+            Either None to read the arrays into memory, or the 'np.memmap' mode of the arrays: 'r' for read-only
+            arrays, 'c' for copy-on-write arrays whose changes are not written to the file, or 'r+' for arrays whose
+            changes are written to the file.
+
+    Returns:
+        dict:
+            The serialized dictionary. Its arrays are views of a single buffer (or memory map) of the array section.
+
+    Raises:
+        ValueError:
+            If the file is not a binary container or the 'mmap_mode' is not supported.
+    """
+    if mmap_mode not in mmap_modes:
+        logger.log_and_raise(ValueError, "Invalid mmap mode [", mmap_mode, "], expected one of [", mmap_modes, "].")
+
+    with open(str(file), "rb") as f:
+        header_length = _decode_header(f.read(len(magic) + 8), file)
+        header = io.from_json_string(f.read(header_length).decode('utf-8'))
+        start = f.tell()
+        f.seek(0, 2)
+        size = f.tell() - start
+        if mmap_mode is None or size == 0:
+            buffer = bytearray(size)
+            f.seek(start)
+            f.readinto(buffer)
+        else:
+            buffer = np.memmap(f, dtype=np.uint8, mode=mmap_mode, offset=start, shape=(size,))
+    return _restore_arrays(header['data'], _build_arrays(header, buffer))
@@ -0,0 +1,373 @@
+# --- external imports ---
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+import copy
+import numpy as np
+# --- local imports ---
+from . import logger, properties, schema
+from .equal import equal, default_atol, default_rtol
+from .parsable import Parsable
+
+array_patch_max_fraction = 0.5  # The fraction of changed array elements above which the whole array is replaced
+operations = ('set', 'unset', 'add', 'remove', 'set_slice')
+_unchanged = object()
+
+
+class ParsableDelta(Parsable):
+    """Represents the changes which turn one Parsable tree into another (see 'diff()' and 'apply_patch()').
+
+    Notes:
+        Each change is a dictionary holding an 'op' and a 'path'. The path starts with the name of a registered
+        attribute, followed by the dict keys and list indices leading to the changed value, or by the attribute names of
+        a nested Parsable. The operations are:
+            - 'set': replaces the value at the path with 'value', given in its serialized representation.
+            - 'unset': clears the attribute at the path, i.e. its setter is called with None.
+            - 'add': inserts 'value' as a new dict member or list item at the path.
+            - 'remove': removes the dict member or list item at the path.
+            - 'set_slice': assigns 'value' to the elements ['start', 'stop') of the flattened array at the path.
+
+        A delta is itself a Parsable, so it can be sent with 'to_string()' and restored with 'from_string()'.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # --- init the parent ---
+        super().__init__(*args, **kwargs)
+        # --- update the parsable attributes ---
+        self._serializable_attributes.extend(['changes'])
+
+        # --- set the components ---
+        self.changes = kwargs.get('changes')
+
+    ##########################################################################
+    # Changes Properties
+    ##########################################################################
+    @property
+    def has_changes(self) -> bool:
+        """Returns whether the changes attribute has been assigned."""
+        return self._changes is not None
+
+    @property
+    def changes(self) -> List[dict]:
+        """Gets the changes of the delta.
+
+        Returns:
+            List[dict]:
+                The changes, in the order in which they are applied.
+
+        Raises:
+            AttributeError:
+                If the property has not been assigned yet.
+        """
+        if self._changes is None:
+            logger.log_and_raise(AttributeError, "The changes parameter has not been set.")
+        return self._changes
+
+    @changes.setter
+    def changes(self, input_value: Optional[List[dict]]):
+        """Sets the changes of the delta.
+
+        Args:
+            input_value: Optional[List[dict]]
+                Either None or the list of changes.
+
+        Raises:
+            TypeError:
+                If the provided `input_value` is not a supported type.
+        """
+        if input_value is None:
+            self._changes = None
+        elif isinstance(input_value, list):
+            for change in input_value:
+                if not (isinstance(change, dict) and change.get('op') in operations and
+                        isinstance(change.get('path'), list) and len(change['path']) > 0):
+                    logger.log_and_raise(TypeError, "Invalid change [", change, "].")
+            self._changes = input_value
+        else:
+            logger.log_and_raise(TypeError, "Invalid input type [", type(input_value), "].")
+
+    def __len__(self) -> int:
+        return len(self._changes or [])
+
+
+##########################################################################
+# Diff
+##########################################################################
+def diff(old: Parsable, new: Parsable, **kwargs) -> ParsableDelta:
+    """Computes the changes which turn one Parsable into another.
+
+    Notes:
+        Attributes are compared with 'Parsable.equals_property_name()' and 'equal()'. Nested Parsables of the same type,
+        dicts and lists are compared member by member, and arrays of the same shape and dtype element by element, so
+        that only the changed members, items and array slices are recorded.
+
+    Args:
+        old: Parsable
+            The Parsable the changes apply to.
+        new: Parsable
+            The Parsable holding the desired values. It must be of the same type as `old`.
+
+    Keyword Args:
+        rtol: float
+            The relative tolerance for numeric values
+        atol: float
+            The absolute tolerance for numeric values
+
+    Returns:
+        ParsableDelta:
+            The changes, which 'apply_patch()' applies to `old` (or to an equal Parsable).
+
+    Raises:
+        TypeError:
+            If the two Parsables are not of the same type.
+    """
+    if type(old) != type(new):
+        logger.log_and_raise(TypeError, "Unable to diff a [", type(old).__name__, "] with a [", type(new).__name__, "].")
+    changes = list()
+    _diff_parsable(old, new, [], changes, kwargs)
+    return ParsableDelta(changes=changes)
+
+
+def _diff_parsable(old: Parsable, new: Parsable, path: list, changes: List[dict], kwargs: dict):
+    """Records the changes between two Parsables of the same type."""
+    for attribute in new.get_schema().compiled_attributes:
+        attribute_path = path + [attribute.name]
+        old_value, new_value, equals = old.equals_property_name(new, attribute.name)
+        if equals:
+            continue
+        if equals is False:
+            if attribute.is_set(new):
+                changes.append({'op': 'set', 'path': attribute_path, 'value': _encode_attribute(new, attribute)})
+            else:
+                changes.append({'op': 'unset', 'path': attribute_path})
+            continue
+        if equal(old_value, new_value, **kwargs):
+            continue
+        if attribute.category in (schema.AttributeCategory.Specialized, schema.AttributeCategory.Enum):
+            changes.append({'op': 'set', 'path': attribute_path, 'value': _encode_attribute(new, attribute)})
+        else:
+            _diff_value(old_value, new_value, attribute_path, changes, kwargs)
+
+
+def _diff_value(old: Any, new: Any, path: list, changes: List[dict], kwargs: dict):
+    """Records the changes between two values which are known to differ."""
+    if type(old) != type(new):
+        changes.append({'op': 'set', 'path': path, 'value': encode_value(new)})
+    elif isinstance(new, Parsable):
+        _diff_parsable(old, new, path, changes, kwargs)
+    elif isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                changes.append({'op': 'remove', 'path': path + [key]})
+        for key, value in new.items():
+            if key not in old:
+                changes.append({'op': 'add', 'path': path + [key], 'value': encode_value(value)})
+            elif not equal(old[key], value, **kwargs):
+                _diff_value(old[key], value, path + [key], changes, kwargs)
+    elif isinstance(new, list):
+        for index in range(min(len(old), len(new))):
+            if not equal(old[index], new[index], **kwargs):
+                _diff_value(old[index], new[index], path + [index], changes, kwargs)
+        for index in reversed(range(len(new), len(old))):
+            changes.append({'op': 'remove', 'path': path + [index]})
+        for index in range(len(old), len(new)):
+            changes.append({'op': 'add', 'path': path + [index], 'value': encode_value(new[index])})
+    elif isinstance(new, np.ndarray):
+        _diff_array(old, new, path, changes, kwargs)
+    else:
+        changes.append({'op': 'set', 'path': path, 'value': encode_value(new)})
+
+
+def _diff_array(old: np.ndarray, new: np.ndarray, path: list, changes: List[dict], kwargs: dict):
+    """Records the contiguous runs of changed elements between two arrays, or the whole array if that is smaller."""
+    if old.shape != new.shape or old.dtype != new.dtype or old.dtype.hasobject or new.size == 0:
+        changes.append({'op': 'set', 'path': path, 'value': encode_value(new)})
+        return
+
+    old_flat = old.reshape(-1)
+    new_flat = new.reshape(-1)
+    rtol = kwargs.get('rtol', None)
+    atol = kwargs.get('atol', None)
+    if issubclass(new.dtype.type, np.number) and (rtol is not None or atol is not None):
+        changed = ~np.isclose(old_flat, new_flat, rtol=default_rtol if rtol is None else rtol,
+                              atol=default_atol if atol is None else atol)
+    else:
+        changed = old_flat != new_flat
+        if new.dtype.kind in 'fc':
+            changed &= ~(np.isnan(old_flat) & np.isnan(new_flat))
+
+    indices = np.flatnonzero(changed)
+    if len(indices) > array_patch_max_fraction * new.size:
+        changes.append({'op': 'set', 'path': path, 'value': encode_value(new)})
+        return
+
+    # --- split the changed indices into contiguous runs ---
+    breaks = np.flatnonzero(np.diff(indices) > 1)
+    starts = np.concatenate(([0], breaks + 1))
+    stops = np.concatenate((breaks, [len(indices) - 1]))
+    for start, stop in zip(indices[starts].tolist(), (indices[stops] + 1).tolist()):
+        changes.append({'op': 'set_slice', 'path': path, 'start': start, 'stop': stop,
+                        'value': new_flat[start:stop].tolist()})
+
+
+def _encode_attribute(instance: Parsable, attribute: schema.CompiledAttribute) -> Any:
+    """Returns the serialized representation of an attribute, as written by 'to_dict()'."""
+    output = dict()
+    attribute.encode(instance, output)
+    return output.get(attribute.name)
+
+
+def encode_value(value: Any) -> Any:
+    """Converts a value into its serialized representation.
+
+    Args:
+        value: Any
+            The value to convert. Parsables are converted with 'to_dict()', arrays with 'tolist()', enums to their name
+            and sets to lists, recursively through dicts, lists and tuples.
+
+    Returns:
+        Any:
+            The serialized representation of the value.
+    """
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {key: encode_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [encode_value(item) for item in value]
+    return value
+
+
+##########################################################################
+# Patch
+##########################################################################
+def apply_patch(target: Parsable, delta: Union[ParsableDelta, List[dict]]):
+    """Applies the changes of a delta to a Parsable.
+
+    Notes:
+        Only the changed attributes are updated, through 'Parsable.update_property()' (or the category specific update
+        method for attributes that are replaced as a whole). Nested Parsables are patched in place. Dicts, lists and
+        arrays along the path of a change are copied, modified, and then assigned to their attribute once.
+
+    Args:
+        target: Parsable
+            The Parsable to update.
+        delta: Union[ParsableDelta, List[dict]]
+            The delta computed by 'diff()', or its list of changes.
+
+    Raises:
+        AttributeError:
+            If a change refers to an attribute which is not registered.
+        ValueError:
+            If a change cannot be applied to the value at its path.
+    """
+    changes = delta.changes if isinstance(delta, ParsableDelta) else delta
+
+    by_attribute: Dict[str, List[dict]] = dict()
+    for change in changes:
+        by_attribute.setdefault(change['path'][0], []).append(change)
+
+    compiled_schema = target.get_schema()
+    for name, attribute_changes in by_attribute.items():
+        attribute = compiled_schema.get(name)
+        if attribute is None:
+            logger.log_and_raise(AttributeError, "The attribute [", name, "] is not registered for [",
+                                 type(target).__name__, "].")
+        patcher = _Patcher()
+        pending = _unchanged
+        for change in attribute_changes:
+            if len(change['path']) == 1 and change['op'] in ('set', 'unset'):
+                if pending is not _unchanged:
+                    target.update_property(pending, name)
+                    pending = _unchanged
+                if change['op'] == 'set':
+                    getattr(target, schema.updating_methods[attribute.category])(False, {name: change['value']}, name)
+                else:
+                    target.update_property(None, name)
+                continue
+
+            # --- nested Parsables are patched in place, containers are assigned once all changes are applied ---
+            value = patcher.apply(attribute.get(target) if pending is _unchanged else pending, change['path'][1:],
+                                  change)
+            if not isinstance(value, Parsable):
+                pending = value
+        if pending is not _unchanged:
+            target.update_property(pending, name)
+
+
+class _Patcher:
+    """Applies nested changes to a value, copying each dict, list and array on the path of a change only once."""
+
+    def __init__(self):
+        self._owned = set()
+
+    def own(self, value: Any) -> Any:
+        """Returns a copy of a container which this patcher may modify, or the container if it is already a copy."""
+        if id(value) in self._owned:
+            return value
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        elif isinstance(value, (dict, list)):
+            value = copy.copy(value)
+        else:
+            logger.log_and_raise(ValueError, "Unable to patch a value of type [", type(value), "].")
+        self._owned.add(id(value))
+        return value
+
+    def apply(self, value: Any, path: list, change: dict) -> Any:
+        """Applies a change to the member at a path within a value, returning the updated value."""
+        operation = change['op']
+        if not path and operation == 'set':
+            # --- the value is replaced as a whole, which may be a nested Parsable replaced by any other value ---
+            return decode_value(change['value'], value)
+        if isinstance(value, Parsable):
+            apply_patch(value, [dict(change, path=path)])
+            return value
+
+        if not path:
+            if operation == 'set_slice':
+                array = self.own(np.asarray(value) if not isinstance(value, np.ndarray) else value)
+                array.reshape(-1)[change['start']:change['stop']] = change['value']
+                return array
+            logger.log_and_raise(ValueError, "Unable to apply [", operation, "] without a member to apply it to.")
+
+        key = path[0]
+        container = self.own(value)
+        if len(path) > 1 or operation in ('set', 'set_slice'):
+            container[key] = self.apply(container[key], path[1:], change)
+        elif operation == 'remove':
+            del container[key]
+        elif operation == 'add' and isinstance(container, list):
+            container.insert(key, decode_value(change['value']))
+        elif operation == 'add':
+            container[key] = decode_value(change['value'])
+        else:
+            logger.log_and_raise(ValueError, "Unable to apply [", operation, "] to the member [", key, "].")
+        return container
+
+
+def decode_value(value: Any, current: Any = None) -> Any:
+    """Converts a serialized value back into an object, matching the type of the value it replaces.
+
+    Args:
+        value: Any
+            The serialized value.
+        current: Any
+            The optional value which is replaced, whose type guides the conversion of arrays and enums.
+
+    Returns:
+        Any:
+            The deserialized value. Dictionaries holding the key defined at
+            'plugnparse.properties.generic_parsable_type' are parsed into Parsables.
+    """
+    if isinstance(value, dict) and properties.generic_parsable_type in value:
+        return properties.parse(value, throw_if_unable_to_parse=True)
+    if isinstance(current, np.ndarray) and isinstance(value, list):
+        return np.asarray(value, dtype=current.dtype)
+    if isinstance(current, Enum) and isinstance(value, str):
+        return type(current)[value]
+    return value
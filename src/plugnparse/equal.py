@@ -1,9 +1,16 @@
 # --- external imports ---
 from __future__ import annotations
-from typing import Any, List, Tuple, Union
+from bisect import bisect_left, bisect_right
+from enum import Enum
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 from .numerics import RealNumericType
+import math
 import numpy as np
 
+default_rtol = 1e-05  # The relative tolerance used by 'np.allclose()' when only `atol` is provided
+default_atol = 1e-08  # The absolute tolerance used by 'np.allclose()' when only `rtol` is provided
+vectorized_min_size = 16  # The minimum length of a numeric list or tuple compared as a single array
+
 
 def equal(a: Any, b: Any, **kwargs) -> bool:
     """Checks if two objects are equal, using special logic depending on the type.
@@ -77,11 +84,23 @@ def real_numerics_equal(a: RealNumericType, b: RealNumericType, **kwargs) -> boo
 def iterables_equal(a: Union[List, Tuple], b: Union[List, Tuple], **kwargs) -> bool:
     """Checks if two iterables are equal.
 
+    Notes:
+        Long, rectangular (possibly nested) sequences of real numbers, such as the output of 'np.ndarray.tolist()',
+        are compared in a single vectorized operation, with the same tolerances as 'real_numerics_equal()'. Only
+        sequences whose items are all floats, or all integers fitting in 64 bits, are vectorized, so that no item is
+        rounded by the conversion to an array.
+
     Args:
         a: Union[List, Tuple]
         b: Union[List, Tuple]
             The two iterables to compare.
 
+    Keyword Args:
+        rtol: float
+            The relative tolerance for numeric values
+        atol: float
+            The absolute tolerance for numeric values
+
     Returns:
         bool:
             If the two iterables are equal.
@@ -89,6 +108,17 @@ def iterables_equal(a: Union[List, Tuple], b: Union[List, Tuple], **kwargs) -> b
     if len(a) != len(b):
         return False
 
+    if len(a) >= vectorized_min_size:
+        layout = _numeric_layout(a, b)
+        if layout is not None:
+            shape, kind = layout
+            a_array = np.asarray(a)
+            b_array = np.asarray(b)
+            # --- integers beyond 64 bits are converted to object (or unsigned) arrays, which are not vectorized ---
+            if a_array.shape == shape and b_array.shape == shape and \
+                    a_array.dtype.kind == kind and b_array.dtype.kind == kind:
+                return _numeric_arrays_equal(a_array, b_array, **kwargs)
+
     for a_item, b_item in zip(a, b):
         if not equal(a_item, b_item, **kwargs):
             return False
@@ -96,6 +126,62 @@ def iterables_equal(a: Union[List, Tuple], b: Union[List, Tuple], **kwargs) -> b
     return True
 
 
+def _number_kind(item: Any) -> Optional[str]:
+    """Gets the NumPy dtype kind that a number converts to without rounding, or None for any other item."""
+    if isinstance(item, (float, np.floating)):
+        return 'f'
+    if isinstance(item, (int, np.integer, np.bool_)):
+        return 'i'
+    return None
+
+
+def _numeric_layout(a: Union[List, Tuple], b: Union[List, Tuple]) -> Optional[Tuple[Tuple[int, ...], str]]:
+    """Gets the shape and the item kind of two rectangular sequences of real numbers which all have the same kind.
+
+    Args:
+        a: Union[List, Tuple]
+        b: Union[List, Tuple]
+            The two sequences, which are expected to have the same length.
+
+    Returns:
+        Optional[Tuple[Tuple[int, ...], str]]:
+            The shape of the sequences and the dtype kind of their items ('f' for floats, 'i' for integers), or None if
+            they hold any other item, mix floats and integers, are ragged, or nest different types.
+    """
+    if len(a) == 0 or len(a) != len(b):
+        return None
+
+    kind = _number_kind(a[0])
+    if kind is not None:
+        if all(_number_kind(item) == kind for item in a) and all(_number_kind(item) == kind for item in b):
+            return (len(a),), kind
+        return None
+
+    sequence_type = type(a[0])
+    if not issubclass(sequence_type, (list, tuple)):
+        return None
+    inner_layout = None
+    for a_item, b_item in zip(a, b):
+        if type(a_item) is not sequence_type or type(b_item) is not sequence_type:
+            return None
+        layout = _numeric_layout(a_item, b_item)
+        if layout is None or (inner_layout is not None and layout != inner_layout):
+            return None
+        inner_layout = layout
+    return (len(a),) + inner_layout[0], inner_layout[1]
+
+
+def _numeric_arrays_equal(a: np.ndarray, b: np.ndarray, **kwargs) -> bool:
+    """Checks if two numeric arrays are equal element-wise, with the semantics of 'real_numerics_equal()'."""
+    rtol = kwargs.get('rtol', None)
+    atol = kwargs.get('atol', None)
+    if rtol is None and atol is None:
+        return bool(np.array_equal(a, b))
+
+    return bool(np.allclose(a, b, rtol=default_rtol if rtol is None else rtol,
+                            atol=default_atol if atol is None else atol))
+
+
 def numpy_arrays_equal(a: np.ndarray, b: np.ndarray, **kwargs) -> bool:
     """Checks if two real numeric types are equal.
 
@@ -142,11 +228,24 @@ def numpy_arrays_equal(a: np.ndarray, b: np.ndarray, **kwargs) -> bool:
 def sets_equal(a: Union[set, frozenset], b: Union[set, frozenset], **kwargs) -> bool:
     """Checks if two sets are equal.
 
+    Notes:
+        Every item of `a` must be equal to an item of `b`. Instead of comparing every pair of items, the items of `b`
+        are indexed by a canonical key that equal items share (see '_canonical_key()'), so only the items within the
+        same bucket are compared with 'equal()'. When a tolerance is provided, finite real numbers are sorted and only
+        compared with the numbers within the tolerance window. Items without a canonical key are only compared with the
+        items of `b` with the same type.
+
     Args:
         a: Union[set, frozenset]
         b: Union[set, frozenset]
             The two sets to compare.
 
+    Keyword Args:
+        rtol: float
+            The relative tolerance for numeric values
+        atol: float
+            The absolute tolerance for numeric values
+
     Returns:
         bool:
             If the two sets are equal.
@@ -154,22 +253,121 @@ def sets_equal(a: Union[set, frozenset], b: Union[set, frozenset], **kwargs) ->
     if len(a) != len(b):
         return False
 
+    index = _SetIndex(b, **kwargs)
     for a_item in a:
-        found = False
-        for b_item in b:
-            if equal(a_item, b_item, **kwargs):
-                found = True
-                break
-
-        if not found:
+        if not index.contains(a_item):
             return False
 
     return True
 
 
+def _is_real_numeric(item: Any) -> bool:
+    """Returns whether an item is compared as a real number by 'equal()'."""
+    return isinstance(item, (int, float, np.number)) and not isinstance(item, np.complexfloating)
+
+
+def _canonical_key(item: Any, tolerant: bool) -> Optional[Hashable]:
+    """Gets a hashable key which every item that is equal to `item` shares.
+
+    Args:
+        item: Any
+            The item to get the key of.
+        tolerant: bool
+            Whether the items are compared with a numeric tolerance.
+
+    Returns:
+        Optional[Hashable]:
+            The key, or None if the equality of the item cannot be decided by hashing (e.g. numbers compared with a
+            tolerance, objects with an 'equals()' method, or unhashable objects).
+    """
+    if isinstance(item, (str, bytes)) or item is None:
+        return item
+    if isinstance(item, (int, float, np.number)):
+        return None if tolerant else item
+    if isinstance(item, (tuple, frozenset)):
+        keys = [_canonical_key(element, tolerant) for element in item]
+        if any(key is None and element is not None for key, element in zip(keys, item)):
+            return None
+        return type(item), (tuple(keys) if isinstance(item, tuple) else frozenset(keys))
+    if isinstance(item, Enum) and not hasattr(item, 'equals'):
+        return item
+    return None
+
+
+class _SetIndex:
+    """Represents the items of a set indexed for finding an equal item without comparing every item."""
+
+    def __init__(self, items: Union[set, frozenset], **kwargs):
+        self.kwargs = kwargs
+        self.tolerant = kwargs.get('rtol', None) is not None or kwargs.get('atol', None) is not None
+        self.buckets: Dict[Hashable, List[Any]] = dict()
+        self.by_type: Dict[type, List[Any]] = dict()
+        self.numbers: List[Tuple[float, Any]] = list()
+        self.other_numbers: List[Any] = list()
+
+        for item in items:
+            if self.tolerant and isinstance(item, (int, float, np.number)):
+                value = _finite_float(item)
+                if value is None:
+                    self.other_numbers.append(item)
+                else:
+                    self.numbers.append((value, item))
+                continue
+            key = _canonical_key(item, self.tolerant)
+            if key is not None:
+                self.buckets.setdefault(key, []).append(item)
+            else:
+                self.by_type.setdefault(type(item), []).append(item)
+
+        self.numbers.sort(key=lambda entry: entry[0])
+        self.number_values = [entry[0] for entry in self.numbers]
+
+    def contains(self, item: Any) -> bool:
+        """Returns whether an item equal to the provided item is indexed."""
+        if self.tolerant and isinstance(item, (int, float, np.number)):
+            return any(equal(item, candidate, **self.kwargs) for candidate in self.number_candidates(item))
+
+        key = _canonical_key(item, self.tolerant)
+        if key is not None:
+            return any(equal(item, candidate, **self.kwargs) for candidate in self.buckets.get(key, []))
+        return any(equal(item, candidate, **self.kwargs) for candidate in self.by_type.get(type(item), []))
+
+    def number_candidates(self, item: Any) -> List[Any]:
+        """Gets the indexed numbers which may be within the tolerance of the provided number."""
+        rtol = self.kwargs.get('rtol', None)
+        atol = self.kwargs.get('atol', None)
+        rtol = default_rtol if rtol is None else rtol
+        atol = default_atol if atol is None else atol
+
+        value = _finite_float(item)
+        if value is None or not _is_real_numeric(item) or rtol >= 1:
+            return [entry[1] for entry in self.numbers] + self.other_numbers
+
+        # --- |a - b| <= atol + rtol * |b| and |b| <= |a| + |a - b| bound the distance to the candidates ---
+        distance = (abs(atol) + abs(rtol) * abs(value)) / (1 - abs(rtol))
+        distance = distance * (1 + 1e-9) + 1e-300
+        start = bisect_left(self.number_values, value - distance)
+        stop = bisect_right(self.number_values, value + distance)
+        return [entry[1] for entry in self.numbers[start:stop]] + self.other_numbers
+
+
+def _finite_float(item: Any) -> Optional[float]:
+    """Converts a real number into a finite float, or returns None if it is complex, infinite, NaN or too large."""
+    if not _is_real_numeric(item):
+        return None
+    try:
+        value = float(item)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
 def dicts_equal(a: dict, b: dict, **kwargs) -> bool:
     """Checks if two dicts are equal.
 
+    Notes:
+        The keys must match exactly, so each key is looked up directly in `b`. The tolerances only apply to the values.
+
     Args:
         a: dict
         b: dict
@@ -179,14 +377,11 @@ def dicts_equal(a: dict, b: dict, **kwargs) -> bool:
         bool:
             If the two dicts are equal.
     """
-    a_keys = set(a.keys())
-    b_keys = set(b.keys())
-
-    if not sets_equal(a_keys, b_keys, **kwargs):
+    if len(a) != len(b):
         return False
 
     for key, a_item in a.items():
-        if key not in b_keys:
+        if key not in b:
             return False
 
         b_item = b[key]
@@ -0,0 +1,164 @@
+# --- external imports ---
+from enum import Enum
+from typing import Any, List, Tuple
+import hashlib
+import math
+import numpy as np
+
+digest_size = 16  # The size in bytes of the fingerprint digests
+
+
+class FingerprintBuilder:
+    """Represents a streaming hash over values, encoded such that values which are 'equal()' hash identically.
+
+    Notes:
+        Every value is written with a type tag followed by a canonical encoding of its content:
+            - Real numbers are written by value, so 1, 1.0 and np.int64(1) share an encoding (NaN has its own tag).
+            - Lists, tuples, strings and bytes are written in order; dicts and sets are written as the sorted digests of
+              their entries, so their iteration order does not matter.
+            - NumPy arrays are written from their raw buffers (with -0.0 and NaN normalized), along with their dtype and
+              shape. Arrays of objects are written item by item.
+            - Parsable objects are written as their own (cached) fingerprints and are collected as children.
+        Values of any other type are written from their 'repr()' and mark the fingerprint as inexact, i.e. it can be
+        used as a cache key but not to decide that two objects are different.
+    """
+    __slots__ = ('_hasher', 'exact', 'children')
+
+    def __init__(self):
+        self._hasher = hashlib.blake2b(digest_size=digest_size)
+        self.exact = True
+        self.children: List[Tuple[Any, bytes]] = list()
+
+    def digest(self) -> bytes:
+        """Returns the digest of the values written so far."""
+        return self._hasher.digest()
+
+    def write(self, data: bytes):
+        """Writes raw bytes to the hash."""
+        self._hasher.update(data)
+
+    def write_text(self, text: str):
+        """Writes a length-prefixed string to the hash."""
+        data = text.encode('utf-8', errors='surrogatepass')
+        self._hasher.update(len(data).to_bytes(8, 'little') + data)
+
+    def update(self, value: Any):
+        """Writes a value to the hash.
+
+        Args:
+            value: Any
+                The value to write.
+        """
+        if value is None:
+            self.write(b'N')
+        elif isinstance(value, np.bool_):
+            self.write(b'Y' if value else b'y')
+        elif isinstance(value, (bool, int, float, np.number)):
+            self._update_number(value)
+        elif isinstance(value, str):
+            self.write(b'S')
+            self.write_text(value)
+        elif isinstance(value, bytes):
+            self.write(b'B' + len(value).to_bytes(8, 'little') + value)
+        elif isinstance(value, (list, tuple)):
+            self._update_type(value, {list: b'L', tuple: b'T'})
+            self.write(len(value).to_bytes(8, 'little'))
+            for item in value:
+                self.update(item)
+        elif isinstance(value, dict):
+            self._update_type(value, {dict: b'D'})
+            self._update_unordered([(key, item) for key, item in value.items()])
+        elif isinstance(value, (set, frozenset)):
+            self._update_type(value, {set: b'E', frozenset: b'Z'})
+            self._update_unordered(list(value))
+        elif isinstance(value, np.ndarray):
+            self._update_array(value)
+        elif isinstance(value, Enum):
+            self.write(b'M')
+            self.write_text(type(value).__module__ + "." + type(value).__qualname__ + "." + value.name)
+        elif callable(getattr(value, 'fingerprint_digest', None)):
+            digest = value.fingerprint_digest()
+            self.exact = self.exact and value.fingerprint_is_exact()
+            self.children.append((value, digest))
+            self.write(b'P' + digest)
+        else:
+            self.exact = False
+            self.write(b'O')
+            self.write_text(type(value).__module__ + "." + type(value).__qualname__ + ":" + repr(value))
+
+    def _update_type(self, value: Any, tags: dict):
+        """Writes the tag of a container type, or the qualified name of a subclass of the container."""
+        tag = tags.get(type(value))
+        if tag is None:
+            self.write(b'Q')
+            self.write_text(type(value).__module__ + "." + type(value).__qualname__)
+        else:
+            self.write(tag)
+
+    def _update_number(self, value: Any):
+        """Writes a number by its value, regardless of its Python or NumPy type."""
+        if isinstance(value, (complex, np.complexfloating)):
+            self.write(b'C')
+            self._update_number(float(value.real))
+            self._update_number(float(value.imag))
+        elif isinstance(value, (int, np.integer)):
+            self.write(b'I')
+            self.write_text(str(int(value)))
+        elif math.isnan(value):
+            self.write(b'n')
+        elif math.isfinite(value) and float(value).is_integer():
+            self.write(b'I')
+            self.write_text(str(int(value)))
+        else:
+            self.write(b'F')
+            self.write_text(float(value).hex())
+
+    def _update_unordered(self, items: list):
+        """Writes a collection of items whose order does not matter."""
+        digests = list()
+        for item in items:
+            builder = FingerprintBuilder()
+            builder.update(item)
+            self.exact = self.exact and builder.exact
+            self.children.extend(builder.children)
+            digests.append(builder.digest())
+        self.write(len(digests).to_bytes(8, 'little'))
+        for digest in sorted(digests):
+            self.write(digest)
+
+    def _update_array(self, value: np.ndarray):
+        """Writes an array by its dtype, its shape and its raw buffer."""
+        self._update_type(value, {np.ndarray: b'A'})
+        self.write_text(value.dtype.str)
+        self.write(len(value.shape).to_bytes(8, 'little'))
+        for dimension in value.shape:
+            self.write(int(dimension).to_bytes(8, 'little'))
+
+        if value.dtype.hasobject:
+            for item in value.flat:
+                self.update(item)
+            return
+
+        if value.dtype.kind in 'fc':
+            # --- -0.0 and 0.0 are equal, as are all NaN payloads ---
+            value = value + value.dtype.type(0)
+            nan_mask = np.isnan(value)
+            if nan_mask.any():
+                value[nan_mask] = np.nan
+        self.write(np.ascontiguousarray(value).tobytes())
+
+
+def fingerprint_value(value: Any) -> FingerprintBuilder:
+    """Creates a fingerprint builder holding the hash of a single value.
+
+    Args:
+        value: Any
+            The value to hash.
+
+    Returns:
+        FingerprintBuilder:
+            The builder, whose 'digest()' is the fingerprint of the value.
+    """
+    builder = FingerprintBuilder()
+    builder.update(value)
+    return builder
@@ -1,11 +1,19 @@
 # --- external imports ---
 import os
 import tempfile
-from typing import Union, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 from distutils.dir_util import copy_tree
+import fnmatch
+import heapq
+import importlib
 import json
+import math
+import threading
+# --- local imports ---
+from . import logger
 
 
 ##########################################################################
@@ -84,6 +92,105 @@ def get_temporary_directory() -> Path:
     return Path(tempfile.gettempdir())
 
 
+def iterate_directory_entries(directory: Union[str, Path], pattern: Optional[str] = None, recursive: bool = False,
+                              files: bool = True, directories: bool = True) -> Iterator[os.DirEntry]:
+    """Iterates over the entries of a directory with 'os.scandir()'.
+
+    Notes:
+        The type of an entry usually comes from the directory listing itself, so filtering files from directories
+        does not stat them, and the stat result of an entry is cached by 'DirEntry.stat()'. Recursion does not follow
+        symbolic links to directories, so it cannot loop.
+
+    Args:
+        directory: Union[str, Path]
+            The path to the directory.
+        pattern: Optional[str]
+            The optional glob pattern (e.g. 'run_*') which the names of the entries must match.
+        recursive: bool
+            Whether to include the entries of all subdirectories (default: False).
+        files: bool
+            Whether to include the entries which are not directories (default: True).
+        directories: bool
+            Whether to include the entries which are directories (default: True).
+
+    Yields:
+        os.DirEntry:
+            The matching entries, in the arbitrary order of the directory listings.
+    """
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir()
+                if recursive and is_dir and not entry.is_symlink():
+                    pending.append(entry.path)
+                if (directories if is_dir else files) and (pattern is None or fnmatch.fnmatchcase(entry.name, pattern)):
+                    yield entry
+
+
+def scan_directory(directory: Union[str, Path], pattern: Optional[str] = None, recursive: bool = False,
+                   files: bool = True, directories: bool = True) -> List[Path]:
+    """Lists the entries of a directory (see 'iterate_directory_entries()').
+
+    Args:
+        directory: Union[str, Path]
+            The path to the directory.
+        pattern: Optional[str]
+            The optional glob pattern which the names of the entries must match.
+        recursive: bool
+            Whether to include the entries of all subdirectories (default: False).
+        files: bool
+            Whether to include the entries which are not directories (default: True).
+        directories: bool
+            Whether to include the entries which are directories (default: True).
+
+    Returns:
+        List[Path]:
+            The paths of the matching entries, sorted by path.
+    """
+    return sorted(Path(entry.path) for entry in iterate_directory_entries(directory, pattern, recursive, files,
+                                                                        directories))
+
+
+def get_most_recent_entries(directory: Union[str, Path], count: int, pattern: Optional[str] = None,
+                            recursive: bool = False, files: bool = False, directories: bool = True,
+                            time_attribute: str = 'st_ctime') -> List[Path]:
+    """Gets the most recent entries of a directory, stating each matching entry once.
+
+    Notes:
+        Only the 'count' most recent entries are kept while scanning ('heapq.nlargest()'), rather than sorting all of
+        them. Entries removed while scanning are skipped.
+
+    Args:
+        directory: Union[str, Path]
+            The path to the directory.
+        count: int
+            The number of entries to return.
+        pattern: Optional[str]
+            The optional glob pattern which the names of the entries must match.
+        recursive: bool
+            Whether to include the entries of all subdirectories (default: False).
+        files: bool
+            Whether to include the entries which are not directories (default: False).
+        directories: bool
+            Whether to include the entries which are directories (default: True).
+        time_attribute: str
+            The 'os.stat_result' attribute by which entries are ordered (default: 'st_ctime').
+
+    Returns:
+        List[Path]:
+            At most 'count' paths, from the most recent to the least recent.
+    """
+    def timed_entries():
+        for entry in iterate_directory_entries(directory, pattern, recursive, files, directories):
+            try:
+                yield getattr(entry.stat(), time_attribute), entry.path
+            except FileNotFoundError:
+                continue
+
+    return [Path(path) for _, path in heapq.nlargest(count, timed_entries())]
+
+
 def get_all_subdirectories_of_directory(directory: Union[str, Path]) -> List[Path]:
     """Gets all subdirectories of a directory.
 
@@ -93,14 +200,9 @@ def get_all_subdirectories_of_directory(directory: Union[str, Path]) -> List[Pat
 
     Returns:
         List[Path]:
-            The list of all subdirectories of a directory.
+            The list of all subdirectories of a directory, sorted by path.
     """
-    result = []
-    for file in os.listdir(directory):
-        joined_file = os.path.join(directory, file)
-        if is_directory:
-            result.append(Path(joined_file))
-    return result
+    return scan_directory(directory, files=False)
 
 
 def get_most_recently_created_subdirectory(parent_directory: Union[str, Path]) -> Path:
@@ -113,10 +215,15 @@ def get_most_recently_created_subdirectory(parent_directory: Union[str, Path]) -
     Returns:
         Path:
             The path to the most recently created subdirectory.
+
+    Raises:
+        ValueError:
+            If the parent directory has no subdirectory.
     """
-    all_subdirectories = get_all_subdirectories_of_directory(parent_directory)
-    latest_directory = max(all_subdirectories, key=os.path.getctime)
-    return latest_directory
+    latest_directories = get_most_recent_entries(parent_directory, 1)
+    if not latest_directories:
+        logger.log_and_raise(ValueError, "The directory [", parent_directory, "] has no subdirectory.")
+    return latest_directories[0]
 
 
 def copy_directory_contents_to(original_directory: Union[str, Path], destination_directory: Union[str, Path]):
@@ -150,12 +257,350 @@ def get_date_time_string(formatting: str = "%Y_%m_%d-%H_%M_%S"):
     return now.strftime(formatting)
 
 
+##########################################################################
+# JSON Backends
+##########################################################################
+def _to_serializable(value: Any) -> Any:
+    """Converts the values which JSON encoders do not support natively, e.g. NumPy arrays and scalars."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError("Object of type [" + type(value).__name__ + "] is not JSON serializable")
+
+
+def _is_finite(value: Any) -> bool:
+    """Returns whether a value to encode holds no NaN or infinite floats, including within NumPy arrays."""
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return False
+        elif isinstance(item, dict):
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif getattr(item, 'dtype', None) is not None:
+            if item.dtype.kind in 'fc':
+                import numpy
+                if not numpy.isfinite(item).all():
+                    return False
+            elif item.dtype.kind == 'O':
+                pending.extend(item.tolist() if item.ndim else [item.tolist()])
+    return True
+
+
+class JsonBackend:
+    """Represents the implementation of the JSON encoding and decoding used by the io functions.
+
+    Notes:
+        The base backend uses the standard library 'json' module, and converts NumPy arrays and scalars with their
+        'tolist()' method. Subclasses implement faster encoders and fall back to this backend for the keyword arguments
+        (or values) which they do not support, so every backend accepts the keyword arguments of 'json.dumps()' and
+        'json.loads()'.
+    """
+    name = 'json'  # The name the backend is selected with
+    handles_arrays = False  # Whether NumPy arrays are encoded natively, i.e. faster than converting them to lists
+    item_separator = ', '  # The separator between the items of an object encoded without keyword arguments
+    key_separator = ': '  # The separator between the keys and values of an object encoded without keyword arguments
+
+    def supports(self, kwargs: dict) -> bool:
+        """Returns whether the backend encodes with the provided keyword arguments without falling back."""
+        return True
+
+    def dumps(self, value: Any, **kwargs) -> str:
+        """Encodes a value to a JSON string with the keyword arguments of 'json.dumps()'."""
+        if 'cls' not in kwargs:
+            kwargs.setdefault('default', _to_serializable)
+        return json.dumps(value, **kwargs)
+
+    def dumpb(self, value: Any, **kwargs) -> bytes:
+        """Encodes a value to UTF-8 JSON bytes with the keyword arguments of 'json.dumps()'."""
+        return JsonBackend.dumps(self, value, **kwargs).encode('utf-8')
+
+    def loads(self, data: Union[str, bytes], **kwargs) -> Any:
+        """Decodes a JSON string or UTF-8 bytes with the keyword arguments of 'json.loads()'."""
+        return json.loads(data, **kwargs)
+
+    def __repr__(self) -> str:
+        return "JsonBackend(" + self.name + ")"
+
+
+class OrjsonBackend(JsonBackend):
+    """Represents a JSON backend using 'orjson', which encodes NumPy arrays natively.
+
+    Notes:
+        Only the 'indent' (of 2) and 'sort_keys' keyword arguments are supported when encoding, and no keyword
+        arguments are supported when decoding. Other keyword arguments, values that orjson cannot encode (e.g. integers
+        wider than 64 bits) and documents that it cannot decode (e.g. holding 'NaN' literals) fall back to the standard
+        library. orjson encodes NaN and infinite floats as null, so values holding them are encoded by the standard
+        library as well: the value is only scanned for them when the encoded document holds a null. Unlike the standard library, orjson writes
+        compact separators. The backend is preferred when orjson is installed, select 'set_json_backend('json')' to
+        write the formatting of the standard library.
+    """
+    name = 'orjson'
+    handles_arrays = True
+    item_separator = ','
+    key_separator = ':'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def _options(self, kwargs: dict) -> Optional[int]:
+        """Translates 'json.dumps()' keyword arguments to orjson options, or returns None if they are unsupported."""
+        options = self._orjson.OPT_SERIALIZE_NUMPY | self._orjson.OPT_NON_STR_KEYS
+        for key, value in kwargs.items():
+            if key == 'indent' and value in (None, 2):
+                options |= 0 if value is None else self._orjson.OPT_INDENT_2
+            elif key == 'sort_keys':
+                options |= self._orjson.OPT_SORT_KEYS if value else 0
+            else:
+                return None
+        return options
+
+    def supports(self, kwargs: dict) -> bool:
+        return self._options(kwargs) is not None
+
+    def _encode(self, value: Any, kwargs: dict) -> Optional[bytes]:
+        """Encodes a value with orjson, or returns None if the standard library must encode it instead."""
+        options = self._options(kwargs)
+        if options is None:
+            return None
+        try:
+            data = self._orjson.dumps(value, default=_to_serializable, option=options)
+        except TypeError:
+            return None
+        if b'null' in data and not _is_finite(value):
+            return None
+        return data
+
+    def dumps(self, value: Any, **kwargs) -> str:
+        data = self._encode(value, kwargs)
+        if data is not None:
+            return data.decode('utf-8')
+        return super().dumps(value, **kwargs)
+
+    def dumpb(self, value: Any, **kwargs) -> bytes:
+        data = self._encode(value, kwargs)
+        if data is not None:
+            return data
+        return super().dumpb(value, **kwargs)
+
+    def loads(self, data: Union[str, bytes], **kwargs) -> Any:
+        if not kwargs:
+            try:
+                return self._orjson.loads(data)
+            except self._orjson.JSONDecodeError:
+                pass
+        return super().loads(data, **kwargs)
+
+
+# --- the available JSON backends in order of preference ---
+json_backends: Dict[str, Callable[[], JsonBackend]] = {'orjson': OrjsonBackend, 'json': JsonBackend}
+
+__json_backend__: Optional[JsonBackend] = None
+__json_backend_lock__ = threading.Lock()
+
+
+def register_json_backend(name: str, factory: Callable[[], JsonBackend], preferred: bool = False):
+    """Registers a JSON backend which can then be selected with 'set_json_backend()'.
+
+    Args:
+        name: str
+            The name of the backend.
+        factory: Callable[[], JsonBackend]
+            The callable creating the backend. It should raise an ImportError if its dependencies are not installed.
+        preferred: bool
+            Whether the backend is preferred over the registered backends when selecting one automatically.
+    """
+    global json_backends
+    if preferred:
+        json_backends = {name: factory, **{key: value for key, value in json_backends.items() if key != name}}
+    else:
+        json_backends[name] = factory
+
+
+def set_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Selects the JSON backend used to read and write JSON.
+
+    Args:
+        name: Optional[str]
+            The name of the backend (e.g. 'orjson' or 'json'). If not provided, the most preferred backend whose
+            dependencies are installed is selected.
+
+    Returns:
+        JsonBackend:
+            The selected backend.
+
+    Raises:
+        ValueError:
+            If no backend is registered with the provided name.
+        ImportError:
+            If the dependencies of the requested backend are not installed.
+    """
+    global __json_backend__
+    if name is not None and name not in json_backends:
+        logger.log_and_raise(ValueError, "Unknown JSON backend [", name, "], expected one of [",
+                             list(json_backends), "].")
+
+    backend = None
+    for key, factory in json_backends.items():
+        if name is not None and key != name:
+            continue
+        try:
+            backend = factory()
+            break
+        except ImportError as error:
+            if name is not None:
+                logger.log_and_raise(ImportError, "Unable to use the JSON backend [", name, "]: [", error, "].")
+    if backend is None:
+        backend = JsonBackend()
+    with __json_backend_lock__:
+        __json_backend__ = backend
+    return backend
+
+
+def get_json_backend() -> JsonBackend:
+    """Returns the selected JSON backend, selecting the most preferred installed backend on first use."""
+    backend = __json_backend__
+    if backend is None:
+        backend = set_json_backend()
+    return backend
+
+
+##########################################################################
+# Compression
+##########################################################################
+class CompressionFormat:
+    """Represents a compression format of files, which is selected by the extension of the files.
+
+    Notes:
+        The format is implemented by the first importable module of 'module_names'. Each of them provides the
+        'open(file, mode, **kwargs)' and 'compress(data, **kwargs)' functions of the standard library 'gzip' module.
+        The 'write_options' (e.g. the compression level) are passed to both when compressing.
+    """
+    __slots__ = ('name', 'module_names', 'write_options', '_module')
+
+    def __init__(self, name: str, module_names: Tuple[str, ...], write_options: Optional[dict] = None):
+        self.name = name
+        self.module_names = module_names
+        self.write_options = write_options or dict()
+        self._module = None
+
+    def _load(self) -> Any:
+        """Imports the module implementing the format, returning None if none of them is installed."""
+        if self._module is None:
+            for module_name in self.module_names:
+                try:
+                    self._module = importlib.import_module(module_name)
+                    break
+                except ImportError:
+                    continue
+        return self._module
+
+    @property
+    def module(self) -> Any:
+        """Gets the module implementing the format.
+
+        Raises:
+            ImportError:
+                If none of the modules implementing the format is installed.
+        """
+        module = self._load()
+        if module is None:
+            logger.log_and_raise(ImportError, "The [", self.name, "] compression requires one of the modules [",
+                                 list(self.module_names), "].")
+        return module
+
+    def is_available(self) -> bool:
+        """Returns whether a module implementing the format is installed."""
+        return self._load() is not None
+
+    def open(self, file: Union[str, Path], mode: str = "rb", **kwargs) -> Any:
+        """Opens a compressed file, which is decompressed (or compressed) in a streaming fashion."""
+        if "r" not in mode:
+            kwargs = {**self.write_options, **kwargs}
+        return self.module.open(str(file), mode, **kwargs)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses data to the content of a compressed file."""
+        return self.module.compress(data, **self.write_options)
+
+    def __repr__(self) -> str:
+        return "CompressionFormat(" + self.name + ")"
+
+
+# --- the compression formats by file extension ---
+compression_formats: Dict[str, CompressionFormat] = {
+    '.gz': CompressionFormat('gzip', ('gzip',), {'compresslevel': 6}),
+    '.bz2': CompressionFormat('bz2', ('bz2',)),
+    '.xz': CompressionFormat('lzma', ('lzma',)),
+    '.lzma': CompressionFormat('lzma', ('lzma',)),
+    '.zst': CompressionFormat('zstd', ('compression.zstd', 'zstandard')),
+}
+
+
+def get_compression(file: Union[str, Path]) -> Optional[CompressionFormat]:
+    """Returns the compression format of a file from its extension, or None if the file is not compressed."""
+    return compression_formats.get(to_path(file).suffix.lower())
+
+
+def open_file(file: Union[str, Path], mode: str = "rb", **kwargs) -> Any:
+    """Opens a file, transparently decompressing (or compressing) it if its extension is a compression format.
+
+    Args:
+        file: Union[str, Path]
+            The file to open.
+        mode: str
+            The mode of the file, e.g. 'rb', 'wb', 'ab' or 'rt' (default: 'rb').
+        **kwargs:
+            Additional keyword arguments to pass to the opener, e.g. the encoding of text modes.
+
+    Returns:
+        Any:
+            The file object.
+    """
+    compression = get_compression(file)
+    if compression is None:
+        return open(str(file), mode, **kwargs)
+    return compression.open(file, mode, **kwargs)
+
+
+def compress_for(file: Union[str, Path], data: bytes) -> bytes:
+    """Compresses the content of a file according to its extension, or returns it as is if it is not compressed."""
+    compression = get_compression(file)
+    return data if compression is None else compression.compress(data)
+
+
+def with_file_suffix(file_path: Union[str, Path], suffix: str) -> Path:
+    """Replaces the extension of a file while keeping its compression extension, e.g. 'a.gz' becomes 'a.json.gz'.
+
+    Args:
+        file_path: Union[str, Path]
+            The path of the file.
+        suffix: str
+            The extension of the uncompressed file, e.g. '.json'.
+
+    Returns:
+        Path:
+            The path with the extension (followed by the compression extension, if any).
+    """
+    path = to_path(file_path)
+    if get_compression(path) is None:
+        return path.with_suffix(suffix)
+    uncompressed = path.with_suffix("").with_suffix(suffix)
+    return uncompressed.with_name(uncompressed.name + path.suffix)
+
+
 ##########################################################################
 # Read and Writing
 ##########################################################################
 def read_json_file(file: Union[str, Path], **kwargs) -> dict:
     """Reads a JSON file and returns a dictionary.
 
+    Notes:
+        Files whose extension is a compression format (see 'compression_formats') are decompressed while reading.
+
     Args:
         file: Union[str, Path]
             The file to read.
@@ -166,23 +611,640 @@ def read_json_file(file: Union[str, Path], **kwargs) -> dict:
         dict:
             A python dictionary.
     """
-    with open(str(file), "r") as f:
-        return json.load(f, **kwargs)
+    with open_file(file, "rb") as f:
+        return get_json_backend().loads(f.read(), **kwargs)
 
 
-def write_to_json_file(file: Union[str, Path], parsable_dictionary: dict, **kwargs):
+def write_to_json_file(file: Union[str, Path], parsable_dictionary: dict, atomic: bool = False, fsync: bool = False,
+                       **kwargs):
     """Writes a dictionary to a JSON file.
 
+    Notes:
+        Files whose extension is a compression format (see 'compression_formats') are compressed.
+
     Args:
         file: Union[str, Path]
             The file to write to.
         parsable_dictionary: dict
             The dictionary to write.
+        atomic: bool
+            Whether to write a temporary file which then replaces the file, so that readers (and crashes) never observe
+            a partially written file (default: False).
+        fsync: bool
+            Whether to flush the file to the storage device before returning (default: False).
         **kwargs:
             Additional keyword arguments to pass to json.dumps.
     """
-    with open(str(file), "w") as f:
-        json.dump(parsable_dictionary, f, **kwargs)
+    data = compress_for(file, get_json_backend().dumpb(parsable_dictionary, **kwargs))
+    if atomic:
+        write_file_atomically(file, data, fsync)
+        return
+    with open(str(file), "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def write_json_lines(file: Union[str, Path], values: Iterable[Any], append: bool = False, **kwargs) -> int:
+    """Writes values to a JSON Lines file, encoding and writing one value at a time.
+
+    Args:
+        file: Union[str, Path]
+            The file to write to.
+        values: Iterable[Any]
+            The values to write, e.g. a generator of dictionaries. Each value is written on its own line.
+        append: bool
+            Whether to append to the file instead of overwriting it (default: False).
+        **kwargs:
+            Additional keyword arguments to pass to json.dumps. Indentation is not supported.
+
+    Returns:
+        int:
+            The number of lines written.
+
+    Raises:
+        ValueError:
+            If an indentation is requested.
+    """
+    if kwargs.get('indent') is not None:
+        logger.log_and_raise(ValueError, "JSON Lines cannot be indented, received indent [", kwargs['indent'], "].")
+    backend = get_json_backend()
+    count = 0
+    with open_file(file, "ab" if append else "wb") as f:
+        for value in values:
+            f.write(backend.dumpb(value, **kwargs) + b"\n")
+            count += 1
+    return count
+
+
+def iterate_json_lines(file: Union[str, Path], **kwargs) -> Iterator[Any]:
+    """Reads the values of a JSON Lines file one line at a time.
+
+    Args:
+        file: Union[str, Path]
+            The file to read.
+        **kwargs:
+            Additional keyword arguments to pass to json.loads.
+
+    Yields:
+        Any:
+            The value of each non-empty line, in order.
+    """
+    backend = get_json_backend()
+    with open_file(file, "rb") as f:
+        for line in f:
+            if not line.isspace():
+                yield backend.loads(line, **kwargs)
+
+
+def iterate_json_lines_chunks(file: Union[str, Path], chunk_size: int) -> Iterator[List[bytes]]:
+    """Reads the raw lines of a JSON Lines file in chunks, without decoding them.
+
+    Args:
+        file: Union[str, Path]
+            The file to read.
+        chunk_size: int
+            The maximum number of non-empty lines in each chunk.
+
+    Yields:
+        List[bytes]:
+            The raw non-empty lines of each chunk, in order.
+    """
+    chunk = list()
+    with open_file(file, "rb") as f:
+        for line in f:
+            if line.isspace():
+                continue
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = list()
+    if chunk:
+        yield chunk
+
+
+def list_json_files(directory: Union[str, Path], recursive: bool = False) -> List[Path]:
+    """Lists the JSON files of a directory.
+
+    Args:
+        directory: Union[str, Path]
+            The path to the directory.
+        recursive: bool
+            Whether to include the JSON files of all subdirectories (default: False).
+
+    Returns:
+        List[Path]:
+            The paths of the '.json' files and of their compressed variants (e.g. '.json.gz'), sorted by path.
+    """
+    files = scan_directory(directory, "*.json*", recursive, directories=False)
+    return [path for path in files if with_file_suffix(path, ".json") == path]
+
+
+def _read_json_files(files: List[Path], kwargs: dict) -> List[Any]:
+    """Reads a chunk of JSON files, as a task of 'read_json_files()'."""
+    return [read_json_file(file, **kwargs) for file in files]
+
+
+def iterate_in_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Groups items into lists of at most 'chunk_size' items."""
+    chunk = list()
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = list()
+    if chunk:
+        yield chunk
+
+
+def map_in_chunks(function: Callable[..., List[Any]], items: Iterable[Any], *args, executor: Optional[Executor] = None,
+                  max_workers: Optional[int] = None, chunk_size: int = 16, ordered: bool = True,
+                  max_pending_chunks: int = 32) -> Iterator[Tuple[List[Any], List[Any]]]:
+    """Applies a function to chunks of items with an executor.
+
+    Notes:
+        At most 'max_pending_chunks' chunks are submitted to the executor and not yet consumed. Further chunks are
+        only submitted as the results are consumed, so a slow consumer does not accumulate the results of every item,
+        and closing the generator early leaves few submitted chunks to cancel or wait for.
+
+    Args:
+        function: Callable[..., List[Any]]
+            The function receiving a chunk of items followed by 'args', and returning one result per item. It must be
+            picklable (i.e. defined at module level) when using a process pool.
+        items: Iterable[Any]
+            The items to process.
+        *args:
+            The additional arguments of the function.
+        executor: Optional[Executor]
+            The executor running the function. If not provided, a thread pool of 'max_workers' threads is used.
+        max_workers: Optional[int]
+            The number of threads of the default thread pool (default: the 'ThreadPoolExecutor' default).
+        chunk_size: int
+            The number of items in each task (default: 16).
+        ordered: bool
+            Whether the chunks are yielded in the order of the items, or as soon as they are processed (default: True).
+        max_pending_chunks: int
+            The maximum number of chunks submitted to the executor and not yet consumed (default: 32).
+
+    Yields:
+        Tuple[List[Any], List[Any]]:
+            Each chunk of items along with its results.
+    """
+    owned = executor is None
+    if owned:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = dict()  # The submitted chunks in the order of the items
+
+    def consume() -> Iterator[Tuple[List[Any], List[Any]]]:
+        """Yields the next chunk in the order of the items, or every chunk processed so far."""
+        futures = [next(iter(pending))] if ordered else wait(pending, return_when=FIRST_COMPLETED)[0]
+        for future in futures:
+            yield pending.pop(future), future.result()
+
+    try:
+        for chunk in iterate_in_chunks(items, chunk_size):
+            pending[executor.submit(function, chunk, *args)] = chunk
+            if len(pending) >= max_pending_chunks:
+                yield from consume()
+        while pending:
+            yield from consume()
+    finally:
+        # --- when the caller stops early, skip the chunks which have not started ---
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=True)
+
+
+def read_json_files(files: Iterable[Union[str, Path]], executor: Optional[Executor] = None,
+                    max_workers: Optional[int] = None, chunk_size: int = 16, ordered: bool = True,
+                    max_pending_chunks: int = 32, **kwargs) -> Iterator[Tuple[Path, Any]]:
+    """Reads many JSON files concurrently.
+
+    Args:
+        files: Iterable[Union[str, Path]]
+            The files to read, e.g. from 'list_json_files()'.
+        executor: Optional[Executor]
+            The executor reading the files. If not provided, a thread pool of 'max_workers' threads is used.
+        max_workers: Optional[int]
+            The number of threads of the default thread pool.
+        chunk_size: int
+            The number of files read by each task (default: 16).
+        ordered: bool
+            Whether the files are yielded in the input order, or as soon as they are read (default: True).
+        max_pending_chunks: int
+            The maximum number of chunks read and not yet consumed (default: 32).
+        **kwargs:
+            Additional keyword arguments to pass to json.loads.
+
+    Yields:
+        Tuple[Path, Any]:
+            The path and the decoded value of each file.
+    """
+    paths = (to_path(file) for file in files)
+    for chunk, values in map_in_chunks(_read_json_files, paths, kwargs, executor=executor, max_workers=max_workers,
+                                       chunk_size=chunk_size, ordered=ordered, max_pending_chunks=max_pending_chunks):
+        yield from zip(chunk, values)
+
+
+##########################################################################
+# Atomic and Batched Writes
+##########################################################################
+__umask_lock__ = threading.Lock()
+
+
+def _current_umask() -> int:
+    """Gets the file mode creation mask of the process, reading it without changing it where the platform allows."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    with __umask_lock__:
+        umask = os.umask(0o022)
+        os.umask(umask)
+    return umask
+
+
+def _destination_mode(file: Path) -> int:
+    """Gets the permissions a file written in place would have: those of the existing file, or the default ones."""
+    try:
+        return os.stat(str(file)).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_current_umask()
+
+
+def _write_temporary_file(file: Path, data: bytes, fsync: bool) -> Path:
+    """Writes data to a new temporary file next to the destination file, with the permissions of the destination."""
+    descriptor, temporary = tempfile.mkstemp(dir=str(file.parent), prefix="." + file.name + ".", suffix=".tmp")
+    try:
+        if hasattr(os, 'fchmod'):
+            # --- mkstemp creates the file readable by its owner only ---
+            os.fchmod(descriptor, _destination_mode(file))
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return Path(temporary)
+
+
+def fsync_directory(directory: Union[str, Path]):
+    """Flushes the entries of a directory (e.g. renamed files) to the storage device, where the platform supports it.
+
+    Args:
+        directory: Union[str, Path]
+            The path to the directory.
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    descriptor = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def write_file_atomically(file: Union[str, Path], data: bytes, fsync: bool = False):
+    """Writes a file by writing a temporary file in the same directory and renaming it over the file.
+
+    Notes:
+        The file keeps the permissions of the file it replaces, or gets the default permissions of new files (i.e.
+        0o666 masked by the umask of the process), as if it had been written in place.
+
+    Args:
+        file: Union[str, Path]
+            The file to write to.
+        data: bytes
+            The content of the file.
+        fsync: bool
+            Whether to flush the file and its directory entry to the storage device before returning, so that the file
+            survives a power loss (default: False).
+    """
+    file = to_path(file)
+    temporary = _write_temporary_file(file, data, fsync)
+    try:
+        os.replace(str(temporary), str(file))
+    except BaseException:
+        os.unlink(str(temporary))
+        raise
+    if fsync:
+        fsync_directory(file.parent)
+
+
+class JsonBatchWriter:
+    """Represents a writer of many JSON files in a directory, which are made durable together.
+
+    Notes:
+        The directory is created once. In atomic mode every file is written to a temporary file, and the files of a
+        batch only replace their destinations when the batch is flushed: either explicitly with 'flush()' or when the
+        context exits without an exception. If the context exits with an exception, the pending files are discarded,
+        so a crash leaves either the previous or the new version of each file and never a truncated one. With 'fsync',
+        the flush first syncs every pending file, then renames them and syncs the directory once.
+
+    Examples:
+        with io.JsonBatchWriter(checkpoint_directory, fsync=True) as writer:
+            for name, parameters in everything.items():
+                writer.write(name, parameters.to_dict())
+    """
+
+    def __init__(self, directory: Union[str, Path], atomic: bool = True, fsync: bool = False, **kwargs):
+        """
+        Args:
+            directory: Union[str, Path]
+                The directory in which the files are written.
+            atomic: bool
+                Whether files only replace their destinations when the batch is flushed (default: True).
+            fsync: bool
+                Whether flushing the batch makes its files durable on the storage device (default: False).
+            **kwargs:
+                Additional keyword arguments to pass to json.dumps.
+        """
+        self._directory = to_path(directory)
+        self._atomic = atomic
+        self._fsync = fsync
+        self._kwargs = kwargs
+        self._pending: List[Tuple[Path, Path]] = list()
+        self._written: List[Path] = list()
+        os.makedirs(str(self._directory), exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        """Gets the directory in which the files are written."""
+        return self._directory
+
+    def path_of(self, name: Union[str, Path]) -> Path:
+        """Returns the path of the JSON file with the provided name (or path relative to the directory)."""
+        return with_file_suffix(self._directory / name, ".json")
+
+    def write(self, name: Union[str, Path], parsable_dictionary: dict) -> Path:
+        """Writes a dictionary to a JSON file of the batch.
+
+        Args:
+            name: Union[str, Path]
+                The name of the file (or its path relative to the directory), whose suffix is replaced with '.json'.
+            parsable_dictionary: dict
+                The dictionary to write.
+
+        Returns:
+            Path:
+                The path of the file, once the batch is flushed.
+        """
+        path = self.path_of(name)
+        if path.parent != self._directory:
+            os.makedirs(str(path.parent), exist_ok=True)
+        data = compress_for(path, get_json_backend().dumpb(parsable_dictionary, **self._kwargs))
+        if self._atomic:
+            self._pending.append((_write_temporary_file(path, data, False), path))
+        else:
+            with open(str(path), "wb") as f:
+                f.write(data)
+            self._pending.append((path, path))
+        return path
+
+    def flush(self) -> List[Path]:
+        """Publishes the files written since the last flush and, with 'fsync', makes them durable.
+
+        Returns:
+            List[Path]:
+                The paths of the published files.
+        """
+        pending, self._pending = self._pending, list()
+        if self._fsync:
+            for written, _ in pending:
+                descriptor = os.open(str(written), os.O_RDONLY)
+                try:
+                    os.fsync(descriptor)
+                finally:
+                    os.close(descriptor)
+        for written, path in pending:
+            if written != path:
+                os.replace(str(written), str(path))
+        if self._fsync and pending:
+            for directory in dict.fromkeys(path.parent for _, path in pending):
+                fsync_directory(directory)
+        published = [path for _, path in pending]
+        self._written.extend(published)
+        return published
+
+    def discard(self):
+        """Removes the temporary files written since the last flush, leaving their destinations untouched."""
+        pending, self._pending = self._pending, list()
+        for written, path in pending:
+            if written != path and written.exists():
+                os.unlink(str(written))
+
+    @property
+    def written(self) -> List[Path]:
+        """Gets the paths of all the files published by this writer."""
+        return list(self._written)
+
+    def __enter__(self) -> "JsonBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+
+##########################################################################
+# Streaming JSON
+##########################################################################
+class JsonStreamParser:
+    """Represents an incremental parser of a single JSON document, which reads the document in chunks.
+
+    Notes:
+        Objects, and arrays whose first item is an object or an array, are parsed one member at a time, and each object
+        is passed to the 'object_handler' as soon as it is complete. The value returned by the handler replaces the
+        object in its parent, so the raw dictionary of a subtree can be released as soon as it is converted. Any other
+        value (e.g. an array of numbers) is decoded at once by the standard library decoder, reading more chunks until
+        the value is complete.
+    """
+
+    def __init__(self, stream: Any, object_handler: Optional[Callable[[dict, int], Any]] = None,
+                 chunk_size: int = 1 << 20):
+        """
+        Args:
+            stream: Any
+                The text stream to read the document from.
+            object_handler: Optional[Callable[[dict, int], Any]]
+                The optional callable receiving every completed object along with its depth (0 for the document
+                itself), and returning the value which replaces it.
+            chunk_size: int
+                The number of characters read at a time (default: 1 MiB).
+        """
+        self._stream = stream
+        self._object_handler = object_handler
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def parse(self) -> Any:
+        """Parses the document.
+
+        Returns:
+            Any:
+                The value of the document, with every object replaced by the result of the 'object_handler'.
+
+        Raises:
+            json.JSONDecodeError:
+                If the document is not valid JSON.
+        """
+        value = self._value(0)
+        if self._peek() != "":
+            self._fail("Extra data")
+        return value
+
+    def _fill(self, size: int) -> bool:
+        """Reads at least 'size' more characters (unless the stream ends), returning whether any were read."""
+        if self._exhausted:
+            return False
+        chunks = list()
+        count = 0
+        while count < size:
+            chunk = self._stream.read(max(size - count, self._chunk_size))
+            if not chunk:
+                self._exhausted = True
+                break
+            chunks.append(chunk)
+            count += len(chunk)
+        # --- drop the characters which were already parsed ---
+        self._buffer = self._buffer[self._position:] + "".join(chunks)
+        self._position = 0
+        return count > 0
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character, or an empty string at the end of the document."""
+        while True:
+            buffer = self._buffer
+            position = self._position
+            while position < len(buffer) and buffer[position] in " \t\n\r":
+                position += 1
+            self._position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def _fail(self, message: str):
+        """Raises a decoding error at the current position."""
+        raise json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _expect(self, character: str):
+        """Consumes the expected character."""
+        if self._peek() != character:
+            self._fail("Expecting '" + character + "'")
+        self._position += 1
+
+    def _decode(self) -> Any:
+        """Decodes a complete value with the standard library decoder, reading more of the document as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # --- read at least as much as the value so far, so that long values are decoded in linear time ---
+                if self._fill(max(len(self._buffer) - self._position, self._chunk_size)):
+                    continue
+                raise
+            # --- a number at the end of the buffer (e.g. '1' or '1.') may continue in the next chunk ---
+            if ((end == len(self._buffer) or self._buffer[end] in ".eE+-") and
+                    not isinstance(value, (str, list, dict)) and self._fill(self._chunk_size)):
+                continue
+            self._position = end
+            return value
+
+    def _value(self, depth: int) -> Any:
+        """Parses the value at the current position."""
+        character = self._peek()
+        if character == "{":
+            return self._object(depth)
+        if character == "[" and self._first_item() in ("{", "["):
+            self._position += 1
+            return self._array(depth)
+        return self._decode()
+
+    def _first_item(self) -> str:
+        """Returns the first character of the item following the current character, without consuming anything."""
+        offset = self._position + 1
+        while True:
+            buffer = self._buffer
+            while offset < len(buffer) and buffer[offset] in " \t\n\r":
+                offset += 1
+            if offset < len(buffer):
+                return buffer[offset]
+            offset -= self._position
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def _object(self, depth: int) -> Any:
+        """Parses an object one member at a time and passes it to the 'object_handler'."""
+        self._expect("{")
+        output = dict()
+        if self._peek() == "}":
+            self._position += 1
+        else:
+            while True:
+                if self._peek() != '"':
+                    self._fail("Expecting property name enclosed in double quotes")
+                key = self._decode()
+                self._expect(":")
+                output[key] = self._value(depth + 1)
+                character = self._peek()
+                self._position += 1
+                if character == "}":
+                    break
+                if character != ",":
+                    self._position -= 1
+                    self._fail("Expecting ',' delimiter")
+        if self._object_handler is not None:
+            return self._object_handler(output, depth)
+        return output
+
+    def _array(self, depth: int) -> list:
+        """Parses an array one item at a time, the opening bracket being already consumed."""
+        output = list()
+        while True:
+            output.append(self._value(depth + 1))
+            character = self._peek()
+            self._position += 1
+            if character == "]":
+                return output
+            if character != ",":
+                self._position -= 1
+                self._fail("Expecting ',' delimiter")
+
+
+def read_json_file_incrementally(file: Union[str, Path],
+                                 object_handler: Optional[Callable[[dict, int], Any]] = None,
+                                 chunk_size: int = 1 << 20) -> Any:
+    """Reads a JSON file in chunks, converting its objects as soon as each of them is complete.
+
+    Args:
+        file: Union[str, Path]
+            The file to read.
+        object_handler: Optional[Callable[[dict, int], Any]]
+            The optional callable receiving every completed object along with its depth (0 for the document itself),
+            and returning the value which replaces it (see 'JsonStreamParser').
+        chunk_size: int
+            The number of characters read at a time (default: 1 MiB).
+
+    Returns:
+        Any:
+            The value of the document.
+    """
+    with open_file(file, "rt", encoding="utf-8") as f:
+        return JsonStreamParser(f, object_handler, chunk_size).parse()
 
 
 ##########################################################################
@@ -201,7 +1263,7 @@ def from_json_string(input_string: str, **kwargs) -> dict:
         dict:
             A python dictionary.
     """
-    return json.loads(input_string, **kwargs)
+    return get_json_backend().loads(input_string, **kwargs)
 
 
 def to_json_string(parsable_dictionary: dict, **kwargs) -> str:
@@ -217,4 +1279,4 @@ def to_json_string(parsable_dictionary: dict, **kwargs) -> str:
         str:
             The string representation of the dictionary.
     """
-    return json.dumps(parsable_dictionary, **kwargs)
+    return get_json_backend().dumps(parsable_dictionary, **kwargs)
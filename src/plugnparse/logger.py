@@ -1,6 +1,12 @@
+import atexit
 import inspect
 import logging
-from typing import Type, Optional, NoReturn, Union
+import logging.handlers
+import queue
+import sys
+import threading
+from types import FrameType
+from typing import Iterable, Type, Optional, NoReturn, Tuple, Union
 
 ##########################################################################
 # Levels
@@ -14,6 +20,52 @@ INFO = logging.INFO
 DEBUG = logging.DEBUG
 NOTSET = logging.NOTSET
 
+##########################################################################
+# Location Capture
+##########################################################################
+__capture_locations__ = True  # Whether the calling location is recorded when requested
+
+StackInfo = Union[inspect.FrameInfo, FrameType]
+
+
+def set_location_capture(enabled: bool):
+    """Enables or disables recording the calling location of log messages.
+
+    Notes:
+        When disabled, the `record_location` arguments of the logging methods are ignored and no stack frame is
+        captured at all, which is useful in hot code where many errors are raised and handled.
+
+    Args:
+        enabled: bool
+            Indicates whether the calling location should be recorded when requested.
+    """
+    global __capture_locations__
+    __capture_locations__ = bool(enabled)
+
+
+def is_location_capture_enabled() -> bool:
+    """Returns whether the calling location of log messages is recorded when requested."""
+    return __capture_locations__
+
+
+def caller_frame(depth: int = 1) -> Optional[FrameType]:
+    """Gets a frame of the calling stack without building the full stack or reading any source context.
+
+    Args:
+        depth: int
+            The number of frames above the method calling this one (default: 1, i.e. the caller of the caller).
+
+    Returns:
+        Optional[FrameType]:
+            The frame, or None if location capture is disabled or the stack is not deep enough.
+    """
+    if not __capture_locations__:
+        return None
+    try:
+        return sys._getframe(depth + 1)
+    except ValueError:
+        return None
+
 
 ##########################################################################
 # Logger Methods
@@ -79,29 +131,79 @@ def set_log_level(level: int):
     __logger__.setLevel(level)
 
 
-def function_file_line(message: str, stack: inspect.FrameInfo = inspect.stack()[0]) -> str:
+def frame_location(stack: StackInfo) -> Tuple[str, int, str]:
+    """Gets the file name, line number and function name of a stack frame.
+
+    Args:
+        stack: StackInfo
+            The stack frame information, either a frame or an 'inspect.FrameInfo'.
+
+    Returns:
+        Tuple[str, int, str]:
+            The file name, line number and function name.
+    """
+    if isinstance(stack, tuple):
+        return stack.filename, stack.lineno, stack.function
+    return stack.f_code.co_filename, stack.f_lineno, stack.f_code.co_name
+
+
+def format_location(message: str, location: Tuple[str, int, str]) -> str:
+    """Prepends a (file name, line number, function name) location to a provided message."""
+    filename, line_number, function = location
+    return "\"" + str(filename) + ":" + str(line_number) + "\" - in [" + str(function) + "] --- " + message
+
+
+def function_file_line(message: str, stack: Optional[StackInfo] = None) -> str:
     """Prepends the stack frame information to a provided message.
 
     Args:
         message: str
             A message to append onto the stack information
-        stack: inspect.FrameInfo
-            The stack frame information.
+        stack: Optional[StackInfo]
+            The stack frame information, either a frame or an 'inspect.FrameInfo' (default: the calling frame).
 
     Returns:
         str:
             The message with the stack frame information.
     """
-    caller = inspect.getframeinfo(stack[0])
-    new_message = "\"" + str(caller.filename) + ":" + str(caller.lineno) + "\" - in [" + str(
-        caller.function) + "] --- " + message
-    return new_message
+    return format_location(message, frame_location(stack if stack is not None else sys._getframe(1)))
+
+
+class LogMessage:
+    """Represents a log message whose arguments are only concatenated when the message is first converted to a string.
+
+    Notes:
+        The message is passed to the handlers of the queue backend (see 'enable_queue_logging()') and returned by the
+        logging methods while the backend is enabled. It is formatted at most once, normally by the handlers of the
+        listener thread, so the text reflects its arguments when it is emitted rather than when it was logged. Callers
+        which need the text, e.g. to raise an exception, convert the message with 'str()'.
+    """
+    __slots__ = ('args', 'location', '_message')
+
+    def __init__(self, args: tuple, location: Optional[Tuple[str, int, str]] = None):
+        self.args = args
+        self.location = location
+        self._message: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            message = ""
+            for arg in self.args:
+                message += str(arg)
+            if self.location is not None:
+                message = format_location(message, self.location)
+            self._message = message
+        return self._message
+
+    def __repr__(self) -> str:
+        return "LogMessage(" + repr(str(self)) + ")"
 
 
 ##########################################################################
 # Logging Methods
 ##########################################################################
-def log(*argv, level: int, record_location: bool = False, stack: inspect.FrameInfo = inspect.stack()[1]) -> str:
+def log(*argv, level: int, record_location: bool = False,
+        stack: Optional[StackInfo] = None) -> Union[str, LogMessage]:
     """Logs a message to the logger.
 
     Args:
@@ -111,25 +213,34 @@ def log(*argv, level: int, record_location: bool = False, stack: inspect.FrameIn
             The level in which to log the message.
         record_location: bool
             Indicates whether to record the stack frame information.
-        stack: inspect.FrameInfo
-            The calling stack frame information.
+        stack: Optional[StackInfo]
+            The calling stack frame information (default: the frame calling this method).
 
     Returns:
-        str:
-            The message that was logged to the logger.
+        Union[str, LogMessage]:
+            The message that was logged to the logger. While the queue backend is enabled, this is the unformatted
+            'LogMessage' passed to the listener thread, which 'str()' formats on demand.
     """
     message = ""
     if not __logger__.isEnabledFor(level):
         return message
+    if __queue_backend__ is not None:
+        location = None
+        if record_location and __capture_locations__:
+            location = frame_location(stack if stack is not None else sys._getframe(1))
+        message = LogMessage(argv, location)
+        __logger__.log(level=level, msg=message)
+        return message
     for arg in argv:
         message += str(arg)
-    if record_location:
-        message = function_file_line(message=message, stack=stack)
+    if record_location and __capture_locations__:
+        message = function_file_line(message=message, stack=stack if stack is not None else sys._getframe(1))
     __logger__.log(level=level, msg=message)
     return message
 
 
-def debug(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def debug(*argv, record_location: bool = False,
+          stack: Optional[StackInfo] = None) -> Union[str, LogMessage]:
     """Log to the DEBUG stream.
 
     Args:
@@ -137,20 +248,21 @@ def debug(*argv, record_location: bool = False, stack: Optional[inspect.FrameInf
             List of inputs to be concatenated into a log message.
         record_location: bool
             Record the stack frame from which this log method was invoked iff True (default: False).
-        stack: Optional[inspect.FrameInfo]
+        stack: Optional[StackInfo]
             The optional stack info for the calling method.
 
     Returns:
-        str:
-            Concatenated log message.
+        Union[str, LogMessage]:
+            Concatenated log message (an unformatted 'LogMessage' while the queue backend is enabled).
     """
     if not __logger__.isEnabledFor(DEBUG):
         return ""
     return log(*argv, level=logging.DEBUG, record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+               stack=stack if stack is not None or not record_location else caller_frame())
 
 
-def info(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def info(*argv, record_location: bool = False,
+         stack: Optional[StackInfo] = None) -> Union[str, LogMessage]:
     """Log to the INFO stream.
 
     Args:
@@ -158,20 +270,21 @@ def info(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo
             List of inputs to be concatenated into a log message.
         record_location: bool
             Record the stack frame from which this log method was invoked iff True (default: False).
-        stack: Optional[inspect.FrameInfo]
+        stack: Optional[StackInfo]
             The optional stack info for the calling method.
 
     Returns:
-        str:
-            Concatenated log message.
+        Union[str, LogMessage]:
+            Concatenated log message (an unformatted 'LogMessage' while the queue backend is enabled).
     """
     if not __logger__.isEnabledFor(INFO):
         return ""
     return log(*argv, level=logging.INFO, record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+               stack=stack if stack is not None or not record_location else caller_frame())
 
 
-def warning(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def warning(*argv, record_location: bool = False,
+            stack: Optional[StackInfo] = None) -> Union[str, LogMessage]:
     """Log to the WARNING stream.
 
     Args:
@@ -179,20 +292,21 @@ def warning(*argv, record_location: bool = False, stack: Optional[inspect.FrameI
             List of inputs to be concatenated into a log message.
         record_location: bool
             Record the stack frame from which this log method was invoked iff True (default: False).
-        stack: Optional[inspect.FrameInfo]
+        stack: Optional[StackInfo]
             The optional stack info for the calling method.
 
     Returns:
-        str:
-            Concatenated log message.
+        Union[str, LogMessage]:
+            Concatenated log message (an unformatted 'LogMessage' while the queue backend is enabled).
     """
     if not __logger__.isEnabledFor(WARNING):
         return ""
     return log(*argv, level=logging.WARNING, record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+               stack=stack if stack is not None or not record_location else caller_frame())
 
 
-def error(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def error(*argv, record_location: bool = False,
+          stack: Optional[StackInfo] = None) -> Union[str, LogMessage]:
     """Log to the ERROR stream.
 
     Args:
@@ -200,20 +314,21 @@ def error(*argv, record_location: bool = False, stack: Optional[inspect.FrameInf
             List of inputs to be concatenated into a log message.
         record_location: bool
             Record the stack frame from which this log method was invoked iff True (default: False).
-        stack: Optional[inspect.FrameInfo]
+        stack: Optional[StackInfo]
             The optional stack info for the calling method.
 
     Returns:
-        str:
-            Concatenated log message.
+        Union[str, LogMessage]:
+            Concatenated log message (an unformatted 'LogMessage' while the queue backend is enabled).
     """
     if not __logger__.isEnabledFor(ERROR):
         return ""
     return log(*argv, level=logging.ERROR, record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+               stack=stack if stack is not None or not record_location else caller_frame())
 
 
-def critical(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def critical(*argv, record_location: bool = False,
+             stack: Optional[StackInfo] = None) -> Union[str, LogMessage]:
     """Log to the CRITICAL stream.
 
     Args:
@@ -221,17 +336,17 @@ def critical(*argv, record_location: bool = False, stack: Optional[inspect.Frame
             List of inputs to be concatenated into a log message.
         record_location: bool
             Record the stack frame from which this log method was invoked iff True (default: False).
-        stack: Optional[inspect.FrameInfo]
+        stack: Optional[StackInfo]
             The optional stack info for the calling method.
 
     Returns:
-        str:
-            Concatenated log message.
+        Union[str, LogMessage]:
+            Concatenated log message (an unformatted 'LogMessage' while the queue backend is enabled).
     """
     if not __logger__.isEnabledFor(CRITICAL):
         return ""
     return log(*argv, level=logging.CRITICAL, record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+               stack=stack if stack is not None or not record_location else caller_frame())
 
 
 def log_and_raise(exception_type: Type[Exception], *args, record_location: bool = True, **kwargs) -> NoReturn:
@@ -243,7 +358,8 @@ def log_and_raise(exception_type: Type[Exception], *args, record_location: bool
         args: list
             Arguments to concatenate into a string log message.
         record_location: bool
-            Record the stack frame from which this log method was invoked iff True.
+            Record the stack frame from which this log method was invoked iff True. The frame is captured without
+            reading any source context and is skipped entirely if location capture is disabled.
         kwargs: dict
             Keyword arguments to `error`. Currently only `record_location` is supported.
 
@@ -251,4 +367,91 @@ def log_and_raise(exception_type: Type[Exception], *args, record_location: bool
         Exception:
               A subclass of type `exception_type`. Guaranteed to raise.
     """
-    raise exception_type(error(*args, record_location=record_location, stack=inspect.stack()[1]))
+    raise exception_type(str(error(*args, record_location=record_location,
+                                   stack=caller_frame() if record_location else None)))
+
+
+##########################################################################
+# Queue Backend
+##########################################################################
+__queue_backend__ = None  # The active (queue handler, listener, previous handlers, previous propagate) of the backend
+__queue_backend_lock__ = threading.Lock()
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Represents a queue handler which enqueues records without formatting them.
+
+    Notes:
+        The standard 'QueueHandler' formats each record before enqueuing it so that it can be pickled. This handler is
+        meant for in-process queues, so the message and its arguments are passed through and only formatted by the
+        handlers of the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def enable_queue_logging(handlers: Optional[Iterable[logging.Handler]] = None,
+                         log_queue: Optional[queue.Queue] = None) -> logging.handlers.QueueListener:
+    """Emits the messages of the default logger from a background thread, so logging never blocks on handler I/O.
+
+    Notes:
+        The default logger enqueues its records and a listener thread passes them on to the handlers. The records
+        hold the messages of the logging methods as 'LogMessage' objects, which are formatted by the listener thread and
+        returned unformatted by the logging methods. The backend
+        is stopped, and all pending records flushed, by 'disable_queue_logging()' or when the interpreter exits.
+
+    Args:
+        handlers: Optional[Iterable[logging.Handler]]
+            The handlers that emit the records. If not provided, the handlers of the default logger are used, or those
+            of the root logger if the default logger has none.
+        log_queue: Optional[queue.Queue]
+            The optional queue holding the pending records (default: an unbounded queue).
+
+    Returns:
+        logging.handlers.QueueListener:
+            The listener emitting the records.
+    """
+    global __queue_backend__
+    with __queue_backend_lock__:
+        if __queue_backend__ is not None:
+            log_and_raise(RuntimeError, "The queue logging backend is already enabled.")
+
+        previous_handlers = list(__logger__.handlers)
+        previous_propagate = __logger__.propagate
+        if handlers is None:
+            handlers = previous_handlers or list(logging.getLogger().handlers)
+        log_queue = queue.SimpleQueue() if log_queue is None else log_queue
+
+        queue_handler = DeferredQueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        for handler in previous_handlers:
+            __logger__.removeHandler(handler)
+        __logger__.addHandler(queue_handler)
+        __logger__.propagate = False
+        listener.start()
+        __queue_backend__ = (queue_handler, listener, previous_handlers, previous_propagate)
+        return listener
+
+
+def disable_queue_logging():
+    """Stops the queue backend after emitting all pending records and restores the handlers of the default logger."""
+    global __queue_backend__
+    with __queue_backend_lock__:
+        if __queue_backend__ is None:
+            return
+        queue_handler, listener, previous_handlers, previous_propagate = __queue_backend__
+        __queue_backend__ = None
+        listener.stop()
+        __logger__.removeHandler(queue_handler)
+        for handler in previous_handlers:
+            __logger__.addHandler(handler)
+        __logger__.propagate = previous_propagate
+
+
+def is_queue_logging_enabled() -> bool:
+    """Returns whether the queue backend is enabled."""
+    return __queue_backend__ is not None
+
+
+atexit.register(disable_queue_logging)
@@ -0,0 +1,232 @@
+# --- external imports ---
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from pathlib import Path
+import importlib
+import inspect
+import pkgutil
+# --- local imports ---
+from . import logger
+from .parsable import Parsable
+
+_active_manifests: List[PluginManifest] = list()
+
+
+def qualified_class_name(class_type: Type[Any]) -> str:
+    """Returns the fully qualified name of a class type, e.g. 'package.module.ClassName'."""
+    return class_type.__module__ + "." + class_type.__qualname__
+
+
+class PluginManifest(Parsable):
+    """Represents an on-disk index mapping plugin class names to the modules that define them.
+
+    Notes:
+        A manifest is built once by importing and scanning packages (see 'build_plugin_manifest()'). When a manifest is
+        activated with 'add_manifest()', 'Plugin.get_class()' consults it for plugins that are not registered yet and
+        imports only the single module that defines the requested plugin.
+
+        Each plugin entry is a dictionary with the following keys:
+            - 'name': the class name of the plugin.
+            - 'module': the module in which the plugin is defined.
+            - 'bases': the fully qualified names of the plugin class and all of its Plugin base classes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # --- init the parent ---
+        super().__init__(*args, **kwargs)
+        # --- update the parsable attributes ---
+        self._serializable_attributes.extend(['plugins'])
+
+        # --- set the components ---
+        self._index: Optional[Dict[str, List[dict]]] = None
+        self.plugins = kwargs.get('plugins')
+
+    ##########################################################################
+    # Plugins Properties
+    ##########################################################################
+    @property
+    def has_plugins(self) -> bool:
+        """Returns whether the plugins attribute has been assigned."""
+        return self._plugins is not None
+
+    @property
+    def plugins(self) -> List[dict]:
+        """Gets the plugin entries of the manifest.
+
+        Returns:
+            List[dict]:
+                The plugin entries holding the 'name', 'module' and 'bases' of each plugin.
+
+        Raises:
+            AttributeError:
+                If the property has not been assigned yet.
+        """
+        if self._plugins is None:
+            logger.log_and_raise(AttributeError, "The plugins parameter has not been set.")
+        return self._plugins
+
+    @plugins.setter
+    def plugins(self, input_value: Optional[List[dict]]):
+        """Sets the plugin entries of the manifest.
+
+        Args:
+            input_value: Optional[List[dict]]
+                Either None or the list of plugin entries.
+
+        Raises:
+            TypeError:
+                If the provided `input_value` is not a supported type.
+        """
+        if input_value is None:
+            self._plugins = None
+        elif isinstance(input_value, list):
+            for entry in input_value:
+                if not (isinstance(entry, dict) and isinstance(entry.get('name'), str) and
+                        isinstance(entry.get('module'), str) and isinstance(entry.get('bases'), list)):
+                    logger.log_and_raise(TypeError, "Invalid plugin entry [", entry, "].")
+            self._plugins = input_value
+        else:
+            logger.log_and_raise(TypeError, "Invalid input type [", type(input_value), "].")
+        self._index = None
+
+    ##########################################################################
+    # Lookup
+    ##########################################################################
+    def find_modules(self, class_name: str, base_type: Optional[Type[Any]] = None) -> List[str]:
+        """Finds the modules which define a plugin with the provided name.
+
+        Args:
+            class_name: str
+                The class name of the plugin.
+            base_type: Optional[Type[Any]]
+                The optional plugin base class that the plugin must derive from.
+
+        Returns:
+            List[str]:
+                The modules defining a matching plugin, in the order they were recorded.
+        """
+        if self._index is None:
+            index = dict()
+            for entry in (self._plugins or []):
+                index.setdefault(entry['name'], []).append(entry)
+            self._index = index
+
+        base_name = None if base_type is None else qualified_class_name(base_type)
+        return [entry['module'] for entry in self._index.get(class_name, [])
+                if base_name is None or base_name in entry['bases']]
+
+
+##########################################################################
+# Building and Activating Manifests
+##########################################################################
+def iterate_package_modules(package_names: Iterable[str]) -> List[str]:
+    """Imports the provided packages and all of their submodules.
+
+    Args:
+        package_names: Iterable[str]
+            The names of the packages (or plain modules) to import.
+
+    Returns:
+        List[str]:
+            The names of all modules that were successfully imported.
+    """
+    module_names = list()
+    for package_name in package_names:
+        package = importlib.import_module(package_name)
+        module_names.append(package.__name__)
+        if not hasattr(package, '__path__'):
+            continue
+        for module_info in pkgutil.walk_packages(package.__path__, prefix=package.__name__ + "."):
+            try:
+                importlib.import_module(module_info.name)
+            except Exception as error:
+                logger.warning("Unable to import module [", module_info.name, "] while building the plugin manifest. ",
+                               "Encountered error: [", error, "]")
+                continue
+            module_names.append(module_info.name)
+    return module_names
+
+
+def build_plugin_manifest(package_names: Iterable[str], base_type: Optional[Type[Any]] = None) -> PluginManifest:
+    """Builds a manifest of the plugins defined in the provided packages.
+
+    Args:
+        package_names: Iterable[str]
+            The names of the packages (or plain modules) to scan. Every submodule of a package is imported.
+        base_type: Optional[Type[Any]]
+            The optional plugin base class whose subclasses are recorded (default: Plugin).
+
+    Returns:
+        PluginManifest:
+            The manifest holding the name, module and plugin base classes of every plugin that was found.
+    """
+    if base_type is None:
+        from .plugin import Plugin
+        base_type = Plugin
+
+    entries = list()
+    for module_name in iterate_package_modules(package_names):
+        module = importlib.import_module(module_name)
+        for _, member in inspect.getmembers(module, inspect.isclass):
+            if member.__module__ != module_name or not issubclass(member, base_type):
+                continue
+            bases = [qualified_class_name(base) for base in member.__mro__
+                     if isinstance(base, type) and issubclass(base, base_type)]
+            entries.append({'name': member.__name__, 'module': module_name, 'bases': bases})
+    return PluginManifest(plugins=entries)
+
+
+def add_manifest(manifest: Union[PluginManifest, str, Path]) -> PluginManifest:
+    """Activates a manifest so that 'Plugin.get_class()' can use it to find plugins which are not imported yet.
+
+    Args:
+        manifest: Union[PluginManifest, str, Path]
+            Either a manifest or the path of a manifest saved with 'PluginManifest.save_to_json()'.
+
+    Returns:
+        PluginManifest:
+            The activated manifest.
+    """
+    if not isinstance(manifest, PluginManifest):
+        file_path = manifest
+        manifest = PluginManifest()
+        manifest.load_from_json(file_path)
+    _active_manifests.append(manifest)
+    return manifest
+
+
+def remove_manifest(manifest: PluginManifest):
+    """Deactivates a previously activated manifest.
+
+    Args:
+        manifest: PluginManifest
+            The manifest returned by 'add_manifest()'.
+    """
+    if manifest in _active_manifests:
+        _active_manifests.remove(manifest)
+
+
+def clear_manifests():
+    """Deactivates all manifests."""
+    _active_manifests.clear()
+
+
+def find_plugin_modules(class_name: str, base_type: Optional[Type[Any]] = None) -> List[str]:
+    """Finds the modules defining a plugin with the provided name across all of the active manifests.
+
+    Args:
+        class_name: str
+            The class name of the plugin.
+        base_type: Optional[Type[Any]]
+            The optional plugin base class that the plugin must derive from.
+
+    Returns:
+        List[str]:
+            The modules defining a matching plugin.
+    """
+    modules = list()
+    for manifest in list(_active_manifests):
+        for module_name in manifest.find_modules(class_name, base_type):
+            if module_name not in modules:
+                modules.append(module_name)
+    return modules
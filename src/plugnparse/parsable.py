@@ -1,12 +1,19 @@
 # --- external imports ---
 from __future__ import annotations
-from typing import List, Optional, Tuple, Union, Any, Sequence, Callable, TypeVar
+from typing import List, Optional, Tuple, Union, Any, Sequence, Callable, TypeVar, Iterable, Iterator, Dict
+from collections import deque
+from concurrent.futures import Executor
+import itertools
+import weakref
 import numpy as np
 from pathlib import Path
 # --- local imports ---
-from . import logger, io, properties
+from . import aio, binary, logger, io, properties, schema
+from .fingerprint import FingerprintBuilder
 from .equal import equal
 
+_revisions = itertools.count(1)  # The source of the revision numbers recorded by change tracking
+
 T = TypeVar("T")
 U = TypeVar("U")
 V = TypeVar("V")
@@ -148,7 +155,29 @@ class Parsable:
         '_desired_order_of_parsing' have been parsed. The attributes registered in '_desired_order_of_parsing' must be
         also be registered in one of the above category lists. Registering an attribute that is not also registered in
         a category will cause the parsing routine to raise an exception.
+
+        Subclasses may set 'track_changes = True' to record which attributes are assigned, so that 'to_dict()' and
+        'to_string()' reuse the serialized representation of the attributes that did not change. Assigning a property,
+        or the instance attribute named after it with a leading underscore (e.g. '_foo' for 'foo'), marks the property
+        as changed. Methods which store a value in another attribute without going through the property must either
+        call 'mark_changed()' or be declared in 'field_owners', e.g. 'field_owners = {"_stored_foo": "foo"}'. Values
+        mutated in place, such as writing into an array or appending to a list, are not observed: they must be marked
+        with 'mark_changed()', otherwise their previous serialized representation is reused.
     """
+    track_changes: bool = False  # Whether assignments are tracked to serialize unchanged attributes incrementally
+    field_owners: Dict[str, Union[str, Sequence[str]]] = dict()  # The properties stored in each instance attribute
+    _parsable_field_owners: Dict[str, Tuple[str, ...]] = dict()  # The 'field_owners' of the class and of its bases
+
+    def __init_subclass__(cls, **kwargs):
+        """Collects the 'field_owners' of the subclass and installs the change tracking '__setattr__' if enabled."""
+        super().__init_subclass__(**kwargs)
+        owners = dict()
+        for base in reversed(cls.__mro__):
+            for field, names in base.__dict__.get('field_owners', dict()).items():
+                owners[field] = (names,) if isinstance(names, str) else tuple(names)
+        cls._parsable_field_owners = owners
+        if cls.track_changes and cls.__setattr__ is object.__setattr__:
+            cls.__setattr__ = _tracking_setattr
 
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -306,6 +335,25 @@ class Parsable:
         # --- return the ordered attributes and the unordered attributes ---
         return ordered_attributes.tolist(), unordered_attributes.tolist()
 
+    def get_schema(self) -> schema.ParsableSchema:
+        """Gets the compiled parsing schema for this class and its registered attributes.
+
+        Notes:
+            The schema is compiled on first use and cached for every instance of the same class that shares the same
+            attribute registration, so the category resolution, the parsing order and the property accessors are only
+            introspected once.
+
+        Returns:
+            schema.ParsableSchema:
+                The compiled schema.
+
+        Raises:
+            ValueError:
+                If there are attributes registered in the '_desired_order_of_parsing' property that are not
+                registered in any of the attributes categories.
+        """
+        return schema.get_schema(self, Parsable)
+
     ##########################################################################
     # Conversions
     ##########################################################################
@@ -330,14 +378,14 @@ class Parsable:
             if hasattr(value, 'to_dict'):
                 parsed_items[key] = value.to_dict()
             elif hasattr(value, 'tolist'):
-                parsed_items[key] = value.tolist()
+                parsed_items[key] = binary.tolist(value)
             elif isinstance(value, list):
                 converted_items = []
                 for item in value:
                     if hasattr(value, 'to_dict'):
                         converted_items.append(item.to_dict())
                     elif hasattr(value, 'tolist'):
-                        converted_items.append(item.tolist())
+                        converted_items.append(binary.tolist(item))
                     else:
                         converted_items.append(item)
                 parsed_items[key] = converted_items
@@ -364,13 +412,13 @@ class Parsable:
             if hasattr(item, 'to_dict'):
                 parsed_items.append(item.to_dict())
             elif hasattr(item, 'tolist'):
-                parsed_items.append(item.tolist())
+                parsed_items.append(binary.tolist(item))
             elif isinstance(item, list):
                 for entry in item:
                     if hasattr(entry, 'to_dict'):
                         parsed_items.append(entry.to_dict())
                     elif hasattr(entry, 'tolist'):
-                        parsed_items.append(entry.tolist())
+                        parsed_items.append(binary.tolist(entry))
                     else:
                         parsed_items.append(entry)
             else:
@@ -463,7 +511,21 @@ class Parsable:
             str:
                 The JSON representation of the Parsable subclass.
         """
-        return io.to_json_string(self.to_dict(), **kwargs)
+        backend = io.get_json_backend()
+        if self.track_changes and not kwargs:
+            # --- join the cached JSON of each unchanged attribute, as the JSON backend would format them ---
+            separator = backend.key_separator
+            items = [backend.dumps(properties.generic_parsable_type) + separator +
+                     backend.dumps(self.__class__.__name__),
+                     backend.dumps(properties.generic_parsable_module) + separator +
+                     backend.dumps(self.__class__.__module__)]
+            for entry in self._tracked_encoding():
+                if entry[2] is not _absent:
+                    if entry[3] is None or entry[3][0] is not backend:
+                        entry[3] = (backend, backend.dumps(entry[0]) + separator + backend.dumps(entry[2]))
+                    items.append(entry[3][1])
+            return "{" + backend.item_separator.join(items) + "}"
+        return backend.dumps(self._json_dict(backend, kwargs), **kwargs)
 
     def from_string(self, json_string: str):
         """Parses a JSON string into the Parsable subclass.
@@ -489,29 +551,14 @@ class Parsable:
         output[properties.generic_parsable_type] = self.__class__.__name__
         output[properties.generic_parsable_module] = self.__class__.__module__
 
-        # --- serializable ---
-        for property_name in self._serializable_attributes:
-            self.to_dict_serializable(output, property_name)
-
-        # --- enums ---
-        for property_name in self._enum_attributes:
-            self.to_dict_enum(output, property_name)
-
-        # --- parsable ---
-        for property_name in self._parsable_attributes:
-            self.to_dict_parsable(output, property_name)
-
-        # --- dict of parsables ---
-        for property_name in self._dict_of_parsables:
-            self.to_dict_dict_of_parsable(output, property_name)
-
-        # --- list of parsables ---
-        for property_name in self._list_of_parsables:
-            self.to_dict_list_of_parsable(output, property_name)
+        if self.track_changes and not binary.are_arrays_kept():
+            for entry in self._tracked_encoding():
+                if entry[2] is not _absent:
+                    output[entry[0]] = _copy_serialized(entry[2])
+            return output
 
-        # --- specialized ---
-        for property_name in self._specialized_attributes:
-            self.to_dict_specialized(output, property_name)
+        for attribute in self.get_schema().encoding:
+            attribute.encode(self, output)
         return output
 
     def to_dict_serializable(self, output: dict, property_name: str):
@@ -527,14 +574,14 @@ class Parsable:
             if self.__getattribute__("has_" + property_name):
                 value = self.__getattribute__(property_name)
                 if hasattr(value, 'tolist'):
-                    value = value.tolist()
+                    value = binary.tolist(value)
                 if isinstance(value, frozenset):
                     value = list(value)
                 output[property_name] = value
         else:
             value = self.__getattribute__(property_name)
             if hasattr(value, 'tolist'):
-                value = value.tolist()
+                value = binary.tolist(value)
             if isinstance(value, frozenset):
                 value = list(value)
             output[property_name] = value
@@ -651,22 +698,36 @@ class Parsable:
                 The serialized dictionary that is to be deserialized and used to hydrate the internal structures of this
                 subclass implementation.
         """
-        ordered_attributes, unordered_attributes = self.split_ordered_and_unordered_attributes()
-        for property_name in (*ordered_attributes, *unordered_attributes):
-            if property_name in self._serializable_attributes:
-                self.from_dict_serializable(input_value, property_name)
-            elif property_name in self._parsable_attributes:
-                self.from_dict_parsable(input_value, property_name)
-            elif property_name in self._enum_attributes:
-                self.from_dict_enum(input_value, property_name)
-            elif property_name in self._dict_of_parsables:
-                self.from_dict_dict_of_parsable(input_value, property_name)
-            elif property_name in self._list_of_parsables:
-                self.from_dict_list_of_parsable(input_value, property_name)
-            elif property_name in self._specialized_attributes:
-                self.from_dict_specialized(input_value, property_name)
-            else:
-                logger.log_and_raise(RuntimeError, "The property [", property_name, "] doesn't exist!")
+        for attribute in self.get_schema().decoding:
+            attribute.decode(self, input_value)
+
+    @classmethod
+    def from_dicts(cls, input_values: Iterable[dict], throw_if_unable_to_parse: bool = True) -> List[Any]:
+        """Constructs and hydrates a Parsable for each serialized dictionary of a sequence.
+
+        Notes:
+            Dictionaries holding the keys defined at 'plugnparse.properties.generic_parsable_type' and
+            'plugnparse.properties.generic_parsable_module' are constructed as the class they describe, all others are
+            constructed as this class. The class type and its required initialization arguments are resolved only once
+            per distinct class (see 'plugnparse.properties.parse_many()').
+
+        Args:
+            input_values: Iterable[dict]
+                The serialized dictionaries to deserialize.
+            throw_if_unable_to_parse: bool
+                If true, throws an exception if a dictionary cannot be parsed (default: True).
+
+        Returns:
+            List[Any]:
+                The hydrated Parsable objects in the same order as the input dictionaries.
+
+        Raises:
+            RuntimeError:
+                If a dictionary cannot be parsed and throw_if_unable_to_parse is True.
+        """
+        return properties.parse_many(input_values,
+                                     throw_if_unable_to_parse=throw_if_unable_to_parse,
+                                     default_class_type=cls)
 
     def from_dict_serializable(self, input_value: dict, property_name: str):
         """Retrieves the serializable value from the input dictionary and populates the desired attribute.
@@ -787,23 +848,8 @@ class Parsable:
                 The serialized dictionary that is to be deserialized and used to hydrate the internal structures of this
                 subclass implementation.
         """
-        ordered_attributes, unordered_attributes = self.split_ordered_and_unordered_attributes()
-
-        for property_name in (*ordered_attributes, *unordered_attributes):
-            if property_name in self._serializable_attributes:
-                self.update_serializable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._parsable_attributes:
-                self.update_parsable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._enum_attributes:
-                self.update_enum_property(only_if_missing, input_value, property_name)
-            elif property_name in self._dict_of_parsables:
-                self.update_dict_of_parsable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._list_of_parsables:
-                self.update_list_of_parsable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._specialized_attributes:
-                self.update_specialized_property(only_if_missing, input_value, property_name)
-            else:
-                logger.log_and_raise(RuntimeError, "The property [", property_name, "] doesn't exist!")
+        for attribute in self.get_schema().decoding:
+            getattr(self, schema.updating_methods[attribute.category])(only_if_missing, input_value, attribute.name)
 
     def update_property(self, input_value: Any, property_name: str):
         """Updates a property of this class.
@@ -820,6 +866,8 @@ class Parsable:
             self.__setattr__(property_name, input_value)
         else:
             logger.debug("Unable to update property [", property_name, "].", record_location=True)
+        if self.track_changes:
+            self.mark_changed(property_name)
 
     def update_serializable_property(self, only_if_missing: bool, input_value: dict, property_name: str):
         """Retrieves the serializable value from the input dictionary and populates the desired attribute if desired.
@@ -941,12 +989,22 @@ class Parsable:
     ##########################################################################
     # Equality Checks
     ##########################################################################
-    def equals(self, other: Parsable, **kwargs) -> bool:
+    def equals(self, other: Parsable, use_fingerprints: bool = True, **kwargs) -> bool:
         """Compares whether two Parsable objects are equal in their parsable attributes.
 
+        Notes:
+            Without tolerances, objects whose cached fingerprints (see 'fingerprint()') are both up to date and differ
+            are reported as different without comparing their attributes. Objects which were never fingerprinted are
+            always compared attribute by attribute. Like 'fingerprint()' itself, cached fingerprints are validated by
+            the identity of the attribute values only, so values mutated in place after fingerprinting must be marked
+            with 'invalidate_fingerprint()' or 'mark_changed()'.
+
         Args:
             other: Parsable
                 The other Parsable to compare to this Parsable.
+            use_fingerprints: bool
+                Whether differing cached fingerprints of this Parsable and `other` may decide that they are different
+                (default: True).
             **kwargs:
                 Additional key-word arguments.
 
@@ -957,7 +1015,15 @@ class Parsable:
         if type(self) != type(other):
             return False
 
-        for property_name in self.collect_all_attributes():
+        if use_fingerprints and kwargs.get('rtol', None) is None and kwargs.get('atol', None) is None:
+            # --- up to date fingerprints which differ prove that the objects differ ---
+            self_digest = self.cached_fingerprint_digest()
+            if self_digest is not None:
+                other_digest = other.cached_fingerprint_digest()
+                if other_digest is not None and self_digest != other_digest:
+                    return False
+
+        for property_name in self.get_schema().attributes:
             self_value, other_value, equals = self.equals_property_name(other, property_name)
             if equals:
                 continue
@@ -995,6 +1061,206 @@ class Parsable:
 
         return self_value, other_value, None
 
+    ##########################################################################
+    # Change Tracking
+    ##########################################################################
+    def mark_changed(self, property_name: Optional[str] = None):
+        """Marks an attribute as changed, so that it is serialized again by 'to_dict()' and 'to_string()'.
+
+        Notes:
+            With 'track_changes' enabled, assigning an attribute (e.g. through its property setter or
+            'update_property()') marks it automatically, as does assigning the instance attribute '_<name>' or an
+            instance attribute declared in 'field_owners'. Values stored in other attributes, and values which are
+            mutated in place, such as appending to a list or writing into an array, must be marked with this method.
+            Marking an attribute also discards the cached fingerprint (see 'invalidate_fingerprint()').
+
+        Args:
+            property_name: Optional[str]
+                The name of the changed attribute. If not provided, every attribute is marked as changed.
+        """
+        revisions = self.__dict__.get('_parsable_revisions')
+        if revisions is None:
+            revisions = self.__dict__['_parsable_revisions'] = dict()
+        revisions[property_name] = next(_revisions)
+        self.invalidate_fingerprint()
+
+    def revision(self) -> Optional[int]:
+        """Gets the latest revision of this Parsable and of its nested Parsables.
+
+        Returns:
+            Optional[int]:
+                A number which increases whenever a tracked attribute of this tree is assigned or marked as changed,
+                or None if changes are not tracked for this Parsable or for one of its nested Parsables.
+        """
+        if not self.track_changes:
+            return None
+        revisions = self.__dict__.get('_parsable_revisions')
+        latest = max(revisions.values()) if revisions else 0
+        for attribute in self.get_schema().encoding:
+            if attribute.category in _nested_categories and attribute.is_set(self):
+                nested = _nested_revision(attribute.get(self))
+                if nested is None:
+                    return None
+                latest = max(latest, nested)
+        return latest
+
+    def _tracked_encoding(self) -> List[list]:
+        """Gets the [name, key, serialized value, JSON] entry of each attribute, re-encoding only changed attributes."""
+        cache = self.__dict__.get('_parsable_encoded')
+        if cache is None:
+            cache = self.__dict__['_parsable_encoded'] = dict()
+        revisions = self.__dict__.get('_parsable_revisions') or dict()
+        every_attribute = revisions.get(None, 0)
+
+        entries = list()
+        for attribute in self.get_schema().encoding:
+            name = attribute.name
+            key = (attribute.category, max(revisions.get(name, 0), every_attribute))
+            if attribute.category in _nested_categories:
+                nested = _nested_revision(attribute.get(self)) if attribute.is_set(self) else 0
+                key = None if nested is None else key + (nested,)
+
+            entry = cache.get(name)
+            if key is None or entry is None or entry[1] != key:
+                output = dict()
+                attribute.encode(self, output)
+                entry = [name, key, output.get(name, _absent), None]
+                cache[name] = entry
+            entries.append(entry)
+        return entries
+
+    ##########################################################################
+    # Diff and Patch
+    ##########################################################################
+    def diff(self, other: Parsable, **kwargs) -> Parsable:
+        """Computes the changes which turn this Parsable into another one (see 'plugnparse.delta.diff()').
+
+        Args:
+            other: Parsable
+                The Parsable holding the desired values, of the same type as this Parsable.
+            **kwargs:
+                The optional 'rtol' and 'atol' tolerances for numeric values.
+
+        Returns:
+            Parsable:
+                The 'plugnparse.delta.ParsableDelta' holding the changes.
+        """
+        from .delta import diff
+        return diff(self, other, **kwargs)
+
+    def apply_patch(self, delta: Union[Parsable, List[dict]]):
+        """Updates the changed attributes of this Parsable from a delta (see 'plugnparse.delta.apply_patch()').
+
+        Args:
+            delta: Union[Parsable, List[dict]]
+                The 'plugnparse.delta.ParsableDelta' computed by 'diff()', or its list of changes.
+        """
+        from .delta import apply_patch
+        apply_patch(self, delta)
+
+    ##########################################################################
+    # Fingerprints
+    ##########################################################################
+    def fingerprint(self) -> str:
+        """Computes a stable content fingerprint of the parsable attributes.
+
+        Notes:
+            The fingerprint is a hash over the registered attributes in schema order (see 'FingerprintBuilder' for the
+            encoding of each value). Objects which are equal (without tolerances) have the same fingerprint, so objects
+            with different fingerprints can be told apart without comparing them, and fingerprints can be used as cache
+            or deduplication keys.
+
+            The fingerprint is cached along with the attribute values it was computed from, and recomputed once any
+            attribute of this Parsable, or of a nested Parsable, is assigned a different object (e.g. by a property
+            setter). Values which are mutated in place, such as appending to a list or writing into an array, are not
+            observed; call 'invalidate_fingerprint()' or 'mark_changed()' after such changes. The cache holds weak references to the values
+            which support them (e.g. arrays and nested Parsables), so replacing them does not keep them alive; other
+            values (e.g. lists and dicts) are referenced until the fingerprint is recomputed or invalidated.
+
+        Returns:
+            str:
+                The hexadecimal fingerprint.
+        """
+        return self.fingerprint_digest().hex()
+
+    def fingerprint_digest(self) -> bytes:
+        """Gets the fingerprint of the parsable attributes as raw bytes (see 'fingerprint()').
+
+        Returns:
+            bytes:
+                The fingerprint digest.
+        """
+        return self._fingerprint_entry()[2]
+
+    def fingerprint_is_exact(self) -> bool:
+        """Returns whether every attribute value has a canonical fingerprint encoding, i.e. objects with different
+        fingerprints are guaranteed not to be equal."""
+        return self._fingerprint_entry()[3]
+
+    def invalidate_fingerprint(self):
+        """Discards the cached fingerprint, e.g. after an attribute value was mutated in place."""
+        self.__dict__.pop('_parsable_fingerprint', None)
+
+    def cached_fingerprint_digest(self) -> Optional[bytes]:
+        """Gets the cached fingerprint digest if it is up to date and exact, without computing anything.
+
+        Returns:
+            Optional[bytes]:
+                The fingerprint digest, or None if it is not cached, outdated, or inexact.
+        """
+        entry = self.__dict__.get('_parsable_fingerprint')
+        if entry is None or not entry[3] or not self._fingerprint_state_matches(entry[0]) or \
+                not _fingerprint_children_match(entry[1], cached=True):
+            return None
+        return entry[2]
+
+    def _fingerprint_state(self) -> tuple:
+        """Gets the schema and the current value of every registered attribute (or None for unset attributes)."""
+        compiled_schema = self.get_schema()
+        return (compiled_schema, *[attribute.get(self) if attribute.is_set(self) else None
+                                   for attribute in compiled_schema.compiled_attributes])
+
+    def _fingerprint_state_matches(self, state: tuple) -> bool:
+        """Returns whether the schema and the attribute values are the same objects as referenced by the state."""
+        compiled_schema = self.get_schema()
+        attributes = compiled_schema.compiled_attributes
+        if len(attributes) + 1 != len(state) or _dereference(state[0]) is not compiled_schema:
+            return False
+        for index, attribute in enumerate(attributes, 1):
+            value = attribute.get(self) if attribute.is_set(self) else None
+            if value is not _dereference(state[index]):
+                return False
+        return True
+
+    def _fingerprint_entry(self) -> tuple:
+        """Gets the cached (state, children, digest, exact) fingerprint entry, recomputing it when outdated."""
+        entry = self.__dict__.get('_parsable_fingerprint')
+        if entry is not None and self._fingerprint_state_matches(entry[0]) and \
+                _fingerprint_children_match(entry[1], cached=False):
+            return entry
+
+        state = self._fingerprint_state()
+        compiled_schema = state[0]
+        builder = FingerprintBuilder()
+        builder.write_text(self.__class__.__module__ + "." + self.__class__.__qualname__)
+        for attribute, value in zip(compiled_schema.compiled_attributes, state[1:]):
+            builder.write_text(attribute.name)
+            if not attribute.is_set(self):
+                builder.write(b'-')
+                continue
+            if attribute.category == schema.AttributeCategory.Specialized and \
+                    hasattr(self, attribute.name + '_encode'):
+                value = self.__getattribute__(attribute.name + '_encode')()
+            else:
+                builder.write_text(type(value).__module__ + "." + type(value).__qualname__)
+            builder.update(value)
+
+        entry = (tuple(_reference(value) for value in state),
+                 tuple((_reference(child), digest) for child, digest in builder.children), builder.digest(),
+                 builder.exact)
+        self.__dict__['_parsable_fingerprint'] = entry
+        return entry
+
     ##########################################################################
     # Serialization and File IO
     ##########################################################################
@@ -1008,6 +1274,13 @@ class Parsable:
         """
         return self.to_dict()
 
+    def _json_dict(self, backend: io.JsonBackend, kwargs: dict) -> dict:
+        """Serializes this class for a JSON backend, keeping the arrays which the backend encodes natively."""
+        if backend.handles_arrays and backend.supports(kwargs):
+            with binary.keep_arrays():
+                return self.to_dict()
+        return self.to_dict()
+
     def from_json(self, json_object: Union[dict, str]):
         """Populates the internal attributes from a JSON based representation.
 
@@ -1020,13 +1293,22 @@ class Parsable:
             json_object = io.from_json_string(json_object)
         self.from_dict(json_object)
 
-    def save_to_json(self, file_path: Union[str, Path], **kwargs) -> Path:
+    def save_to_json(self, file_path: Union[str, Path], atomic: bool = False, fsync: bool = False, **kwargs) -> Path:
         """Saves the internal representation of this class to a desired file path.
 
+        Notes:
+            A path ending with a compression extension (see 'io.compression_formats') is written compressed, e.g.
+            './foo/bar.gz' is saved as './foo/bar.json.gz'. 'load_from_json()' decompresses such files transparently.
+
         Args:
             file_path: Union[str, Path]
                 A file path like object which must contain at least a directory in its value. Valid inputs take the form
                 './foo/bar.baz' or '/foo/bar'.
+            atomic: bool
+                Whether to write a temporary file which then replaces the file, so that a crash never leaves a partially
+                written file (default: False).
+            fsync: bool
+                Whether to flush the file to the storage device before returning (default: False).
             **kwargs:
                 Additional key-word arguments to provide to the JSON writer.
 
@@ -1046,34 +1328,510 @@ class Parsable:
         file_dir = path.parent
 
         # --- provide proper extension ---
-        full_path = io.to_path(file_dir / path.name).with_suffix(".json")
+        full_path = io.with_file_suffix(file_dir / path.name, ".json")
 
         # --- make the directory ---
         io.create_directories(file_dir)
 
         # --- write the json file ---
-        io.write_to_json_file(full_path, self.to_dict(), **kwargs)
+        io.write_to_json_file(full_path, self._json_dict(io.get_json_backend(), kwargs), atomic, fsync, **kwargs)
 
         return full_path
 
-    def load_from_json(self, file_path: Union[Path, str], **kwargs):
+    @staticmethod
+    def save_many_to_json(directory: Union[str, Path],
+                          parsables: Union[Dict[str, Parsable], Iterable[Tuple[Union[str, Path], Parsable]]],
+                          atomic: bool = True, fsync: bool = False, **kwargs) -> List[Path]:
+        """Saves many Parsables to the JSON files of a directory as a single batch (see 'io.JsonBatchWriter').
+
+        Notes:
+            The directory is created once. In atomic mode, the files only replace existing files once all of them are
+            written, and none of them does if an exception is raised while writing. With 'fsync', the files are made
+            durable together before this returns.
+
+        Args:
+            directory: Union[str, Path]
+                The directory in which the files are written.
+            parsables: Union[Dict[str, Parsable], Iterable[Tuple[Union[str, Path], Parsable]]]
+                The Parsables to save by the names of their files (or their paths relative to the directory).
+            atomic: bool
+                Whether the files only replace their destinations once the whole batch is written (default: True).
+            fsync: bool
+                Whether to flush the files to the storage device before returning (default: False).
+            **kwargs:
+                Additional key-word arguments to provide to the JSON writer.
+
+        Returns:
+            List[Path]:
+                The paths of the written files.
+        """
+        if isinstance(parsables, dict):
+            parsables = parsables.items()
+        backend = io.get_json_backend()
+        with io.JsonBatchWriter(directory, atomic, fsync, **kwargs) as writer:
+            for name, parsable in parsables:
+                writer.write(name, parsable._json_dict(backend, kwargs))
+        return writer.written
+
+    def load_from_json(self, file_path: Union[Path, str], streaming: bool = False, **kwargs):
         """Loads and populates the internal attributes of this subclass from a JSON file.
 
+        Notes:
+            When streaming, the file is read in chunks and every nested Parsable is hydrated as soon as its subtree is
+            complete (see 'io.read_json_file_incrementally()'). The peak memory is then about the hydrated objects plus
+            the dictionary of a single subtree, rather than the dictionaries of the whole document plus the objects.
+            Nested dictionaries holding the 'generic_parsable_type' key are passed to the setters as Parsables.
+
         Args:
             file_path: Union[Path, str]
                 The full path of the JSON file that is to be loaded.
+            streaming: bool
+                Whether to read the file incrementally (default: False).
             **kwargs:
-                Additional key-word arguments to pass into the JSON reader.
+                Additional key-word arguments to pass into the JSON reader. Not supported when streaming.
 
         Raises:
             RuntimeError: If the provided 'file_path' does not point to file that currently exists.
+            ValueError: If key-word arguments are provided when streaming.
         """
         # --- validate the file path ---
         if not io.file_exists(file_path):
             logger.log_and_raise(RuntimeError, "The file path [", file_path, "] does not exist. Cannot load object.")
 
         # --- read the json file ---
-        json_object = io.read_json_file(file_path, **kwargs)
+        if streaming:
+            if kwargs:
+                logger.log_and_raise(ValueError, "The JSON reader arguments [", list(kwargs), "] are not supported "
+                                     "when streaming.")
+            json_object = io.read_json_file_incrementally(file_path, _hydrate_nested_object)
+        else:
+            json_object = io.read_json_file(file_path, **kwargs)
 
         # --- create the python object ---
         self.from_json(json_object)
+
+    def to_binary(self) -> bytes:
+        """Serializes this class to the binary container format, storing NumPy arrays as raw buffers.
+
+        Returns:
+            bytes:
+                The binary container holding a JSON header of the serialized dictionary and the raw buffers of every
+                array (see 'binary.to_bytes()').
+        """
+        with binary.keep_arrays():
+            return binary.to_bytes(self.to_dict())
+
+    def from_binary(self, data: Union[bytes, bytearray, memoryview]):
+        """Populates the internal attributes from the binary container format.
+
+        Notes:
+            Arrays are passed to the property setters as NumPy arrays rather than lists.
+
+        Args:
+            data: Union[bytes, bytearray, memoryview]
+                The binary container created by 'to_binary()' or 'save_to_binary()'.
+        """
+        self.from_dict(binary.from_bytes(data))
+
+    def save_to_binary(self, file_path: Union[str, Path]) -> Path:
+        """Saves this class to a file in the binary container format, without converting arrays to lists.
+
+        Args:
+            file_path: Union[str, Path]
+                A file path like object which must contain at least a directory in its value. Valid inputs take the form
+                './foo/bar.baz' or '/foo/bar'.
+
+        Returns:
+            Path:
+                The full Path object representing the location of the final output file.
+
+        Raises:
+            RuntimeError:
+                If the provided 'file_path' is not formatted correctly.
+        """
+        # --- parse the file path ---
+        path = io.to_path(file_path)
+        if path.name == file_path:
+            logger.log_and_raise(RuntimeError, "The input file_path [", file_path, "] does not contain a directory.")
+
+        file_dir = path.parent
+
+        # --- provide proper extension ---
+        full_path = io.to_path(file_dir / path.name).with_suffix(binary.file_suffix)
+
+        # --- make the directory ---
+        io.create_directories(file_dir)
+
+        # --- write the binary file ---
+        with binary.keep_arrays():
+            binary.write_to_binary_file(full_path, self.to_dict())
+
+        return full_path
+
+    def load_from_binary(self, file_path: Union[Path, str], mmap_mode: Optional[str] = None):
+        """Loads and populates the internal attributes of this subclass from a binary container file.
+
+        Notes:
+            With a 'mmap_mode' the arrays are not read when loading. They are passed to the property setters as views
+            of a memory map of the file, and their data is only read from disk when it is accessed. Setters should then
+            avoid copying arrays (e.g. use 'np.asarray()' rather than 'np.array()').
+
+        Args:
+            file_path: Union[Path, str]
+                The full path of the binary file that is to be loaded.
+            mmap_mode: Optional[str]
+                Either None to read the arrays into memory, or the memory map mode of the arrays: 'r' (read-only),
+                'c' (copy-on-write) or 'r+' (changes are written to the file).
+
+        Raises:
+            RuntimeError: If the provided 'file_path' does not point to file that currently exists.
+        """
+        # --- validate the file path ---
+        if not io.file_exists(file_path):
+            logger.log_and_raise(RuntimeError, "The file path [", file_path, "] does not exist. Cannot load object.")
+
+        # --- read the binary file and create the python object ---
+        self.from_dict(binary.read_binary_file(file_path, mmap_mode=mmap_mode))
+
+    async def asave_to_json(self, file_path: Union[str, Path], atomic: bool = False, fsync: bool = False,
+                            **kwargs) -> Path:
+        """Asynchronously saves this class to a JSON file (see 'save_to_json()').
+
+        Notes:
+            The serialization and the write run on the bounded executor of 'aio.run()', so the event loop is not
+            blocked. This instance should not be modified until the returned coroutine completes.
+
+        Args:
+            file_path: Union[str, Path]
+                A file path like object which must contain at least a directory in its value.
+            atomic: bool
+                Whether to write a temporary file which then replaces the file (default: False).
+            fsync: bool
+                Whether to flush the file to the storage device before returning (default: False).
+            **kwargs:
+                Additional key-word arguments to provide to the JSON writer.
+
+        Returns:
+            Path:
+                The full Path object representing the location of the final output file.
+        """
+        return await aio.run(self.save_to_json, file_path, atomic, fsync, **kwargs)
+
+    async def aload_from_json(self, file_path: Union[Path, str], streaming: bool = False, **kwargs):
+        """Asynchronously loads and populates the internal attributes of this subclass from a JSON file (see
+        'load_from_json()').
+
+        Notes:
+            The read and the hydration run on the bounded executor of 'aio.run()', so the event loop is not blocked.
+            This instance should not be used until the returned coroutine completes.
+
+        Args:
+            file_path: Union[Path, str]
+                The full path of the JSON file that is to be loaded.
+            streaming: bool
+                Whether to read the file incrementally (default: False).
+            **kwargs:
+                Additional key-word arguments to pass into the JSON reader.
+        """
+        await aio.run(self.load_from_json, file_path, streaming, **kwargs)
+
+    async def asave_to_binary(self, file_path: Union[str, Path]) -> Path:
+        """Asynchronously saves this class to a binary container file (see 'save_to_binary()').
+
+        Args:
+            file_path: Union[str, Path]
+                A file path like object which must contain at least a directory in its value.
+
+        Returns:
+            Path:
+                The full Path object representing the location of the final output file.
+        """
+        return await aio.run(self.save_to_binary, file_path)
+
+    async def aload_from_binary(self, file_path: Union[Path, str], mmap_mode: Optional[str] = None):
+        """Asynchronously loads and populates the internal attributes of this subclass from a binary container file
+        (see 'load_from_binary()').
+
+        Args:
+            file_path: Union[Path, str]
+                The full path of the binary file that is to be loaded.
+            mmap_mode: Optional[str]
+                Either None to read the arrays into memory, or the memory map mode of the arrays.
+        """
+        await aio.run(self.load_from_binary, file_path, mmap_mode)
+
+    @classmethod
+    def load_many_from_json(cls, file_paths: Union[str, Path, Iterable[Union[str, Path]]],
+                            throw_if_unable_to_parse: bool = True, executor: Optional[Executor] = None,
+                            max_workers: Optional[int] = None, chunk_size: int = 16, ordered: bool = True,
+                            max_pending_chunks: int = 32) -> Iterator[Tuple[Path, Any]]:
+        """Loads many JSON files concurrently, e.g. the parameter files of a directory.
+
+        Notes:
+            Each task of the executor reads and hydrates a chunk of files. The default thread pool overlaps the file
+            reads, while a 'concurrent.futures.ProcessPoolExecutor' also runs 'from_dict()' on multiple cores, in which
+            case the Parsables must be picklable and their classes importable by the worker processes. Files are
+            hydrated like 'from_dicts()': the class of each file is resolved from its type and module keys, and files
+            without a type key are parsed as this class.
+
+        Args:
+            file_paths: Union[str, Path, Iterable[Union[str, Path]]]
+                Either a directory, whose '.json' files are loaded in sorted order, or the paths of the files to load.
+            throw_if_unable_to_parse: bool
+                If true, throws an exception if a file cannot be parsed, otherwise its dictionary is yielded as is
+                (default: True).
+            executor: Optional[Executor]
+                The executor loading the files. If not provided, a thread pool of 'max_workers' threads is used.
+            max_workers: Optional[int]
+                The number of threads of the default thread pool.
+            chunk_size: int
+                The number of files loaded by each task (default: 16).
+            ordered: bool
+                Whether the files are yielded in the input order, or as soon as they are loaded (default: True).
+            max_pending_chunks: int
+                The maximum number of chunks loaded and not yet consumed (default: 32).
+
+        Yields:
+            Tuple[Path, Any]:
+                The path and the hydrated Parsable of each file.
+        """
+        if isinstance(file_paths, (str, Path)):
+            file_paths = io.list_json_files(file_paths)
+        paths = (io.to_path(file_path) for file_path in file_paths)
+        for chunk, parsables in io.map_in_chunks(_load_json_files, paths, cls, throw_if_unable_to_parse,
+                                                 executor=executor, max_workers=max_workers, chunk_size=chunk_size,
+                                                 ordered=ordered, max_pending_chunks=max_pending_chunks):
+            yield from zip(chunk, parsables)
+
+    ##########################################################################
+    # JSON Lines
+    ##########################################################################
+    @staticmethod
+    def save_to_json_lines(file_path: Union[str, Path], parsables: Iterable[Parsable], append: bool = False,
+                           **kwargs) -> Path:
+        """Saves Parsables to a JSON Lines file, serializing and writing one Parsable at a time.
+
+        Args:
+            file_path: Union[str, Path]
+                A file path like object which must contain at least a directory in its value. Valid inputs take the form
+                './foo/bar.baz' or '/foo/bar'.
+            parsables: Iterable[Parsable]
+                The Parsables to save, e.g. a generator. Only one of them needs to be held in memory at a time.
+            append: bool
+                Whether to append to an existing file instead of overwriting it (default: False).
+            **kwargs:
+                Additional key-word arguments to provide to the JSON writer.
+
+        Returns:
+            Path:
+                The full Path object representing the location of the final output file.
+
+        Raises:
+            RuntimeError:
+                If the provided 'file_path' is not formatted correctly.
+        """
+        # --- parse the file path ---
+        path = io.to_path(file_path)
+        if path.name == file_path:
+            logger.log_and_raise(RuntimeError, "The input file_path [", file_path, "] does not contain a directory.")
+
+        file_dir = path.parent
+
+        # --- provide proper extension ---
+        full_path = io.with_file_suffix(file_dir / path.name, ".jsonl")
+
+        # --- make the directory ---
+        io.create_directories(file_dir)
+
+        # --- write the json lines file ---
+        backend = io.get_json_backend()
+        io.write_json_lines(full_path, (parsable._json_dict(backend, kwargs) for parsable in parsables), append,
+                            **kwargs)
+
+        return full_path
+
+    @classmethod
+    def iterate_from_json_lines(cls, file_path: Union[Path, str], throw_if_unable_to_parse: bool = True,
+                                executor: Optional[Executor] = None, chunk_size: int = 1000,
+                                max_pending_chunks: int = 8) -> Iterator[Any]:
+        """Lazily loads the Parsables of a JSON Lines file, parsing each line as it is reached.
+
+        Notes:
+            Lines are hydrated like 'from_dicts()': the class of each line is resolved from its type and module keys
+            once per distinct class, and lines without a type key are parsed as this class.
+
+            With an 'executor', chunks of raw lines are decoded and parsed by the executor while previous chunks are
+            consumed, keeping at most 'max_pending_chunks' chunks in flight. A 'concurrent.futures.ProcessPoolExecutor'
+            parses on multiple cores, in which case the Parsables must be picklable and their classes importable by the
+            worker processes.
+
+        Args:
+            file_path: Union[Path, str]
+                The full path of the JSON Lines file that is to be loaded.
+            throw_if_unable_to_parse: bool
+                If true, throws an exception if a line cannot be parsed, otherwise its dictionary is yielded as is
+                (default: True).
+            executor: Optional[Executor]
+                The optional executor which parses chunks of lines in parallel.
+            chunk_size: int
+                The number of lines parsed by each task of the executor (default: 1000).
+            max_pending_chunks: int
+                The maximum number of chunks submitted to the executor and not yet consumed (default: 8).
+
+        Returns:
+            Iterator[Any]:
+                The iterator of the hydrated Parsable objects in the order of the lines.
+
+        Raises:
+            RuntimeError:
+                If the provided 'file_path' does not point to file that currently exists (when called), or if a line
+                cannot be parsed and throw_if_unable_to_parse is True (when iterated).
+        """
+        # --- validate the file path when called, rather than on the first iteration ---
+        if not io.file_exists(file_path):
+            logger.log_and_raise(RuntimeError, "The file path [", file_path, "] does not exist. Cannot load objects.")
+        return cls._iterate_from_json_lines(file_path, throw_if_unable_to_parse, executor, chunk_size,
+                                            max_pending_chunks)
+
+    @classmethod
+    def _iterate_from_json_lines(cls, file_path: Union[Path, str], throw_if_unable_to_parse: bool,
+                                 executor: Optional[Executor], chunk_size: int,
+                                 max_pending_chunks: int) -> Iterator[Any]:
+        """Lazily loads the Parsables of an existing JSON Lines file (see 'iterate_from_json_lines()')."""
+        if executor is None:
+            yield from properties.iterate_parsed(io.iterate_json_lines(file_path),
+                                                 throw_if_unable_to_parse=throw_if_unable_to_parse,
+                                                 default_class_type=cls)
+            return
+
+        pending = deque()
+        for chunk in io.iterate_json_lines_chunks(file_path, chunk_size):
+            pending.append(executor.submit(_parse_json_lines, chunk, cls, throw_if_unable_to_parse))
+            if len(pending) >= max_pending_chunks:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    @classmethod
+    def load_from_json_lines(cls, file_path: Union[Path, str], throw_if_unable_to_parse: bool = True,
+                             executor: Optional[Executor] = None, chunk_size: int = 1000,
+                             max_pending_chunks: int = 8) -> List[Any]:
+        """Loads all the Parsables of a JSON Lines file (see 'iterate_from_json_lines()').
+
+        Args:
+            file_path: Union[Path, str]
+                The full path of the JSON Lines file that is to be loaded.
+            throw_if_unable_to_parse: bool
+                If true, throws an exception if a line cannot be parsed, otherwise its dictionary is returned as is
+                (default: True).
+            executor: Optional[Executor]
+                The optional executor which parses chunks of lines in parallel.
+            chunk_size: int
+                The number of lines parsed by each task of the executor (default: 1000).
+            max_pending_chunks: int
+                The maximum number of chunks submitted to the executor and not yet consumed (default: 8).
+
+        Returns:
+            List[Any]:
+                The hydrated Parsable objects in the order of the lines.
+        """
+        return list(cls.iterate_from_json_lines(file_path, throw_if_unable_to_parse, executor, chunk_size,
+                                                max_pending_chunks))
+
+
+##########################################################################
+# Fingerprint Helpers
+##########################################################################
+def _reference(value: Any) -> Any:
+    """Gets a weak reference to a value cached along with a fingerprint, or the value if it does not support them."""
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return value
+
+
+def _dereference(reference: Any) -> Any:
+    """Gets the value of a reference created by '_reference()', or None if the value no longer exists."""
+    return reference() if type(reference) is weakref.ref else reference
+
+
+def _fingerprint_children_match(children: tuple, cached: bool) -> bool:
+    """Returns whether the referenced nested Parsables exist and still have the recorded fingerprint digests."""
+    for reference, digest in children:
+        child = _dereference(reference)
+        if child is None:
+            return False
+        if (child.cached_fingerprint_digest() if cached else child.fingerprint_digest()) != digest:
+            return False
+    return True
+
+
+##########################################################################
+# Change Tracking Helpers
+##########################################################################
+_absent = object()
+_nested_categories = (schema.AttributeCategory.Parsable, schema.AttributeCategory.DictOfParsables,
+                      schema.AttributeCategory.ListOfParsables)
+
+
+def _tracking_setattr(self: Parsable, name: str, value: Any):
+    """Sets an attribute and records the assignment of the attribute (or of the properties declared to own it)."""
+    object.__setattr__(self, name, value)
+    revisions = self.__dict__.get('_parsable_revisions')
+    if revisions is None:
+        revisions = self.__dict__['_parsable_revisions'] = dict()
+    revision = next(_revisions)
+    owners = self._parsable_field_owners.get(name)
+    if owners is None:
+        revisions[name[1:] if name.startswith('_') else name] = revision
+    else:
+        for owner in owners:
+            revisions[owner] = revision
+
+
+def _copy_serialized(value: Any) -> Any:
+    """Copies the dicts and lists of a cached serialized value, so that changes to the copy do not reach the cache."""
+    if type(value) is dict:
+        return {key: _copy_serialized(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_serialized(item) for item in value]
+    return value
+
+
+def _nested_revision(value: Any) -> Optional[int]:
+    """Gets the latest revision of the Parsables held by a value, or None if one of them does not track changes."""
+    if isinstance(value, Parsable):
+        return value.revision()
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set, frozenset)):
+        return 0
+    latest = 0
+    for item in value:
+        nested = _nested_revision(item)
+        if nested is None:
+            return None
+        latest = max(latest, nested)
+    return latest
+
+
+def _parse_json_lines(lines: List[bytes], class_type: type, throw_if_unable_to_parse: bool) -> list:
+    """Decodes and parses a chunk of JSON Lines, as a task of 'Parsable.iterate_from_json_lines()'."""
+    backend = io.get_json_backend()
+    return properties.parse_many([backend.loads(line) for line in lines],
+                                 throw_if_unable_to_parse=throw_if_unable_to_parse,
+                                 default_class_type=class_type)
+
+
+def _hydrate_nested_object(value: dict, depth: int) -> Any:
+    """Hydrates the nested Parsables of a document streamed by 'Parsable.load_from_json()' as they complete."""
+    if depth > 0 and properties.generic_parsable_type in value:
+        return properties.parse(value, throw_if_unable_to_parse=True)
+    return value
+
+
+def _load_json_files(file_paths: List[Path], class_type: type, throw_if_unable_to_parse: bool) -> list:
+    """Reads and hydrates a chunk of JSON files, as a task of 'Parsable.load_many_from_json()'."""
+    return properties.parse_many([io.read_json_file(file_path) for file_path in file_paths],
+                                 throw_if_unable_to_parse=throw_if_unable_to_parse,
+                                 default_class_type=class_type)
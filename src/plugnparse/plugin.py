@@ -1,9 +1,12 @@
 # --- external imports ---
 import abc
-import importlib
-from typing import Optional, Dict, Type, Any, Tuple, Union
+import threading
+from typing import Optional, Type, Any, Tuple, Union, List
 # --- internal imports ---
-from . import properties, logger
+from . import aio, properties, logger, manifest
+from .registry import PluginRegistry, LazyPlugin, get_entry_points, import_module
+
+_registry_lock = threading.Lock()
 
 
 class Plugin(metaclass=abc.ABCMeta):
@@ -35,6 +38,10 @@ class Plugin(metaclass=abc.ABCMeta):
                        dictionary or a property in the specific base Parameters class whose value is the string
                        representation of the module where the desired concrete Plugin class is defined.
 
+        Every Plugin class is registered when it is defined. Each class owns a registry (see `get_registry()`) that
+        holds itself and all of its subclasses, indexed by class name and by (module, class name). Plugins of a module
+        which has not been imported yet are found by importing the module provided alongside the class name.
+
     Examples:
         - An example of a specific base plugin class, `Foo`, with a corresponding base parameters, `FooParameters`.
 
@@ -101,19 +108,31 @@ class Plugin(metaclass=abc.ABCMeta):
 
         ---
     """
-    _registered_plugins: Optional[Dict[str, Type[Any]]] = None
+    _plugin_registry: PluginRegistry
+    entry_point_group: Optional[str] = None
 
     def __init__(self, *args, **kwargs):
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        """Registers the new plugin class in its own registry and in the registries of all its base plugin classes."""
+        super().__init_subclass__(**kwargs)
+        cls.add_registry()
+        for base in cls.__mro__:
+            registry = base.__dict__.get('_plugin_registry')
+            if registry is not None:
+                registry.register(cls)
+
     ##########################################################################
     # Registry Class Methods
     ##########################################################################
     @classmethod
     def add_registry(cls):
-        """Adds an empty dictionary to the internal class type is None is present."""
-        if not hasattr(type(cls), '_registered_plugins'):
-            setattr(type(cls), '_registered_plugins', dict())
+        """Adds an empty registry to this class type if it does not have its own registry."""
+        if '_plugin_registry' not in cls.__dict__:
+            with _registry_lock:
+                if '_plugin_registry' not in cls.__dict__:
+                    cls._plugin_registry = PluginRegistry(cls)
 
     @classmethod
     def has_registry(cls) -> bool:
@@ -123,15 +142,29 @@ class Plugin(metaclass=abc.ABCMeta):
             bool:
                 Returns true if this class instance has an internal registry of plugins, false otherwise.
         """
-        return hasattr(type(cls), '_registered_plugins')
+        return '_plugin_registry' in cls.__dict__
+
+    @classmethod
+    def get_registry(cls) -> PluginRegistry:
+        """Returns the registry holding this class type and all of its subclasses.
+
+        Returns:
+            PluginRegistry:
+                The registry of plugins available from this class type.
+        """
+        if not cls.has_registry():
+            cls.add_registry()
+        return cls.__dict__['_plugin_registry']
 
     @classmethod
-    def has_registered_class(cls, class_name: str) -> bool:
+    def has_registered_class(cls, class_name: str, class_module: Optional[str] = None) -> bool:
         """Returns whether this class type has registered plugin with the provided name.
 
         Args:
             class_name: str
                 The name of the registered plugin.
+            class_module: Optional[str]
+                The optional module in which the registered plugin is defined.
 
         Returns:
             bool:
@@ -139,7 +172,52 @@ class Plugin(metaclass=abc.ABCMeta):
         """
         if not cls.has_registry():
             return False
-        return class_name in type(cls)._registered_plugins
+        return cls.get_registry().contains(class_name, class_module)
+
+    @classmethod
+    def discover_entry_points(cls, group: Optional[str] = None) -> List[str]:
+        """Registers the plugins advertised by an entry point group without importing their modules.
+
+        Notes:
+            Third-party packages can contribute plugins by declaring entry points whose values are of the form
+            'package.module:ClassName', e.g. in their pyproject.toml:
+
+            ---
+
+            [project.entry-points."foo.plugins"]
+            FooA = "foo_extras.plugins:FooA"
+
+            ---
+
+            The module of each plugin is only imported when the plugin is first looked up, constructed or parsed.
+            Classes setting the class attribute `entry_point_group` discover their group automatically the first
+            time a plugin cannot be found in their registry.
+
+        Args:
+            group: Optional[str]
+                The entry point group to discover (default: the `entry_point_group` class attribute).
+
+        Returns:
+            List[str]:
+                The names of the entry points that were registered.
+
+        Raises:
+            RuntimeError:
+                If no group is provided and the class does not define `entry_point_group`.
+        """
+        if group is None:
+            group = cls.entry_point_group
+        if group is None:
+            logger.log_and_raise(RuntimeError, "Unable to discover entry points for class [", cls.__name__,
+                                 "] since no group was provided and it has no 'entry_point_group' class attribute.")
+        registry = cls.get_registry()
+        names = list()
+        for entry_point in get_entry_points(group):
+            lazy_plugin = LazyPlugin.from_entry_point(entry_point)
+            registry.register_lazy(lazy_plugin)
+            names.append(lazy_plugin.name)
+        registry.set_discovered(group)
+        return names
 
     ##########################################################################
     # Class Extraction and Lookup Methods
@@ -179,35 +257,38 @@ class Plugin(metaclass=abc.ABCMeta):
             class_name: str
                 The name of the class to look up.
             class_module: Optional[str]
-                The optional module of the class if the plugin is not currently registered.
+                The optional module of the class if the plugin is not currently registered. If not provided, the
+                entry points (see 'discover_entry_points()') and the active plugin manifests (see
+                'plugnparse.manifest.add_manifest()') are used to find the module.
 
         Returns:
             Optional[Type[Any]]:
                 The class type of the provided class name. None is returned if the class type cannot be found.
         """
-        # -- initialize the registry if it doesn't exist ---
-        if not cls.has_registry():
-            cls.add_registry()
-
         # --- check to see if the class exists already in the registry ---
-        if cls.has_registered_class(class_name):
-            return type(cls)._registered_plugins.get(class_name)
-
-        # --- update the class with its own subclasses ---
-        subclasses = dict()
-        subclasses = properties.get_subclass_map(cls, subclasses)
-
-        # --- check to see if the plugin was in the current classes parent tree ---
-        if class_name in subclasses:
-            type(cls)._registered_plugins.update(**subclasses)
-            return subclasses.get(class_name)
-
-        # --- ensure the class module is provided ---
+        registry = cls.get_registry()
+        class_type = registry.find(class_name, class_module)
+        if class_type is not None:
+            return class_type
+
+        # --- discover the plugins advertised by the entry points of this class ---
+        if cls.entry_point_group is not None and not registry.is_discovered(cls.entry_point_group):
+            cls.discover_entry_points()
+            class_type = registry.find(class_name, class_module)
+            if class_type is not None:
+                return class_type
+
+        # --- without a module, find the module defining the plugin in the active manifests ---
         if class_module is None:
+            for module_name in manifest.find_plugin_modules(class_name, cls):
+                import_module(module_name)
+                class_type = cls.get_registry().find(class_name, module_name)
+                if class_type is not None:
+                    return class_type
             return None
 
-        # --- import the module ---
-        imported_module = importlib.import_module(class_module)
+        # --- import the module, which registers all of the plugins it defines ---
+        imported_module = import_module(class_module)
 
         try:
             # --- extract the class from the module ---
@@ -216,12 +297,6 @@ class Plugin(metaclass=abc.ABCMeta):
             logger.info("Unable to find the class type for [", class_name, "] in module [", class_module, "]")
             return None
 
-        # --- register the class and its subclasses ---
-        subclasses = dict()
-        subclasses = properties.get_subclass_map(cls, subclasses)
-        if class_type.__name__ in subclasses:
-            type(cls)._registered_plugins.update(**subclasses)
-
         # --- return the class ---
         return class_type
 
@@ -457,3 +532,62 @@ class Plugin(metaclass=abc.ABCMeta):
         """
         class_name, module_name = cls.extract_plugin_class_and_module_names(parameters, use_default)
         return cls.parse(class_name, module_name, *args, **kwargs)
+
+    ##########################################################################
+    # Asynchronous Class Creation Methods
+    ##########################################################################
+    @classmethod
+    async def aconstruct_from_parameters(cls, parameters: Union[Any, dict], *args, use_default: bool = False,
+                                         **kwargs) -> Any:
+        """Asynchronously extracts the plugin class name and constructs the class (see 'construct_from_parameters()').
+
+        Notes:
+            The lookup, which may import the plugin module, and the construction run on the bounded executor of
+            'aio.run()', so the event loop is not blocked.
+
+        Args:
+            parameters: Union[Any, dict]
+                The parameters from which the plugin class and module will be extracted.
+            *args:
+                Additional positional arguments passed to the constructor of the class.
+            use_default: bool
+                Indicates whether the property names in the parameters input use generic parsable property names to
+                identify the class and module names (defaults to False).
+            **kwargs:
+                Additional keyword arguments passed to the constructor of the class.
+
+        Returns:
+            Any:
+                The constructed class.
+        """
+        return await aio.run(cls.construct_from_parameters, parameters, *args, use_default=use_default, **kwargs)
+
+    @classmethod
+    async def aparse_from_parameters(cls, parameters: Union[Any, dict], *args, use_default: bool = False,
+                                     **kwargs) -> Any:
+        """Asynchronously extracts the plugin class name, constructs the class and parses in additional information
+        (see 'parse_from_parameters()').
+
+        Notes:
+            The lookup, which may import the plugin module, the construction and the hydration run on the bounded
+            executor of 'aio.run()', so the event loop is not blocked.
+
+        Args:
+            parameters: Union[Any, dict]
+                The parameters from which the plugin class and module will be extracted.
+            *args:
+                Additional positional arguments passed to the constructor of the class.
+            use_default: bool
+                Indicates whether the property names in the parameters input use generic parsable property names to
+                identify the class and module names (defaults to False).
+            **kwargs:
+                The keyword arguments to parse into the constructed class.
+
+        Returns:
+            Any:
+                The constructed class with the additional information parsed into it.
+        """
+        return await aio.run(cls.parse_from_parameters, parameters, *args, use_default=use_default, **kwargs)
+
+
+Plugin.add_registry()
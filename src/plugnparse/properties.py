@@ -1,15 +1,26 @@
 # --- external imports ---
 from enum import Enum
-from typing import List, Optional, Type, Union, Any, Tuple, Callable
+from typing import List, Optional, Type, Union, Any, Tuple, Callable, Iterable, Iterator, Dict
+from collections import OrderedDict
 import importlib
 import inspect
 import functools
+import threading
+import weakref
 # --- local imports ---
 from . import logger
 
 generic_parsable_type = "parsable_type"
 generic_parsable_module = "parsable_module"
 
+# --- cache of resolved (module, class) pairs, see 'resolve_class_type()' ---
+class_type_cache_size = 1024
+_class_type_cache: "OrderedDict[Tuple[str, str], Tuple[Optional[Type[Any]], Optional[BaseException]]]" = OrderedDict()
+_class_type_cache_lock = threading.Lock()
+
+# --- cache of the initialization extractors per class, see 'get_init_argument_extractor()' ---
+_init_extractor_cache: "weakref.WeakKeyDictionary[Type[Any], InitArgumentExtractor]" = weakref.WeakKeyDictionary()
+
 
 ##########################################################################
 # Property Methods and Helpers
@@ -17,6 +28,23 @@ generic_parsable_module = "parsable_module"
 def required_parameter_for_class_init(class_type: Type[Any]) -> List[str]:
     """Returns the required parameter names for initializing the provided class type.
 
+    Notes:
+        The introspection is cached per class type (see 'get_init_argument_extractor()').
+
+    Args:
+        class_type: Type[Any]
+            The class type in which to inspect.
+
+    Returns:
+        List[str]:
+            The list of parameter names that the initialization expects.
+    """
+    return list(get_init_argument_extractor(class_type).required_args)
+
+
+def inspect_required_parameter_for_class_init(class_type: Type[Any]) -> List[str]:
+    """Inspects the initialization signatures of the provided class type and its bases for the required parameters.
+
     Args:
         class_type: Type[Any]
             The class type in which to inspect.
@@ -36,6 +64,95 @@ def required_parameter_for_class_init(class_type: Type[Any]) -> List[str]:
     return list(required_args)
 
 
+class InitArgumentExtractor:
+    """Represents the precompiled extraction of the required initialization arguments of a class type.
+
+    Notes:
+        The extractor records the '__init__' of every class along the method resolution order when it is created. If
+        any of them is replaced, the extractor becomes stale and 'get_init_argument_extractor()' inspects the class
+        again. The '__init__' functions are only weakly referenced since they commonly hold a reference to their class
+        through the 'super()' closure, which would otherwise keep the class alive in the cache.
+    """
+    __slots__ = ('required_args', '_init_references')
+
+    def __init__(self, class_type: Type[Any]):
+        self._init_references = tuple(InitArgumentExtractor._reference(base.__init__) for base in class_type.__mro__)
+        self.required_args: Tuple[str, ...] = tuple(inspect_required_parameter_for_class_init(class_type))
+
+    @staticmethod
+    def _reference(init_function: Any) -> Callable[[], Any]:
+        """Returns a weak reference to the function, or a strong one if it cannot be weakly referenced."""
+        try:
+            return weakref.ref(init_function)
+        except TypeError:
+            return lambda: init_function
+
+    def is_stale(self, class_type: Type[Any]) -> bool:
+        """Returns whether the '__init__' of the class type, or any of its bases, has been replaced.
+
+        Args:
+            class_type: Type[Any]
+                The class type the extractor was created for.
+
+        Returns:
+            bool:
+                True if the extractor no longer matches the initialization of the class type, False otherwise.
+        """
+        mro = class_type.__mro__
+        if len(mro) != len(self._init_references):
+            return True
+        for base, reference in zip(mro, self._init_references):
+            if base.__init__ is not reference():
+                return True
+        return False
+
+    def __call__(self, input_dict: dict) -> dict:
+        """Extracts the required initialization arguments from the dictionary.
+
+        Args:
+            input_dict: dict
+                The dictionary to extract the required arguments from.
+
+        Returns:
+            dict:
+                The mapping of argument names to their values to be used in the initialization function.
+
+        Raises:
+            RuntimeError:
+                If all the required arguments needed for initialization are not specified in the dictionary.
+        """
+        if not self.required_args:
+            return dict()
+        try:
+            return {name: input_dict[name] for name in self.required_args}
+        except KeyError:
+            logger.log_and_raise(RuntimeError, "The required arguments ", list(self.required_args),
+                                 " are not included in the provided arguments ", list(input_dict.keys()), ".")
+
+
+def get_init_argument_extractor(class_type: Type[Any]) -> InitArgumentExtractor:
+    """Gets the cached initialization argument extractor for the provided class type.
+
+    Args:
+        class_type: Type[Any]
+            The class type in which to inspect.
+
+    Returns:
+        InitArgumentExtractor:
+            The extractor of the required initialization arguments. It is created on first use and again whenever the
+            '__init__' of the class type or any of its bases is replaced.
+    """
+    try:
+        extractor = _init_extractor_cache.get(class_type)
+    except TypeError:
+        # --- the class type cannot be weakly referenced ---
+        return InitArgumentExtractor(class_type)
+    if extractor is None or extractor.is_stale(class_type):
+        extractor = InitArgumentExtractor(class_type)
+        _init_extractor_cache[class_type] = extractor
+    return extractor
+
+
 def get_subclass_map(class_type: Type[Any], class_map: dict) -> dict:
     """Returns the subclass map for the provided class type.
 
@@ -209,7 +326,7 @@ def get_class_and_module_strings(input_value: dict,
             msg = logger.error("Unable to use type [", type(parsable_module),
                                "] as a string-based name for loading the parsable module.", record_location=True)
             if throw_if_unable_to_parse:
-                raise RuntimeError(msg)
+                raise RuntimeError(str(msg))
         else:
             module_str = parsable_module
     elif parsable_module_keyword in input_value:
@@ -218,7 +335,7 @@ def get_class_and_module_strings(input_value: dict,
         msg = logger.error("Unable to deduce the module name to load for parsing.", module_str,
                            record_location=True)
         if throw_if_unable_to_parse:
-            raise RuntimeError(msg)
+            raise RuntimeError(str(msg))
 
     # --- find the class to load ---
     if parsable_class is not None:
@@ -226,7 +343,7 @@ def get_class_and_module_strings(input_value: dict,
             msg = logger.error("Unable to use type [", type(parsable_class),
                                "] as a string-based name for loading the parsable class.", record_location=True)
             if throw_if_unable_to_parse:
-                raise RuntimeError(msg)
+                raise RuntimeError(str(msg))
         else:
             class_str = parsable_class
     elif parsable_class_keyword in input_value:
@@ -234,7 +351,7 @@ def get_class_and_module_strings(input_value: dict,
     else:
         msg = logger.error("Unable to deduce the class name to load for parsing.", record_location=True)
         if throw_if_unable_to_parse:
-            raise RuntimeError(msg)
+            raise RuntimeError(str(msg))
 
     return class_str, module_str
 
@@ -282,23 +399,86 @@ def get_class_type(input_value: dict,
                                                              throw_if_unable_to_parse)
         # --- load in the class ---
         if module_str is not None and class_str is not None:
-            try:
-                imported_module = importlib.import_module(module_str)
-                class_type = getattr(imported_module, class_str)
-            except BaseException as error:
+            class_type, error = resolve_class_type(module_str, class_str)
+            if error is not None:
                 msg = logger.error("Unable to construct parsable object [", class_str,
                                    "] in module [", module_str,
                                    "]. Encountered error: [", error, "]", record_location=True)
                 if throw_if_unable_to_parse:
-                    raise RuntimeError(msg)
+                    raise RuntimeError(str(msg))
                 class_type = None
 
     return class_type
 
 
+def resolve_class_type(module_str: str, class_str: str) -> Tuple[Optional[Type[Any]], Optional[BaseException]]:
+    """Imports a module and retrieves a class from it, memoizing the result.
+
+    Notes:
+        Results are kept in a bounded, thread-safe, least recently used cache keyed on the (module, class) pair. Failed
+        lookups caused by a missing module or a missing class are cached as well so that repeated misses do not go
+        through the import machinery again. Use 'clear_class_type_cache()' when modules are reloaded.
+
+    Args:
+        module_str: str
+            The name of the module to import.
+        class_str: str
+            The name of the class to retrieve from the module.
+
+    Returns:
+        Tuple[Optional[Type[Any]], Optional[BaseException]]:
+            The class type, or None, and the error encountered while resolving it, or None, respectively.
+    """
+    key = (module_str, class_str)
+    with _class_type_cache_lock:
+        cached = _class_type_cache.get(key)
+        if cached is not None:
+            _class_type_cache.move_to_end(key)
+            return cached
+
+    try:
+        imported_module = importlib.import_module(module_str)
+        result = (getattr(imported_module, class_str), None)
+    except (ImportError, AttributeError) as error:
+        result = (None, error)
+    except BaseException as error:
+        # --- other failures (e.g. errors raised while executing the module) may be transient, don't cache them ---
+        return None, error
+
+    with _class_type_cache_lock:
+        _class_type_cache[key] = result
+        _class_type_cache.move_to_end(key)
+        while len(_class_type_cache) > max(class_type_cache_size, 0):
+            _class_type_cache.popitem(last=False)
+    return result
+
+
+def clear_class_type_cache(module_str: Optional[str] = None, class_str: Optional[str] = None):
+    """Invalidates entries of the class type cache used by 'resolve_class_type()'.
+
+    Args:
+        module_str: Optional[str]
+            The optional module whose entries are invalidated. If not provided, entries of every module are invalidated.
+        class_str: Optional[str]
+            The optional class name whose entries are invalidated. If not provided, entries of every class are
+            invalidated.
+    """
+    with _class_type_cache_lock:
+        if module_str is None and class_str is None:
+            _class_type_cache.clear()
+            return
+        for key in list(_class_type_cache.keys()):
+            if (module_str is None or key[0] == module_str) and (class_str is None or key[1] == class_str):
+                del _class_type_cache[key]
+
+
 def get_required_arguments_for_init(class_type: Type[Any], input_dict: dict) -> dict:
     """Extracts the required arguments for the initialization function.
 
+    Notes:
+        The required arguments are resolved by the cached extractor of the class type (see
+        'get_init_argument_extractor()').
+
     Args:
         class_type: Type[Any]
             The class type to extract the required arguments for.
@@ -313,11 +493,7 @@ def get_required_arguments_for_init(class_type: Type[Any], input_dict: dict) ->
         RuntimeError:
             If all the required arguments needed for initialization are not specified in the dictionary.
     """
-    required_args = required_parameter_for_class_init(class_type)
-    if not all(arg in input_dict for arg in required_args):
-        logger.log_and_raise(RuntimeError, "The required arguments ", required_args,
-                             " are not included in the provided arguments ", list(input_dict.keys()), ".")
-    return dict((k, input_dict[k]) for k in required_args)
+    return get_init_argument_extractor(class_type)(input_dict)
 
 
 def parse(input_value: dict,
@@ -364,19 +540,177 @@ def parse(input_value: dict,
                                 throw_if_unable_to_parse,
                                 class_type)
     if class_type is not None:
-        try:
-            required_args = get_required_arguments_for_init(class_type, input_value)
-            output = class_type(**required_args)
-            output.from_dict(input_value)
-            input_value = output
-        except BaseException as error:
-            msg = logger.error("Unable to construct parsable object [", class_type,
-                               "]. Encountered error: [", error, "]", record_location=True)
-            if throw_if_unable_to_parse:
-                raise RuntimeError(msg)
+        input_value = construct_and_parse(class_type, input_value, throw_if_unable_to_parse)
     return input_value
 
 
+def construct_and_parse(class_type: Type[Any],
+                        input_value: dict,
+                        throw_if_unable_to_parse: bool = False,
+                        extractor: Optional[InitArgumentExtractor] = None) -> Union[Any, dict]:
+    """Constructs the class type with its required initialization arguments and parses the input dictionary into it.
+
+    Args:
+        class_type: Type[Any]
+            The class type to construct.
+        input_value: dict
+            The dictionary to parse into the constructed class.
+        throw_if_unable_to_parse: bool
+            If true, throws an exception if the dictionary cannot be parsed (default: False).
+        extractor: Optional[InitArgumentExtractor]
+            The optional, previously resolved, initialization argument extractor of the class type (default: the one
+            from 'get_init_argument_extractor()').
+
+    Returns:
+        Union[Any, dict]:
+            The parsed class instance. If the dictionary cannot be parsed and throw_if_unable_to_parse is False, then
+            the input dictionary is returned.
+
+    Raises:
+        RuntimeError:
+            If the dictionary cannot be parsed and throw_if_unable_to_parse is True.
+    """
+    try:
+        if extractor is None:
+            extractor = get_init_argument_extractor(class_type)
+        init_args = extractor(input_value)
+        output = class_type(**init_args)
+        output.from_dict(input_value)
+        return output
+    except BaseException as error:
+        msg = logger.error("Unable to construct parsable object [", class_type,
+                           "]. Encountered error: [", error, "]", record_location=True)
+        if throw_if_unable_to_parse:
+            raise RuntimeError(str(msg))
+    return input_value
+
+
+def parse_many(input_values: Iterable[dict],
+               parsable_module: Optional[str] = None,
+               parsable_class: Optional[str] = None,
+               parsable_module_keyword: str = generic_parsable_module,
+               parsable_class_keyword: str = generic_parsable_type,
+               throw_if_unable_to_parse: bool = False,
+               class_type: Optional[type] = None,
+               default_class_type: Optional[type] = None) -> List[Union[Any, dict]]:
+    """Parses a sequence of input dictionaries, resolving each distinct class only once.
+
+    Notes:
+        This is equivalent to calling 'parse()' on each input dictionary (see 'iterate_parsed()').
+
+    Args:
+        input_values: Iterable[dict]
+            The dictionaries to parse the class information from.
+        parsable_module: Optional[str]
+            The explicit value of the module string to use directly instead of searching in the dictionaries.
+        parsable_class: Optional[str]
+            The explicit value of the class string to use directly instead of searching in the dictionaries.
+        parsable_module_keyword: str
+            The keyword that maps to the module string in the dictionaries (default: generic_parsable_module).
+        parsable_class_keyword: str
+            The keyword that maps to the class string in the dictionaries (default: generic_parsable_type).
+        throw_if_unable_to_parse: bool
+            If true, throws an exception if a class type cannot be found or a dictionary cannot be parsed
+            (default: False).
+        class_type: Optional[Type[Any]]
+            The optional class type to use directly for every dictionary instead of searching.
+        default_class_type: Optional[Type[Any]]
+            The optional class type to use for dictionaries which do not contain the class keyword.
+
+    Returns:
+        List[Union[Any, dict]]:
+            The parsed classes in the same order as the inputs. Dictionaries whose type cannot be found or which cannot
+            be parsed are returned as is when throw_if_unable_to_parse is False.
+
+    Raises:
+        RuntimeError:
+            If a class type cannot be found or a dictionary cannot be parsed and throw_if_unable_to_parse is True.
+    """
+    return list(iterate_parsed(input_values, parsable_module, parsable_class, parsable_module_keyword,
+                               parsable_class_keyword, throw_if_unable_to_parse, class_type, default_class_type))
+
+
+def iterate_parsed(input_values: Iterable[dict],
+                   parsable_module: Optional[str] = None,
+                   parsable_class: Optional[str] = None,
+                   parsable_module_keyword: str = generic_parsable_module,
+                   parsable_class_keyword: str = generic_parsable_type,
+                   throw_if_unable_to_parse: bool = False,
+                   class_type: Optional[type] = None,
+                   default_class_type: Optional[type] = None) -> Iterator[Union[Any, dict]]:
+    """Lazily parses a sequence of input dictionaries, resolving each distinct class only once.
+
+    Notes:
+        This is equivalent to calling 'parse()' on each input dictionary, except that the class type and the required
+        initialization arguments are resolved once per distinct (module, class) pair instead of once per dictionary.
+        Values that are not dictionaries are passed through as is. The inputs are consumed one at a time as the output
+        is iterated, so they can be streamed (e.g. from 'io.iterate_json_lines()').
+
+    Args:
+        input_values: Iterable[dict]
+            The dictionaries to parse the class information from.
+        parsable_module: Optional[str]
+            The explicit value of the module string to use directly instead of searching in the dictionaries.
+        parsable_class: Optional[str]
+            The explicit value of the class string to use directly instead of searching in the dictionaries.
+        parsable_module_keyword: str
+            The keyword that maps to the module string in the dictionaries (default: generic_parsable_module).
+        parsable_class_keyword: str
+            The keyword that maps to the class string in the dictionaries (default: generic_parsable_type).
+        throw_if_unable_to_parse: bool
+            If true, throws an exception if a class type cannot be found or a dictionary cannot be parsed
+            (default: False).
+        class_type: Optional[Type[Any]]
+            The optional class type to use directly for every dictionary instead of searching.
+        default_class_type: Optional[Type[Any]]
+            The optional class type to use for dictionaries which do not contain the class keyword.
+
+    Yields:
+        Union[Any, dict]:
+            The parsed classes in the same order as the inputs. Dictionaries whose type cannot be found or which cannot
+            be parsed are returned as is when throw_if_unable_to_parse is False.
+
+    Raises:
+        RuntimeError:
+            If a class type cannot be found or a dictionary cannot be parsed and throw_if_unable_to_parse is True.
+    """
+    resolved_types: Dict[Tuple[Optional[str], Optional[str]], Optional[Type[Any]]] = dict()
+    resolved_extractors: Dict[Type[Any], InitArgumentExtractor] = dict()
+    for input_value in input_values:
+        if not isinstance(input_value, dict):
+            yield input_value
+            continue
+
+        # --- find the class type, once per distinct module and class ---
+        record_type = class_type
+        if record_type is None:
+            if default_class_type is not None and parsable_class is None and parsable_class_keyword not in input_value:
+                record_type = default_class_type
+            else:
+                class_str, module_str = get_class_and_module_strings(input_value,
+                                                                     parsable_module,
+                                                                     parsable_class,
+                                                                     parsable_module_keyword,
+                                                                     parsable_class_keyword,
+                                                                     throw_if_unable_to_parse)
+                key = (module_str, class_str)
+                if key in resolved_types:
+                    record_type = resolved_types[key]
+                else:
+                    record_type = get_class_type(input_value, module_str, class_str, parsable_module_keyword,
+                                                 parsable_class_keyword, throw_if_unable_to_parse)
+                    resolved_types[key] = record_type
+        if record_type is None:
+            yield input_value
+            continue
+
+        # --- find the initialization argument extractor, once per class ---
+        extractor = resolved_extractors.get(record_type)
+        if extractor is None:
+            extractor = resolved_extractors[record_type] = get_init_argument_extractor(record_type)
+        yield construct_and_parse(record_type, input_value, throw_if_unable_to_parse, extractor)
+
+
 def enum_parse(enum_type: Type[Enum],
                input_value: Union[str, int, List[Union[str, int]]]) -> Union[Optional[Enum], List[Enum]]:
     """Turns a string, integer, or list of strings or integers into the related enums based on the Enum type passed in.
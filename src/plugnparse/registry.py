@@ -0,0 +1,287 @@
+# --- external imports ---
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+import importlib
+import sys
+import threading
+# --- local imports ---
+from . import logger
+
+_module_locks: Dict[str, threading.RLock] = dict()
+_module_locks_lock = threading.Lock()
+
+
+def import_module(module_name: str) -> ModuleType:
+    """Imports a module, serializing concurrent imports of the same module behind a lock scoped to that module.
+
+    Notes:
+        Modules that are already fully imported are returned without taking any lock. Otherwise the first thread
+        imports the module while other threads requesting the same module wait for it, instead of contending on the
+        import machinery or observing a partially initialized module.
+
+    Args:
+        module_name: str
+            The absolute name of the module to import.
+
+    Returns:
+        ModuleType:
+            The imported module.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None and not getattr(getattr(module, '__spec__', None), '_initializing', False):
+        return module
+
+    lock = _module_locks.get(module_name)
+    if lock is None:
+        with _module_locks_lock:
+            lock = _module_locks.setdefault(module_name, threading.RLock())
+    with lock:
+        return importlib.import_module(module_name)
+
+
+def get_entry_points(group: str) -> list:
+    """Returns the installed entry points of a group.
+
+    Args:
+        group: str
+            The name of the entry point group.
+
+    Returns:
+        list:
+            The 'importlib.metadata.EntryPoint' objects of the group.
+    """
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+
+class LazyPlugin:
+    """Represents a plugin advertised by an entry point whose module is only imported when the plugin is first needed.
+
+    Notes:
+        Entry points have values of the form 'package.module:ClassName'. The plugin is indexed by the entry point name
+        and by the class name, so either can be used to look it up.
+    """
+    __slots__ = ('name', 'module', 'attribute')
+
+    def __init__(self, name: str, module: str, attribute: str):
+        self.name = name
+        self.module = module
+        self.attribute = attribute
+
+    @staticmethod
+    def from_entry_point(entry_point: Any) -> "LazyPlugin":
+        """Creates a lazy plugin from an 'importlib.metadata.EntryPoint'.
+
+        Args:
+            entry_point: Any
+                The entry point whose value is of the form 'package.module:ClassName'.
+
+        Returns:
+            LazyPlugin:
+                The lazy plugin.
+        """
+        module, _, attribute = entry_point.value.partition(':')
+        attribute = attribute.split('[')[0].strip()
+        return LazyPlugin(entry_point.name, module.strip(), attribute)
+
+    @property
+    def class_name(self) -> str:
+        """Gets the name of the class advertised by the entry point."""
+        return self.attribute.rsplit('.', 1)[-1]
+
+    def load(self) -> Any:
+        """Imports the module of the plugin and returns the advertised class."""
+        output = import_module(self.module)
+        for part in self.attribute.split('.'):
+            output = getattr(output, part)
+        return output
+
+    def __repr__(self) -> str:
+        return "LazyPlugin(" + self.name + ", " + self.module + ":" + self.attribute + ")"
+
+
+class PluginRegistry:
+    """Represents the index of plugin classes that are available from a specific base plugin class.
+
+    Notes:
+        Every Plugin class owns a registry holding itself and all of its subclasses. Classes are registered
+        incrementally when they are defined (see 'Plugin.__init_subclass__()'), so finding a plugin never requires
+        walking the subclass tree.
+
+        Plugins are indexed both by their class name and by their qualified (module, class name) key. Looking up a name
+        which is shared by plugins of different modules requires the module to disambiguate them. Registering a class
+        with the qualified key of an already registered class (e.g. when a module is reloaded) replaces it.
+
+        The registry is safe to use from multiple threads. Lookups do not take any lock: every index entry is an
+        immutable tuple which writers replace as a whole while holding the registry lock. The lock is never held while
+        importing a module, since the import itself registers classes.
+    """
+
+    def __init__(self, base_type: Type[Any]):
+        self._base_type = base_type
+        self._lock = threading.RLock()
+        self._qualified: Dict[Tuple[str, str], Type[Any]] = dict()
+        self._by_name: Dict[str, Tuple[Type[Any], ...]] = dict()
+        self._lazy: Dict[str, Tuple[LazyPlugin, ...]] = dict()
+        self._discovered_groups: Set[str] = set()
+
+    @staticmethod
+    def qualified_key(class_type: Type[Any]) -> Tuple[str, str]:
+        """Returns the (module, class name) key of the provided class type."""
+        return class_type.__module__, class_type.__name__
+
+    @property
+    def base_type(self) -> Type[Any]:
+        """Gets the base plugin class whose namespace this registry holds."""
+        return self._base_type
+
+    ##########################################################################
+    # Registration
+    ##########################################################################
+    def register(self, class_type: Type[Any]):
+        """Registers a plugin class in this namespace.
+
+        Args:
+            class_type: Type[Any]
+                The plugin class to register.
+        """
+        key = PluginRegistry.qualified_key(class_type)
+        with self._lock:
+            previous = self._qualified.get(key)
+            self._qualified[key] = class_type
+            same_name = tuple(entry for entry in self._by_name.get(key[1], ()) if entry is not previous)
+            self._by_name[key[1]] = same_name + (class_type,)
+
+    def unregister(self, class_type: Type[Any]):
+        """Removes a plugin class from this namespace if it is registered.
+
+        Args:
+            class_type: Type[Any]
+                The plugin class to remove.
+        """
+        key = PluginRegistry.qualified_key(class_type)
+        with self._lock:
+            if self._qualified.get(key) is class_type:
+                del self._qualified[key]
+            for name in [name for name, entries in self._by_name.items() if class_type in entries]:
+                same_name = tuple(entry for entry in self._by_name[name] if entry is not class_type)
+                if same_name:
+                    self._by_name[name] = same_name
+                else:
+                    del self._by_name[name]
+
+    def register_lazy(self, lazy_plugin: LazyPlugin):
+        """Registers a plugin which is only imported when it is first looked up.
+
+        Args:
+            lazy_plugin: LazyPlugin
+                The lazy plugin to register.
+        """
+        with self._lock:
+            for name in {lazy_plugin.name, lazy_plugin.class_name}:
+                same_name = tuple(entry for entry in self._lazy.get(name, ())
+                                  if (entry.module, entry.attribute) != (lazy_plugin.module, lazy_plugin.attribute))
+                self._lazy[name] = same_name + (lazy_plugin,)
+
+    def is_discovered(self, group: str) -> bool:
+        """Returns whether the entry points of a group have been registered in this namespace."""
+        return group in self._discovered_groups
+
+    def set_discovered(self, group: str):
+        """Marks the entry points of a group as registered in this namespace."""
+        with self._lock:
+            self._discovered_groups.add(group)
+
+    ##########################################################################
+    # Lookup
+    ##########################################################################
+    def contains(self, class_name: str, class_module: Optional[str] = None) -> bool:
+        """Returns whether a plugin with the provided name (and module, if provided) is registered."""
+        if class_module is not None:
+            return ((class_module, class_name) in self._qualified or
+                    any(entry.module == class_module for entry in self._lazy.get(class_name, [])))
+        return class_name in self._by_name or class_name in self._lazy
+
+    def find(self, class_name: str, class_module: Optional[str] = None) -> Optional[Type[Any]]:
+        """Finds a registered plugin class.
+
+        Args:
+            class_name: str
+                The name of the plugin class.
+            class_module: Optional[str]
+                The optional module of the plugin class. When provided, the plugin defined in that module is preferred.
+                If no plugin was defined in that module, the plugin with the provided name is only returned if the name
+                is unambiguous (e.g. the module re-exports the class from another module).
+
+        Returns:
+            Optional[Type[Any]]:
+                The plugin class, or None if it is not registered (or ambiguous for the provided module). Plugins
+                registered with 'register_lazy()' are imported by the first lookup that finds them.
+        """
+        if class_module is not None:
+            class_type = self._qualified.get((class_module, class_name))
+            if class_type is not None:
+                return class_type
+
+        candidates = self._by_name.get(class_name)
+        if not candidates:
+            return self._load_lazy(class_name, class_module)
+        if len(candidates) == 1:
+            return candidates[0]
+        if class_module is not None:
+            return None
+        logger.warning("The plugin name [", class_name, "] is registered from the modules ",
+                       [candidate.__module__ for candidate in candidates], " for [", self._base_type.__name__,
+                       "]. Using the most recently registered plugin, provide the module to disambiguate.")
+        return candidates[-1]
+
+    def _load_lazy(self, class_name: str, class_module: Optional[str]) -> Optional[Type[Any]]:
+        """Imports and returns a lazily registered plugin, or None if no lazy plugin matches the name (and module)."""
+        candidates = self._lazy.get(class_name)
+        if class_module is not None and candidates:
+            # --- the requested module is not ignored, plugins from other modules are left to importing it ---
+            candidates = [candidate for candidate in candidates if candidate.module == class_module]
+        if not candidates:
+            return None
+        lazy_plugin = candidates[-1]
+
+        # --- importing the module registers the plugin class when it is defined ---
+        class_type = lazy_plugin.load()
+        with self._lock:
+            for name in {lazy_plugin.name, lazy_plugin.class_name}:
+                remaining = tuple(entry for entry in self._lazy.get(name, ()) if entry is not lazy_plugin)
+                if remaining:
+                    self._lazy[name] = remaining
+                else:
+                    self._lazy.pop(name, None)
+
+            if not (isinstance(class_type, type) and issubclass(class_type, self._base_type)):
+                logger.warning("The entry point [", lazy_plugin, "] does not refer to a subclass of [",
+                               self._base_type.__name__, "].")
+                return None
+            self.register(class_type)
+            if lazy_plugin.name != class_type.__name__:
+                aliases = self._by_name.get(lazy_plugin.name, ())
+                if class_type not in aliases:
+                    self._by_name[lazy_plugin.name] = aliases + (class_type,)
+        return class_type
+
+    def names(self) -> List[str]:
+        """Returns the names of all registered plugin classes, including plugins that are not imported yet."""
+        return list(dict.fromkeys([*self._by_name.keys(), *self._lazy.keys()]))
+
+    def qualified_names(self) -> List[Tuple[str, str]]:
+        """Returns the (module, class name) keys of all registered plugin classes."""
+        return list(self._qualified.keys())
+
+    def __len__(self) -> int:
+        return len(self._qualified)
+
+    def __contains__(self, class_name: str) -> bool:
+        return self.contains(class_name)
+
+    def __repr__(self) -> str:
+        return "PluginRegistry(" + self._base_type.__name__ + ", " + str(len(self)) + " plugins)"
@@ -0,0 +1,410 @@
+# --- external imports ---
+from enum import Enum, auto
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+# --- local imports ---
+from . import binary, logger
+
+
+class AttributeCategory(Enum):
+    """The categories of parsing routines that an attribute of a Parsable can be registered in."""
+    Serializable = auto()
+    Enum = auto()
+    Parsable = auto()
+    Specialized = auto()
+    DictOfParsables = auto()
+    ListOfParsables = auto()
+
+
+# --- the instance lists that hold the registered attributes of each category (in collection order) ---
+category_registries: Tuple[Tuple[AttributeCategory, str], ...] = (
+    (AttributeCategory.Serializable, '_serializable_attributes'),
+    (AttributeCategory.Enum, '_enum_attributes'),
+    (AttributeCategory.Parsable, '_parsable_attributes'),
+    (AttributeCategory.Specialized, '_specialized_attributes'),
+    (AttributeCategory.DictOfParsables, '_dict_of_parsables'),
+    (AttributeCategory.ListOfParsables, '_list_of_parsables'),
+)
+
+# --- the order in which a category is chosen for an attribute when deserializing ---
+decoding_priority: Tuple[AttributeCategory, ...] = (
+    AttributeCategory.Serializable,
+    AttributeCategory.Parsable,
+    AttributeCategory.Enum,
+    AttributeCategory.DictOfParsables,
+    AttributeCategory.ListOfParsables,
+    AttributeCategory.Specialized,
+)
+
+# --- the order in which the categories are written when serializing ---
+encoding_order: Tuple[AttributeCategory, ...] = (
+    AttributeCategory.Serializable,
+    AttributeCategory.Enum,
+    AttributeCategory.Parsable,
+    AttributeCategory.DictOfParsables,
+    AttributeCategory.ListOfParsables,
+    AttributeCategory.Specialized,
+)
+
+# --- the generic Parsable methods which implement each category ---
+encoding_methods: Dict[AttributeCategory, str] = {
+    AttributeCategory.Serializable: 'to_dict_serializable',
+    AttributeCategory.Enum: 'to_dict_enum',
+    AttributeCategory.Parsable: 'to_dict_parsable',
+    AttributeCategory.DictOfParsables: 'to_dict_dict_of_parsable',
+    AttributeCategory.ListOfParsables: 'to_dict_list_of_parsable',
+    AttributeCategory.Specialized: 'to_dict_specialized',
+}
+decoding_methods: Dict[AttributeCategory, str] = {
+    AttributeCategory.Serializable: 'from_dict_serializable',
+    AttributeCategory.Enum: 'from_dict_enum',
+    AttributeCategory.Parsable: 'from_dict_parsable',
+    AttributeCategory.DictOfParsables: 'from_dict_dict_of_parsable',
+    AttributeCategory.ListOfParsables: 'from_dict_list_of_parsable',
+    AttributeCategory.Specialized: 'from_dict_specialized',
+}
+updating_methods: Dict[AttributeCategory, str] = {
+    AttributeCategory.Serializable: 'update_serializable_property',
+    AttributeCategory.Enum: 'update_enum_property',
+    AttributeCategory.Parsable: 'update_parsable_property',
+    AttributeCategory.DictOfParsables: 'update_dict_of_parsable_property',
+    AttributeCategory.ListOfParsables: 'update_list_of_parsable_property',
+    AttributeCategory.Specialized: 'update_specialized_property',
+}
+
+_missing = object()
+
+
+##########################################################################
+# Helpers
+##########################################################################
+def resolve_class_attribute(class_type: Type[Any], name: str) -> Any:
+    """Finds a class attribute along the method resolution order without invoking any descriptors.
+
+    Args:
+        class_type: Type[Any]
+            The class type in which to inspect.
+        name: str
+            The name of the attribute to find.
+
+    Returns:
+        Any:
+            The raw attribute stored in the class dictionary, or an internal sentinel if it is not defined.
+    """
+    for base in class_type.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return _missing
+
+
+def _is_overridden(class_type: Type[Any], method_name: str, base_type: Type[Any]) -> bool:
+    """Checks whether a class replaces the implementation of a method defined on one of its base classes."""
+    return resolve_class_attribute(class_type, method_name) is not resolve_class_attribute(base_type, method_name)
+
+
+def registration_key(instance: Any) -> tuple:
+    """Builds the cache key identifying the class and the attribute registration of a Parsable instance.
+
+    Args:
+        instance: Any
+            The Parsable instance.
+
+    Returns:
+        tuple:
+            A hashable key made from the class type, the registered attributes of every category and the desired
+            order of parsing.
+    """
+    return (type(instance),
+            tuple(instance._serializable_attributes),
+            tuple(instance._enum_attributes),
+            tuple(instance._parsable_attributes),
+            tuple(instance._specialized_attributes),
+            tuple(instance._dict_of_parsables),
+            tuple(instance._list_of_parsables),
+            tuple(instance._desired_order_of_parsing))
+
+
+##########################################################################
+# Compiled Attribute
+##########################################################################
+class CompiledAttribute:
+    """Represents the pre-resolved accessors and parsing routines of a single registered attribute.
+
+    Notes:
+        The property getter, the 'has_' accessor, the setter availability and the 'encode'/'decode' hooks are
+        looked up once on the class. When an attribute cannot be resolved statically (i.e. it is not a property, its
+        'has_' accessor is not a property, or the class overrides the generic category method) the compiled routine
+        simply delegates to the generic Parsable method so that the behaviour is identical.
+    """
+    __slots__ = ('name', 'category', 'fget', 'has_fget', 'settable', 'encoder', 'decoder', 'compiled', 'encode',
+                 'decode')
+
+    def __init__(self, class_type: Type[Any], base_type: Type[Any], name: str, category: AttributeCategory):
+        self.name = name
+        self.category = category
+
+        # --- resolve the accessors ---
+        value_property = resolve_class_attribute(class_type, name)
+        has_property = resolve_class_attribute(class_type, 'has_' + name)
+        encoder = resolve_class_attribute(class_type, name + '_encode')
+        decoder = resolve_class_attribute(class_type, name + '_decode')
+
+        self.fget: Optional[Callable[[Any], Any]] = None
+        self.has_fget: Optional[Callable[[Any], Any]] = None
+        self.settable = False
+        if isinstance(value_property, property):
+            self.fget = value_property.fget
+            self.settable = value_property.fset is not None
+        if isinstance(has_property, property):
+            self.has_fget = has_property.fget
+        self.encoder = encoder if callable(encoder) else None
+        self.decoder = decoder if callable(decoder) else None
+
+        # --- determine whether the attribute can bypass the generic routines ---
+        self.compiled = (self.fget is not None
+                         and (has_property is _missing or self.has_fget is not None)
+                         and resolve_class_attribute(class_type, '__getattr__') is _missing
+                         and not _is_overridden(class_type, encoding_methods[category], base_type)
+                         and not _is_overridden(class_type, decoding_methods[category], base_type))
+        if category == AttributeCategory.Specialized:
+            self.compiled = self.compiled and self.encoder is not None and self.decoder is not None
+
+        # --- bind the dispatch routines ---
+        if not self.compiled:
+            self.encode = self._generic_encode
+            self.decode = self._generic_decode
+        elif category == AttributeCategory.Serializable:
+            self.encode = self._encode_serializable
+            self.decode = self._decode_value
+        elif category == AttributeCategory.Enum:
+            self.encode = self._encode_enum
+            self.decode = self._decode_value
+        elif category == AttributeCategory.Parsable:
+            self.encode = self._encode_parsable
+            self.decode = self._decode_value
+        elif category == AttributeCategory.DictOfParsables:
+            self.encode = self._encode_dict_of_parsables
+            self.decode = self._decode_dict_of_parsables
+        elif category == AttributeCategory.ListOfParsables:
+            self.encode = self._encode_list_of_parsables
+            self.decode = self._decode_list_of_parsables
+        else:
+            self.encode = self._encode_specialized
+            self.decode = self._decode_specialized
+
+    def is_set(self, instance: Any) -> bool:
+        """Returns whether the attribute has a value assigned to it, mirroring the 'has_' accessor semantics."""
+        if self.has_fget is None:
+            return True
+        try:
+            return bool(self.has_fget(instance))
+        except AttributeError:
+            # --- equivalent to 'hasattr()' failing on the 'has_' accessor ---
+            return True
+
+    def get(self, instance: Any) -> Any:
+        """Returns the value of the attribute from the provided instance."""
+        if self.fget is not None:
+            return self.fget(instance)
+        return getattr(instance, self.name)
+
+    ##########################################################################
+    # Generic Routines
+    ##########################################################################
+    def _generic_encode(self, instance: Any, output: dict):
+        getattr(instance, encoding_methods[self.category])(output, self.name)
+
+    def _generic_decode(self, instance: Any, input_value: dict):
+        getattr(instance, decoding_methods[self.category])(input_value, self.name)
+
+    ##########################################################################
+    # Compiled Encoders
+    ##########################################################################
+    def _encode_serializable(self, instance: Any, output: dict):
+        if self.is_set(instance):
+            value = self.fget(instance)
+            if hasattr(value, 'tolist'):
+                value = binary.tolist(value)
+            if isinstance(value, frozenset):
+                value = list(value)
+            output[self.name] = value
+
+    def _encode_enum(self, instance: Any, output: dict):
+        if self.is_set(instance):
+            output[self.name] = self.fget(instance).name
+
+    def _encode_parsable(self, instance: Any, output: dict):
+        if self.is_set(instance):
+            output[self.name] = self.fget(instance).to_dict()
+
+    def _encode_dict_of_parsables(self, instance: Any, output: dict):
+        if self.is_set(instance):
+            item = self.fget(instance)
+            if isinstance(item, dict):
+                output[self.name] = instance.serialized_dict(item)
+
+    def _encode_list_of_parsables(self, instance: Any, output: dict):
+        if self.is_set(instance):
+            item = self.fget(instance)
+            if isinstance(item, (Sequence, set, frozenset)):
+                output[self.name] = instance.serialized_list(list(item))
+
+    def _encode_specialized(self, instance: Any, output: dict):
+        if self.is_set(instance):
+            output[self.name] = self.encoder(instance)
+
+    ##########################################################################
+    # Compiled Decoders
+    ##########################################################################
+    def _decode_value(self, instance: Any, input_value: dict):
+        if self.settable and self.name in input_value:
+            # --- assign through 'setattr' so that any instance level hooks still observe the update ---
+            setattr(instance, self.name, input_value[self.name])
+
+    def _decode_dict_of_parsables(self, instance: Any, input_value: dict):
+        if self.settable and self.name in input_value:
+            value = input_value[self.name]
+            if isinstance(value, dict):
+                value = instance.parsed_dict(value)
+            setattr(instance, self.name, value)
+
+    def _decode_list_of_parsables(self, instance: Any, input_value: dict):
+        if self.settable and self.name in input_value:
+            value = input_value[self.name]
+            if isinstance(value, list):
+                value = instance.parsed_list(value)
+            setattr(instance, self.name, value)
+
+    def _decode_specialized(self, instance: Any, input_value: dict):
+        if self.name in input_value:
+            self.decoder(instance, input_value[self.name])
+
+    def __repr__(self) -> str:
+        return "CompiledAttribute(" + self.name + ", " + self.category.name + ")"
+
+
+##########################################################################
+# Compiled Schema
+##########################################################################
+class ParsableSchema:
+    """Represents the compiled parsing schema of a Parsable subclass with a specific attribute registration.
+
+    Notes:
+        The schema resolves the category of every registered attribute, the order of parsing and the accessors of each
+        attribute once. The resulting flat tables are then used by 'to_dict()', 'from_dict()', 'update()' and
+        'equals()' so that the per call cost is a single loop over pre-bound routines.
+    """
+
+    def __init__(self, instance: Any, base_type: Type[Any]):
+        class_type = type(instance)
+        self._class_type = class_type
+
+        # --- resolve the category for each attribute ---
+        registered = dict()
+        for category, registry in category_registries:
+            registered[category] = list(getattr(instance, registry))
+        self._attributes = tuple(instance.collect_all_attributes())
+
+        entries: Dict[Tuple[str, AttributeCategory], CompiledAttribute] = dict()
+
+        def entry_for(name: str, category: AttributeCategory) -> CompiledAttribute:
+            if (name, category) not in entries:
+                entries[(name, category)] = CompiledAttribute(class_type, base_type, name, category)
+            return entries[(name, category)]
+
+        # --- encoding table ---
+        encoding = list()
+        for category in encoding_order:
+            for name in registered[category]:
+                encoding.append(entry_for(name, category))
+        self._encoding = tuple(encoding)
+
+        # --- decoding table in the order of parsing ---
+        ordered_attributes, unordered_attributes = instance.split_ordered_and_unordered_attributes()
+        decoding = list()
+        for name in (*ordered_attributes, *unordered_attributes):
+            for category in decoding_priority:
+                if name in registered[category]:
+                    decoding.append(entry_for(name, category))
+                    break
+            else:
+                logger.log_and_raise(RuntimeError, "The property [", name, "] doesn't exist!")
+        self._decoding = tuple(decoding)
+
+        # --- lookup by name (the first category matching the decoding priority) ---
+        self._by_name = dict()
+        for entry in self._decoding:
+            self._by_name.setdefault(entry.name, entry)
+        self._compiled_attributes = tuple(self._by_name[name] for name in self._attributes)
+
+    @property
+    def class_type(self) -> Type[Any]:
+        """Gets the Parsable class type the schema was compiled for."""
+        return self._class_type
+
+    @property
+    def attributes(self) -> Tuple[str, ...]:
+        """Gets all the registered attributes in collection order (see 'Parsable.collect_all_attributes()')."""
+        return self._attributes
+
+    @property
+    def compiled_attributes(self) -> Tuple[CompiledAttribute, ...]:
+        """Gets the compiled attribute of each registered attribute, in the order of 'attributes'."""
+        return self._compiled_attributes
+
+    @property
+    def encoding(self) -> Tuple[CompiledAttribute, ...]:
+        """Gets the compiled attributes in the order that they are serialized."""
+        return self._encoding
+
+    @property
+    def decoding(self) -> Tuple[CompiledAttribute, ...]:
+        """Gets the compiled attributes in the order that they are deserialized."""
+        return self._decoding
+
+    def get(self, property_name: str) -> Optional[CompiledAttribute]:
+        """Gets the compiled attribute for a property name, or None if the property is not registered."""
+        return self._by_name.get(property_name)
+
+    def __repr__(self) -> str:
+        return "ParsableSchema(" + self._class_type.__name__ + ", " + str(list(self._attributes)) + ")"
+
+
+_schema_cache: Dict[tuple, ParsableSchema] = dict()
+
+
+def get_schema(instance: Any, base_type: Type[Any]) -> ParsableSchema:
+    """Gets the compiled schema for the provided Parsable instance, compiling it on first use.
+
+    Args:
+        instance: Any
+            The Parsable instance.
+        base_type: Type[Any]
+            The base Parsable class whose generic category methods are used when they are not overridden.
+
+    Returns:
+        ParsableSchema:
+            The cached compiled schema for the class and attribute registration of the instance.
+    """
+    key = registration_key(instance)
+    compiled = _schema_cache.get(key)
+    if compiled is None:
+        compiled = ParsableSchema(instance, base_type)
+        _schema_cache[key] = compiled
+    return compiled
+
+
+def clear_schema_cache(class_type: Optional[Type[Any]] = None):
+    """Clears the compiled schemas.
+
+    Notes:
+        This is only needed if properties or 'encode'/'decode' hooks of a class are replaced at runtime.
+
+    Args:
+        class_type: Optional[Type[Any]]
+            The optional class type whose schemas are cleared. If not provided, every schema is cleared.
+    """
+    if class_type is None:
+        _schema_cache.clear()
+        return
+    for key in [key for key in list(_schema_cache) if key[0] is class_type]:
+        _schema_cache.pop(key, None)
@@ -0,0 +1,105 @@
+# --- external imports ---
+import asyncio
+import threading
+import pytest
+from mock import patch
+import numpy as np
+# --- internal imports ---
+from plugnparse import aio, binary
+from tests.test_parsable import ExampleParsable
+from tests.test_plugin import BaseFoo, FooB
+
+
+class ParsedFoo(ExampleParsable, BaseFoo):
+    pass
+
+
+class TestAio:
+
+    @pytest.fixture
+    def limits(self):
+        yield aio.configure
+        aio.configure()
+
+    def test_parsable_round_trip(self, tmp_path):
+        """Tests that Parsables are saved and loaded asynchronously through JSON and binary files."""
+        example = ExampleParsable(count=3, values=np.arange(4.0), children=[ExampleParsable(values=np.ones(2))])
+
+        async def round_trip():
+            from_json = ExampleParsable()
+            await from_json.aload_from_json(await example.asave_to_json(tmp_path / "example", atomic=True))
+            from_binary = ExampleParsable()
+            await from_binary.aload_from_binary(await example.asave_to_binary(tmp_path / "example"), mmap_mode='r')
+            return from_json, from_binary
+
+        from_json, from_binary = asyncio.run(round_trip())
+        assert from_json.equals(example)
+        assert from_binary.equals(example)
+
+    def test_plugin_construction(self):
+        """Tests that plugins are constructed and parsed asynchronously."""
+        async def construct():
+            return await asyncio.gather(
+                BaseFoo.aconstruct_from_parameters({'foo_type': 'FooB', 'foo_module': FooB.__module__}, value=1),
+                BaseFoo.aparse_from_parameters({'foo_type': 'ParsedFoo', 'foo_module': __name__}, count=2))
+
+        constructed, parsed = asyncio.run(construct())
+        assert isinstance(constructed, FooB) and constructed.kwargs == {'value': 1}
+        assert isinstance(parsed, ParsedFoo) and parsed.count == 2
+
+    def test_pending_jobs_are_bounded(self, limits):
+        """Tests that a burst of jobs never has more than 'max_pending' jobs submitted, while the loop stays free."""
+        limits(max_workers=2, max_pending=3)
+        executor = aio.get_executor()
+        submit = executor.submit
+        lock = threading.Lock()
+        release = threading.Event()
+        counts = {'pending': 0, 'peak': 0}
+
+        def finished(future):
+            with lock:
+                counts['pending'] -= 1
+
+        def counting_submit(*args):
+            with lock:
+                counts['pending'] += 1
+                counts['peak'] = max(counts['peak'], counts['pending'])
+            future = submit(*args)
+            future.add_done_callback(finished)
+            return future
+
+        async def burst():
+            tasks = [asyncio.ensure_future(aio.run(release.wait)) for _ in range(20)]
+            for _ in range(10):
+                await asyncio.sleep(0.01)  # the loop keeps running while the burst waits
+            assert counts['peak'] == 3
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        with patch.object(executor, 'submit', counting_submit):
+            assert asyncio.run(burst()) == [True] * 20
+        assert counts == {'pending': 0, 'peak': 3}
+
+    def test_context_is_copied(self):
+        """Tests that jobs see the context variables of their caller."""
+        async def kept():
+            with binary.keep_arrays():
+                return await aio.run(binary.are_arrays_kept)
+
+        assert asyncio.run(kept())
+        assert not asyncio.run(aio.run(binary.are_arrays_kept))
+
+    def test_invalid_limits(self, limits):
+        """Tests that the limits are validated."""
+        with pytest.raises(ValueError):
+            limits(max_workers=4, max_pending=2)
+        with pytest.raises(ValueError):
+            limits(max_workers=0)
+
+    def test_default_max_pending_covers_workers(self, limits):
+        """Tests that the default number of pending jobs is raised to the number of workers."""
+        limits(max_workers=aio.default_max_pending * 2)
+        assert aio.get_executor()._max_workers == aio.default_max_pending * 2
+        assert aio.__max_pending__ == aio.default_max_pending * 2
+        limits(max_workers=1)
+        assert aio.__max_pending__ == aio.default_max_pending
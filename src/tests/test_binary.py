@@ -0,0 +1,87 @@
+# --- external imports ---
+import pytest
+import numpy as np
+# --- internal imports ---
+from plugnparse import binary
+from tests.test_parsable import ExampleParsable, ExampleEnum
+
+
+class TestBinary:
+
+    @staticmethod
+    def create_example() -> ExampleParsable:
+        return ExampleParsable(count=3, values=np.arange(12.0).reshape(3, 4).T, label=ExampleEnum.Bar, scale=2.0,
+                               child=ExampleParsable(values=np.array([1 + 2j, 3j], dtype=np.complex64)),
+                               children=[ExampleParsable(values=np.arange(5, dtype='>i2'))],
+                               mapping={'a': ExampleParsable(count=4, values=np.zeros((2, 0)))})
+
+    def test_keep_arrays(self):
+        """Tests that arrays are only kept as arrays by 'to_dict()' within the context."""
+        example = self.create_example()
+        assert isinstance(example.to_dict()['values'], list)
+        with binary.keep_arrays():
+            assert binary.are_arrays_kept()
+            output = example.to_dict()
+        assert not binary.are_arrays_kept()
+        assert output['values'] is example.values
+        assert output['child']['values'] is example.child.values
+
+    def test_bytes_round_trip(self):
+        """Tests that arrays keep their dtype, shape and values through the binary container."""
+        example = self.create_example()
+        data = example.to_binary()
+        header_length = int.from_bytes(data[len(binary.magic):len(binary.magic) + 8], 'little')
+        assert (len(binary.magic) + 8 + header_length) % binary.alignment == 0
+
+        loaded = ExampleParsable()
+        loaded.from_binary(data)
+        assert loaded.equals(example)
+        for original, restored in ((example.values, loaded.values), (example.child.values, loaded.child.values),
+                                   (example.children[0].values, loaded.children[0].values),
+                                   (example.mapping['a'].values, loaded.mapping['a'].values)):
+            assert restored.dtype == original.dtype
+            assert restored.shape == original.shape
+            np.testing.assert_array_equal(restored, original)
+        assert loaded.values.flags.writeable
+
+        with pytest.raises(ValueError):
+            binary.from_bytes(b'not a container')
+
+    def test_file_round_trip(self, tmp_path):
+        """Tests that files are read back into writable arrays and that the tolist conversion is not used."""
+        example = self.create_example()
+        path = example.save_to_binary(tmp_path / "example")
+        assert path.suffix == binary.file_suffix
+
+        loaded = ExampleParsable()
+        loaded.load_from_binary(path)
+        assert loaded.equals(example)
+        assert loaded.label == ExampleEnum.Bar
+        assert loaded.scale == 2.0
+        assert loaded.values.flags.writeable
+        assert loaded.values.base is not None
+        assert binary.from_bytes(path.read_bytes()).keys() == example.to_dict().keys()
+
+    def test_memory_mapped_load(self, tmp_path):
+        """Tests that memory mapped arrays are views of the file which honour the mapping mode."""
+        example = self.create_example()
+        path = example.save_to_binary(tmp_path / "example")
+
+        loaded = ExampleParsable()
+        loaded.load_from_binary(path, mmap_mode='r')
+        assert loaded.equals(example)
+        assert not loaded.values.flags.writeable
+        base = loaded.values
+        while not isinstance(base, np.memmap):
+            base = base.base
+        assert base.filename == str(path)
+
+        copied = ExampleParsable()
+        copied.load_from_binary(path, mmap_mode='c')
+        copied.values[0, 0] = -1.0
+        reloaded = ExampleParsable()
+        reloaded.load_from_binary(path)
+        assert reloaded.values[0, 0] == 0.0
+
+        with pytest.raises(ValueError):
+            loaded.load_from_binary(path, mmap_mode='w+')
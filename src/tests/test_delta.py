@@ -0,0 +1,93 @@
+# --- external imports ---
+import numpy as np
+from mock import patch
+# --- internal imports ---
+from plugnparse import delta
+from plugnparse.delta import ParsableDelta
+from tests.test_parsable import ExampleParsable, ExampleEnum, TrackedParsable
+
+
+def create_example(**kwargs) -> ExampleParsable:
+    values = dict(count=3, values=np.arange(100.0), label=ExampleEnum.Foo, scale=2.0,
+                  child=ExampleParsable(count=1), children=[ExampleParsable(count=2), ExampleParsable(count=3)],
+                  mapping={'a': ExampleParsable(count=4), 'b': ExampleParsable(count=5)})
+    values.update(kwargs)
+    return ExampleParsable(**values)
+
+
+class TestDelta:
+
+    def test_diff_of_equal_objects_is_empty(self):
+        """Tests that equal objects produce no changes."""
+        assert len(create_example().diff(create_example())) == 0
+
+    def test_diff_records_minimal_changes(self):
+        """Tests that only the changed scalars, array slices and members are recorded."""
+        old = create_example()
+        values = np.arange(100.0)
+        values[10:12] = -1.0
+        values[50] = -2.0
+        new = create_example(count=4, values=values, label=ExampleEnum.Bar, child=ExampleParsable(count=9),
+                             children=[ExampleParsable(count=2)],
+                             mapping={'a': ExampleParsable(count=4), 'c': ExampleParsable(count=6)})
+        new.child.version = "v2"
+
+        changes = old.diff(new).changes
+        assert {'op': 'set', 'path': ['count'], 'value': 4} in changes
+        assert {'op': 'set', 'path': ['label'], 'value': 'Bar'} in changes
+        assert {'op': 'set', 'path': ['child', 'count'], 'value': 9} in changes
+        assert {'op': 'set', 'path': ['child', 'version'], 'value': 'v2'} in changes
+        assert {'op': 'set_slice', 'path': ['values'], 'start': 10, 'stop': 12, 'value': [-1.0, -1.0]} in changes
+        assert {'op': 'set_slice', 'path': ['values'], 'start': 50, 'stop': 51, 'value': [-2.0]} in changes
+        assert {'op': 'remove', 'path': ['children', 1]} in changes
+        assert {'op': 'remove', 'path': ['mapping', 'b']} in changes
+        assert {'op': 'add', 'path': ['mapping', 'c'], 'value': ExampleParsable(count=6).to_dict()} in changes
+        assert len(changes) == 9
+
+    def test_apply_patch(self):
+        """Tests that applying a delta, also after a string round trip, reproduces the new object."""
+        old = create_example(values=np.arange(12.0).reshape(3, 4))
+        values = np.arange(12.0).reshape(3, 4)
+        values[1, 1:3] = 7.0
+        new = create_example(count=None, values=values, scale=3.0, label=ExampleEnum.Bar,
+                             children=[ExampleParsable(count=2), ExampleParsable(count=8), ExampleParsable(count=1)],
+                             mapping={'b': ExampleParsable(count=5, label=ExampleEnum.Bar)})
+
+        sent = ParsableDelta()
+        sent.from_string(old.diff(new).to_string())
+        original_values = old.values
+        child = old.child
+        with patch.object(ExampleParsable, 'from_dict', autospec=True,
+                          side_effect=ExampleParsable.from_dict) as from_dict_mock:
+            old.apply_patch(sent)
+            # --- only the added list item is parsed ---
+            assert from_dict_mock.call_count == 1
+
+        assert old.equals(new)
+        assert old.child is child
+        assert isinstance(old.values, np.ndarray) and old.values.shape == (3, 4)
+        assert original_values[1, 1] == 5.0
+
+    def test_apply_patch_replaces_nested_parsables(self):
+        """Tests that Parsables nested in lists and dicts can be replaced by values of another type or None."""
+        old = create_example()
+        new = create_example(children=[TrackedParsable(count=7), None], mapping={'a': None, 'b': TrackedParsable()})
+        changes = old.diff(new).changes
+        assert {'op': 'set', 'path': ['children', 1], 'value': None} in changes
+        assert {'op': 'set', 'path': ['mapping', 'a'], 'value': None} in changes
+
+        old.apply_patch(changes)
+        assert old.equals(new)
+        assert isinstance(old.children[0], TrackedParsable) and old.children[1] is None
+        assert old.mapping['a'] is None and isinstance(old.mapping['b'], TrackedParsable)
+
+    def test_array_replaced_when_mostly_changed(self):
+        """Tests that an array with mostly changed elements is replaced as a whole."""
+        changes = delta.diff(create_example(), create_example(values=np.arange(100.0) + 1)).changes
+        assert changes == [{'op': 'set', 'path': ['values'], 'value': (np.arange(100.0) + 1).tolist()}]
+
+    def test_diff_with_tolerance(self):
+        """Tests that changes within the tolerance are not recorded."""
+        new = create_example(values=np.arange(100.0) + 1e-3, scale=2.0001)
+        assert len(delta.diff(create_example(), new, atol=1e-2)) == 0
+        assert len(delta.diff(create_example(), new)) == 2
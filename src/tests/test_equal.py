@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 import numpy as np
+from mock import patch
 
 from plugnparse import Parsable
 from plugnparse.equal import equal
@@ -147,3 +148,66 @@ def test_parsable_equal(a, b, kwargs, expected):
     parsable_b = TestParsable(value=b)
     actual = equal(parsable_a, parsable_b, **kwargs)
     assert actual == expected
+
+
+@pytest.mark.parametrize('a,b,kwargs,expected', [
+    ({"a", ("b", 1), None}, {None, ("b", 1.0), "a"}, {}, True),
+    ({"a", ("b", 1)}, {"a", ("b", 2)}, {}, False),
+    ({("b", 1.0)}, {("b", 1.5)}, {'atol': 1}, True),
+    ({float('nan'), 1}, {float('nan'), 1}, {}, False),
+    ({float('inf'), 1}, {1.0, float('inf')}, {'atol': 0.1}, True),
+    ({-1e300, 1e300}, {1.000001e300, -1.000001e300}, {'rtol': 1e-5}, True),
+    ({-1e300, 1e300}, {1.1e300, -1.1e300}, {'rtol': 1e-5}, False),
+    ({1, "1"}, {"1", 1.05}, {'atol': 0.1}, True),
+    ({1, "1"}, {"1", 1.05}, {}, False),
+])
+def test_sets_equal_buckets(a, b, kwargs, expected):
+    assert equal(a, b, **kwargs) == expected
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'atol': 1e-3}, {'rtol': 1e-6}])
+def test_large_sets_equal(kwargs):
+    a = set(np.linspace(-1000, 1000, 20001).tolist()) | {str(index) for index in range(10000)}
+    b = {value * (1 + 1e-7) + 1e-9 if isinstance(value, float) and kwargs else value for value in a}
+    assert equal(a, b, **kwargs)
+    b.remove("0")
+    b.add("missing")
+    assert not equal(a, b, **kwargs)
+
+
+def test_dicts_equal_uses_exact_keys():
+    assert equal({1: 0.1, "a": [1, 2]}, {"a": [1, 2], 1: 0.1})
+    assert not equal({1: 0.1}, {2: 0.1}, atol=1)
+    assert equal({1: 0.1}, {1: 0.2}, atol=0.1)
+
+
+@pytest.mark.parametrize('a,b,kwargs,expected', [
+    (list(range(100)), list(range(100)), {}, True),
+    (list(range(100)), list(range(1, 101)), {}, False),
+    (list(range(100)), [value + 0.5 for value in range(100)], {'atol': 1}, True),
+    ([0.1 * value for value in range(100)], [0.1 * value * (1 + 1e-6) for value in range(100)], {'rtol': 1e-5}, True),
+    ([0.1 * value for value in range(100)], [0.1 * value * (1 + 1e-6) for value in range(100)], {}, False),
+    ([float('nan')] * 20, [float('nan')] * 20, {}, False),
+    (np.ones((20, 3)).tolist(), np.ones((20, 3)).tolist(), {}, True),
+    (np.ones((20, 3)).tolist(), (np.ones((20, 3)) + 0.1).tolist(), {'atol': 0.2}, True),
+    (np.ones((20, 3)).tolist(), [tuple(row) for row in np.ones((20, 3)).tolist()], {}, False),
+    ([[1.0, 2.0]] * 19 + [[1.0]], [[1.0, 2.0]] * 19 + [[1.0]], {}, True),
+    ([1] * 19 + ["1"], [1] * 19 + ["1"], {}, True),
+    ([1] * 19 + ["1"], [1] * 20, {}, False),
+    ([True] * 20, [True] * 20, {'atol': 1}, True),
+    ([2 ** 53 + 1] + list(range(19)), [2 ** 53] + list(range(19)), {}, False),
+    ([2 ** 53 + 1] * 20, [float(2 ** 53)] * 20, {}, False),
+    ([2 ** 53 + 1] + [0.5] * 19, [2 ** 53] + [0.5] * 19, {}, False),
+    ([2 ** 64 + 1] * 20, [2 ** 64] * 20, {}, False),
+    ([[2 ** 53 + 1]] * 10 + [[0.5]] * 10, [[2 ** 53]] * 10 + [[0.5]] * 10, {}, False),
+])
+def test_iterables_equal_vectorized(a, b, kwargs, expected):
+    assert equal(a, b, **kwargs) == expected
+
+
+def test_numeric_lists_are_compared_at_once():
+    values = np.random.default_rng(0).normal(size=(100, 10)).tolist()
+    with patch('plugnparse.equal.real_numerics_equal') as mock:
+        assert equal(values, [list(row) for row in values], atol=1e-9)
+        assert equal(list(range(2 ** 62, 2 ** 62 + 100)), list(range(2 ** 62, 2 ** 62 + 100)))
+        mock.assert_not_called()
@@ -0,0 +1,380 @@
+# --- external imports ---
+import importlib.util
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from mock import patch
+import pytest
+import numpy as np
+# --- internal imports ---
+from plugnparse import io
+from tests.test_parsable import ExampleParsable, TrackedParsable
+
+has_orjson = importlib.util.find_spec('orjson') is not None
+
+
+class TestJsonBackends:
+
+    @pytest.fixture(params=['json', 'orjson'])
+    def backend(self, request):
+        pytest.importorskip(request.param)
+        previous = io.get_json_backend()
+        yield io.set_json_backend(request.param)
+        io.set_json_backend(previous.name)
+
+    def test_round_trip(self, backend):
+        """Tests that every backend encodes NumPy values and decodes documents of the standard library."""
+        value = {'a': [1, 2.5, None, True], 'b': {'c': "text"}, 'array': np.arange(6.0).reshape(2, 3)[:, ::2],
+                 'scalar': np.int64(3), 'wide': 2 ** 70}
+        decoded = io.from_json_string(io.to_json_string(value))
+        assert decoded['array'] == [[0.0, 2.0], [3.0, 5.0]]
+        assert decoded['scalar'] == 3
+        assert decoded['wide'] == 2 ** 70
+        assert io.from_json_string(json.dumps({'x': float('nan')}))['x'] != 0
+        assert json.loads(io.to_json_string(value, indent=2, sort_keys=True)) == decoded
+        assert io.to_json_string({'a': 1}, separators=(',', '=')) == '{"a"=1}'
+
+    def test_parsable_json(self, backend, tmp_path):
+        """Tests that Parsables with arrays round trip through every backend, including the incremental strings."""
+        example = ExampleParsable(count=3, values=np.arange(4.0), children=[ExampleParsable(values=np.ones(2))])
+        loaded = ExampleParsable()
+        loaded.load_from_json(example.save_to_json(tmp_path / "example", indent=2))
+        assert loaded.equals(example)
+        loaded.from_string(example.to_string())
+        assert loaded.equals(example)
+
+        tracked = TrackedParsable(count=3, values=np.arange(4.0))
+        assert tracked.to_string() == io.to_json_string(tracked.to_dict())
+
+    def test_non_finite_round_trip(self, backend, tmp_path):
+        """Tests that NaN and infinite floats round trip through every backend instead of being written as null."""
+        example = ExampleParsable(values=np.array([1.0, np.nan, np.inf]), children=[ExampleParsable(count=2)])
+        example.children[0].values = [-np.inf, 2.0]
+        from_string, from_file = ExampleParsable(), ExampleParsable()
+        from_string.from_string(example.to_string())
+        from_file.load_from_json(example.save_to_json(tmp_path / "example"))
+        from_lines = next(ExampleParsable.iterate_from_json_lines(
+            ExampleParsable.save_to_json_lines(tmp_path / "examples", [example])))
+        for loaded in (from_string, from_file, from_lines):
+            np.testing.assert_array_equal(loaded.values, [1.0, np.nan, np.inf])
+            assert loaded.values.dtype == np.float64
+            np.testing.assert_array_equal(loaded.children[0].values, [-np.inf, 2.0])
+        assert io.from_json_string(io.to_json_string({'x': np.float32('nan')}))['x'] != 0
+
+    def test_orjson_scans_only_documents_with_null(self):
+        """Tests that orjson output is only scanned for non-finite floats when it holds a null."""
+        pytest.importorskip('orjson')
+        backend = io.OrjsonBackend()
+        with patch.object(io, '_is_finite', wraps=io._is_finite) as mock:
+            assert backend.dumps({'a': np.arange(3.0)}) == '{"a":[0.0,1.0,2.0]}'
+            mock.assert_not_called()
+            assert backend.dumps({'a': None, 'b': 1.0}) == '{"a":null,"b":1.0}'
+            assert mock.call_count == 1
+            assert backend.dumps({'a': np.array([np.nan])}) == '{"a": [NaN]}'
+
+    def test_default_backend(self):
+        """Tests that orjson is selected when it is installed and that the standard library is the fallback."""
+        previous = io.get_json_backend()
+        try:
+            assert io.set_json_backend().name == ('orjson' if has_orjson else 'json')
+            with patch.dict(sys.modules, {'orjson': None}):
+                assert io.set_json_backend().name == 'json'
+            assert io.to_json_string({'a': [1, 2]}) == json.dumps({'a': [1, 2]})
+            assert io.to_json_string({'a': [1, 2]}, separators=(',', ':')) == '{"a":[1,2]}'
+        finally:
+            io.set_json_backend(previous.name)
+
+    def test_set_json_backend(self):
+        """Tests that unknown backends are rejected and that registered backends can be preferred."""
+        previous = io.get_json_backend()
+        with pytest.raises(ValueError):
+            io.set_json_backend('missing')
+
+        class FailingBackend(io.JsonBackend):
+            name = 'failing'
+
+            def __init__(self):
+                raise ImportError("not installed")
+
+        backends = io.json_backends
+        try:
+            io.register_json_backend('failing', FailingBackend, preferred=True)
+            assert list(io.json_backends)[0] == 'failing'
+            assert io.set_json_backend().name != 'failing'
+            with pytest.raises(ImportError):
+                io.set_json_backend('failing')
+        finally:
+            io.json_backends = backends
+            io.set_json_backend(previous.name)
+
+
+class TestJsonLines:
+
+    def test_write_and_iterate(self, tmp_path):
+        """Tests that values are written one per line and read back lazily."""
+        path = tmp_path / "values.jsonl"
+        assert io.write_json_lines(path, ({'index': index} for index in range(3))) == 3
+        assert io.write_json_lines(path, [{'index': 3}], append=True) == 1
+        lines = io.iterate_json_lines(path)
+        assert next(lines) == {'index': 0}
+        assert [value['index'] for value in lines] == [1, 2, 3]
+        assert [len(chunk) for chunk in io.iterate_json_lines_chunks(path, 3)] == [3, 1]
+        with pytest.raises(ValueError):
+            io.write_json_lines(path, [{}], indent=2)
+
+    def test_parsables(self, tmp_path):
+        """Tests that Parsables round trip through JSON Lines, sequentially and with an executor."""
+        examples = [ExampleParsable(count=index, values=np.arange(float(index)),
+                                    children=[TrackedParsable(count=-index)]) for index in range(25)]
+        path = ExampleParsable.save_to_json_lines(tmp_path / "examples", iter(examples))
+        assert path.suffix == ".jsonl"
+
+        loaded = ExampleParsable.iterate_from_json_lines(path)
+        assert next(loaded).equals(examples[0])
+        assert all(item.equals(example) for item, example in zip(loaded, examples[1:]))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            loaded = ExampleParsable.load_from_json_lines(path, executor=executor, chunk_size=4, max_pending_chunks=2)
+        assert len(loaded) == len(examples)
+        assert all(item.equals(example) for item, example in zip(loaded, examples))
+        assert isinstance(loaded[3].children[0], TrackedParsable)
+
+    def test_missing_file_raises_when_called(self, tmp_path):
+        """Tests that a missing JSON Lines file is reported before the iterator is consumed."""
+        with pytest.raises(RuntimeError):
+            ExampleParsable.iterate_from_json_lines(tmp_path / "missing.jsonl")
+
+
+class TestStreamingJson:
+
+    def test_parser_matches_json(self):
+        """Tests that documents split into small chunks are parsed like the standard library parses them."""
+        document = {'a': [{'b': [1, 2.5e-3, -7]}, [[1, 2], []], "x\"y"], 'c': {}, 'd': [], 'e': 12345678901234567890}
+        for text in (json.dumps(document), json.dumps(document, indent=3)):
+            for chunk_size in (1, 3, 64):
+                assert io.JsonStreamParser(StringIO(text), chunk_size=chunk_size).parse() == document
+        for text in ('{"a": 1,}', '[{"a": 1} {}]', '{"a": 1.}', '[1, 2'):
+            with pytest.raises(json.JSONDecodeError):
+                io.JsonStreamParser(StringIO(text), chunk_size=2).parse()
+
+    def test_objects_are_handled_as_they_complete(self):
+        """Tests that every object is passed to the handler once complete, innermost first."""
+        completed = list()
+
+        def handler(value, depth):
+            completed.append((sorted(value), depth))
+            return len(value)
+
+        text = '{"a": [{"b": {}}, {"c": 1, "d": 2}], "e": {"f": 3}}'
+        assert io.JsonStreamParser(StringIO(text), handler, chunk_size=4).parse() == 2
+        assert completed == [([], 3), (['b'], 2), (['c', 'd'], 2), (['f'], 1), (['a', 'e'], 0)]
+
+    def test_streamed_parsables(self, tmp_path):
+        """Tests that nested Parsables are hydrated from the stream before their parents are parsed."""
+        example = ExampleParsable(count=3, values=np.arange(3.0), child=ExampleParsable(count=1),
+                                  children=[ExampleParsable(count=index) for index in range(5)],
+                                  mapping={'a': TrackedParsable(count=4)})
+        path = example.save_to_json(tmp_path / "example")
+        loaded = ExampleParsable()
+        with patch('plugnparse.io.read_json_file') as mock:
+            loaded.load_from_json(path, streaming=True)
+            mock.assert_not_called()
+        assert loaded.equals(example)
+        assert isinstance(loaded.mapping['a'], TrackedParsable)
+        with pytest.raises(ValueError):
+            loaded.load_from_json(path, streaming=True, parse_float=float)
+
+
+class TestBulkLoading:
+
+    def test_read_json_files(self, tmp_path):
+        """Tests that files are listed in sorted order and read in input order or as they complete."""
+        for index in range(10):
+            io.write_to_json_file(tmp_path / f"{index:02d}.json", {'index': index})
+        (tmp_path / "nested").mkdir()
+        io.write_to_json_file(tmp_path / "nested" / "10.json", {'index': 10})
+
+        files = io.list_json_files(tmp_path)
+        assert [file.name for file in files] == [f"{index:02d}.json" for index in range(10)]
+        assert len(io.list_json_files(tmp_path, recursive=True)) == 11
+
+        values = list(io.read_json_files(files, chunk_size=3, max_workers=4))
+        assert [value['index'] for _, value in values] == list(range(10))
+        assert all(path.stem == f"{value['index']:02d}" for path, value in values)
+        unordered = io.read_json_files(files, chunk_size=3, ordered=False)
+        assert sorted(value['index'] for _, value in unordered) == list(range(10))
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_map_in_chunks_bounds_pending_chunks(self, ordered):
+        """Tests that chunks are only submitted as the results are consumed."""
+        pulled = list()
+
+        def items():
+            for index in range(100):
+                pulled.append(index)
+                yield index
+
+        results = io.map_in_chunks(lambda chunk: [item * 2 for item in chunk], items(), chunk_size=2,
+                                   ordered=ordered, max_pending_chunks=3)
+        chunk, values = next(results)
+        assert values == [item * 2 for item in chunk]
+        assert len(pulled) <= 3 * 2
+        results.close()
+        assert len(pulled) <= 3 * 2
+        consumed = list(io.map_in_chunks(lambda chunk: chunk, range(10), chunk_size=3, ordered=ordered,
+                                         max_pending_chunks=2))
+        assert sorted(item for chunk, _ in consumed for item in chunk) == list(range(10))
+
+    def test_load_many_from_json(self, tmp_path):
+        """Tests that a directory of Parsables is loaded with the default thread pool or a provided executor."""
+        examples = [ExampleParsable(count=index, values=np.arange(float(index))) for index in range(12)]
+        for index, example in enumerate(examples):
+            example.save_to_json(tmp_path / f"{index:02d}")
+        TrackedParsable(count=-1).save_to_json(tmp_path / "tracked")
+
+        loaded = list(ExampleParsable.load_many_from_json(tmp_path, chunk_size=5))
+        assert len(loaded) == 13
+        assert all(parsable.equals(example) for (_, parsable), example in zip(loaded, examples))
+        assert isinstance(loaded[-1][1], TrackedParsable)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            loaded = dict(ExampleParsable.load_many_from_json([tmp_path / "03.json", tmp_path / "07.json"],
+                                                             executor=executor, chunk_size=1, ordered=False))
+        assert loaded[tmp_path / "07.json"].count == 7
+
+
+class TestAtomicWrites:
+
+    def test_atomic_write_keeps_previous_file_on_failure(self, tmp_path):
+        """Tests that a failed atomic write leaves the previous file and no temporary file behind."""
+        path = tmp_path / "value.json"
+        io.write_to_json_file(path, {'a': 1}, atomic=True, fsync=True)
+        assert io.read_json_file(path) == {'a': 1}
+        with patch('plugnparse.io.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                io.write_to_json_file(path, {'a': 2}, atomic=True)
+        assert io.read_json_file(path) == {'a': 1}
+        assert [file.name for file in tmp_path.iterdir()] == ["value.json"]
+
+    @pytest.mark.skipif(not hasattr(os, 'fchmod'), reason="file permissions are not supported")
+    def test_atomic_write_file_mode(self, tmp_path):
+        """Tests that atomic writes create files with the default permissions and keep those of replaced files."""
+        umask = os.umask(0o022)
+        try:
+            io.write_to_json_file(tmp_path / "plain.json", {'a': 1})
+            io.write_to_json_file(tmp_path / "atomic.json", {'a': 1}, atomic=True)
+            with io.JsonBatchWriter(tmp_path) as writer:
+                writer.write("batch", {'a': 1})
+            for name in ("plain.json", "atomic.json", "batch.json"):
+                assert (tmp_path / name).stat().st_mode & 0o777 == 0o644
+
+            os.chmod(tmp_path / "atomic.json", 0o640)
+            io.write_to_json_file(tmp_path / "atomic.json", {'a': 2}, atomic=True)
+            assert (tmp_path / "atomic.json").stat().st_mode & 0o777 == 0o640
+        finally:
+            os.umask(umask)
+
+    def test_batch_writer(self, tmp_path):
+        """Tests that a batch is only published when it completes, with a single sync of its directory."""
+        directory = tmp_path / "batch"
+        with io.JsonBatchWriter(directory) as writer:
+            writer.write("a", {'a': 1})
+        assert io.read_json_file(directory / "a.json") == {'a': 1}
+
+        with pytest.raises(RuntimeError):
+            with io.JsonBatchWriter(directory) as writer:
+                writer.write("a", {'a': 2})
+                writer.write("b", {'b': 2})
+                raise RuntimeError("interrupted")
+        assert io.read_json_file(directory / "a.json") == {'a': 1}
+        assert sorted(file.name for file in directory.iterdir()) == ["a.json"]
+
+        with patch('plugnparse.io.fsync_directory') as mock:
+            with io.JsonBatchWriter(directory, fsync=True) as writer:
+                for index in range(5):
+                    writer.write(f"run{index}", {'index': index})
+            mock.assert_called_once_with(directory)
+        assert len(writer.written) == 5
+
+    def test_save_many_to_json(self, tmp_path):
+        """Tests that Parsables saved as a batch can be loaded back."""
+        examples = {f"nested/{index}": ExampleParsable(count=index, values=np.arange(2.0)) for index in range(3)}
+        paths = ExampleParsable.save_many_to_json(tmp_path, examples, fsync=True)
+        assert paths == [tmp_path / "nested" / f"{index}.json" for index in range(3)]
+        loaded = ExampleParsable()
+        loaded.load_from_json(paths[2])
+        assert loaded.equals(examples["nested/2"])
+        assert ExampleParsable(count=1).save_to_json(tmp_path / "single", atomic=True, fsync=True).exists()
+
+
+class TestCompression:
+
+    @pytest.mark.parametrize('suffix', ['.gz', '.bz2', '.xz', '.zst'])
+    def test_compressed_round_trip(self, tmp_path, suffix):
+        """Tests that Parsables are compressed and decompressed according to the file extension."""
+        if not io.compression_formats[suffix].is_available():
+            pytest.skip("The compression module is not installed.")
+        example = ExampleParsable(count=3, values=np.zeros(1000), children=[ExampleParsable(count=1)])
+        path = example.save_to_json(tmp_path / ("example" + suffix), atomic=True)
+        assert path.name == "example.json" + suffix
+        assert path.stat().st_size < len(example.to_string()) / 10
+
+        for streaming in (False, True):
+            loaded = ExampleParsable()
+            loaded.load_from_json(path, streaming=streaming)
+            assert loaded.equals(example)
+        assert io.list_json_files(tmp_path) == [path]
+
+        lines = ExampleParsable.save_to_json_lines(tmp_path / ("examples" + suffix), [example, example])
+        assert lines.name == "examples.jsonl" + suffix
+        assert len(ExampleParsable.load_from_json_lines(lines)) == 2
+
+    def test_file_suffixes(self):
+        """Tests that the extension of a file is replaced before its compression extension."""
+        assert io.with_file_suffix("a/b.txt", ".json") == io.to_path("a/b.json")
+        assert io.with_file_suffix("a/b.gz", ".json") == io.to_path("a/b.json.gz")
+        assert io.with_file_suffix("a/b.json.GZ", ".json") == io.to_path("a/b.json.GZ")
+        assert io.get_compression("a/b.json") is None
+        with patch.dict(io.compression_formats, {'.missing': io.CompressionFormat('missing', ('missing_module',))}):
+            with pytest.raises(ImportError):
+                io.open_file("a/b.json.missing")
+
+
+class TestDirectoryScan:
+
+    @pytest.fixture
+    def runs(self, tmp_path):
+        for index in range(5):
+            run = tmp_path / f"run_{index}"
+            (run / "nested").mkdir(parents=True)
+            (run / "config.json").write_text("{}")
+            os.utime(run, (1000 + index, 1000 + index))
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "other").mkdir()
+        os.utime(tmp_path / "other", (0, 0))
+        return tmp_path
+
+    def test_subdirectories_exclude_files(self, runs):
+        """Tests that only directories are listed as subdirectories."""
+        assert io.get_all_subdirectories_of_directory(runs) == [runs / name for name in
+                                                                 ("other", "run_0", "run_1", "run_2", "run_3",
+                                                                  "run_4")]
+        assert io.get_most_recently_created_subdirectory(runs).parent == runs
+        with pytest.raises(ValueError):
+            io.get_most_recently_created_subdirectory(runs / "other")
+
+    def test_scan_filters(self, runs):
+        """Tests the glob, recursive and type filters of the scan."""
+        assert io.scan_directory(runs, "run_*", files=False) == [runs / f"run_{index}" for index in range(5)]
+        assert io.scan_directory(runs, directories=False) == [runs / "notes.txt"]
+        assert io.scan_directory(runs, "*.json", recursive=True) == [runs / f"run_{index}" / "config.json"
+                                                                     for index in range(5)]
+        assert len(io.scan_directory(runs, "nested", recursive=True)) == 5
+
+    def test_most_recent_entries(self, runs):
+        """Tests that the most recent matching entries are returned from the most to the least recent."""
+        recent = io.get_most_recent_entries(runs, 2, "run_*", time_attribute='st_mtime')
+        assert recent == [runs / "run_4", runs / "run_3"]
+        assert io.get_most_recent_entries(runs, 10, time_attribute='st_mtime')[-1] == runs / "other"
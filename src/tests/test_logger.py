@@ -0,0 +1,86 @@
+# --- external imports ---
+import inspect
+import logging
+import threading
+import pytest
+from mock import patch
+# --- internal imports ---
+from plugnparse import logger
+
+
+class TestLogger:
+
+    ##########################################################################
+    # Test Location Capture
+    ##########################################################################
+    def test_log_and_raise_records_the_calling_location(self):
+        """Tests that the raised message records the file, line and function which called log_and_raise."""
+        with patch.object(inspect, 'stack') as mock:
+            with pytest.raises(ValueError) as error:
+                line = inspect.currentframe().f_lineno + 1
+                logger.log_and_raise(ValueError, "bad value [", 1, "]")
+            mock.assert_not_called()
+        assert str(error.value) == ("\"" + __file__ + ":" + str(line) +
+                                    "\" - in [test_log_and_raise_records_the_calling_location] --- bad value [1]")
+
+    def test_location_capture_can_be_disabled(self):
+        """Tests that no location is recorded while location capture is disabled."""
+        logger.set_location_capture(False)
+        try:
+            assert not logger.is_location_capture_enabled()
+            assert logger.caller_frame() is None
+            with pytest.raises(ValueError) as error:
+                logger.log_and_raise(ValueError, "bad value [", 1, "]")
+            assert str(error.value) == "bad value [1]"
+        finally:
+            logger.set_location_capture(True)
+
+    def test_function_file_line_accepts_frame_info(self):
+        """Tests that function_file_line accepts both frames and 'inspect.FrameInfo' objects."""
+        frame = inspect.currentframe()
+        frame_info, from_frame = inspect.getframeinfo(frame), logger.function_file_line("message", frame)
+        assert logger.function_file_line("message", frame_info) == from_frame
+        assert logger.function_file_line("message").startswith("\"" + __file__ + ":")
+
+    ##########################################################################
+    # Test Queue Backend
+    ##########################################################################
+    def test_queue_logging_formats_on_the_listener_thread(self):
+        """Tests that the queue backend returns the unformatted message and only formats it on the listener thread."""
+        class Recorder(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.emitting = threading.Event()
+                self.records = list()
+                self.messages = list()
+                self.threads = list()
+
+            def emit(self, record):
+                self.emitting.wait(timeout=10)
+                self.records.append(record)
+                self.messages.append(record.getMessage())
+                self.threads.append(threading.current_thread())
+
+        recorder = Recorder()
+        argument = ["unchanged"]
+        logger.enable_queue_logging(handlers=[recorder])
+        try:
+            assert logger.is_queue_logging_enabled()
+            with pytest.raises(RuntimeError):
+                logger.enable_queue_logging()
+            message = logger.warning("argument ", argument, record_location=True)
+            line = inspect.currentframe().f_lineno - 1
+            assert isinstance(message, logger.LogMessage)
+            assert message._message is None
+            argument.append("changed")
+        finally:
+            recorder.emitting.set()
+            logger.disable_queue_logging()
+        assert not logger.is_queue_logging_enabled()
+        assert recorder.records[-1].msg is message
+        assert recorder.threads[-1] is not threading.current_thread()
+        assert recorder.messages[-1:] == [str(message)]
+        assert str(message) == ("\"" + __file__ + ":" + str(line) +
+                                "\" - in [test_queue_logging_formats_on_the_listener_thread] --- argument "
+                                "['unchanged', 'changed']")
+        assert isinstance(logger.warning("synchronous"), str)
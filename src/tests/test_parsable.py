@@ -1,10 +1,14 @@
 # --- external imports ---
+from enum import Enum, auto
+import gc
+import weakref
 import pytest
 from mock import patch, MagicMock
 import numpy as np
 # --- internal imports ---
-from plugnparse import Parsable
-from plugnparse import properties
+from plugnparse import Parsable, enum_setter, parsable_setter
+from plugnparse import io, properties
+from plugnparse.fingerprint import FingerprintBuilder
 
 
 class TestParsable:
@@ -156,3 +160,377 @@ class TestParsable:
             else:
                 with pytest.raises(error):
                     ordered_output, unordered_output = parsable_class.split_ordered_and_unordered_attributes()
+
+    ##########################################################################
+    # Test Compiled Schema
+    ##########################################################################
+    def test_schema_is_cached_per_registration(self):
+        """Tests that the compiled schema is shared by instances with the same attribute registration."""
+        first = ExampleParsable()
+        second = ExampleParsable()
+        assert first.get_schema() is second.get_schema()
+        assert first.get_schema().attributes == tuple(first.collect_all_attributes())
+
+        # --- a different registration produces a different schema ---
+        second._serializable_attributes.append('tags')
+        assert first.get_schema() is not second.get_schema()
+
+    def test_schema_round_trip(self):
+        """Tests that the compiled to_dict/from_dict routines round trip every category."""
+        original = ExampleParsable(count=3, values=np.arange(3.0), label=ExampleEnum.Bar, scale=2.0,
+                                   child=ExampleParsable(count=1), children=[ExampleParsable(count=2)],
+                                   mapping={'a': ExampleParsable(count=4)})
+        output = original.to_dict()
+        assert output['values'] == [0.0, 1.0, 2.0]
+        assert output['label'] == 'Bar'
+        assert output['scale'] == {'value': 2.0}
+        assert 'version' not in output
+
+        parsed = ExampleParsable()
+        parsed.from_dict(output)
+        assert parsed.equals(original)
+        assert parsed.to_dict() == output
+
+    def test_schema_respects_overridden_category_methods(self):
+        """Tests that an overridden generic category method is still used by the compiled routines."""
+        class OverriddenParsable(ExampleParsable):
+
+            def from_dict_serializable(self, input_value: dict, property_name: str):
+                if property_name == 'count':
+                    self.count = input_value.get('count', 0) + 1
+                else:
+                    super().from_dict_serializable(input_value, property_name)
+
+        parsed = OverriddenParsable()
+        parsed.from_dict({'count': 1, 'version': 'v1'})
+        assert parsed.count == 2
+        assert parsed.version == 'v1'
+
+    def test_schema_invalid_order_raises(self):
+        """Tests that an ordered attribute which is not registered raises when compiling the schema."""
+        parsable_class = ExampleParsable()
+        parsable_class._desired_order_of_parsing.append('missing')
+        with pytest.raises(ValueError):
+            parsable_class.from_dict({})
+
+    ##########################################################################
+    # Test Fingerprints
+    ##########################################################################
+    @staticmethod
+    def create_example(**kwargs) -> "ExampleParsable":
+        values = dict(count=3, values=np.array([0.0, -0.0, np.nan]), label=ExampleEnum.Bar, scale=2.0,
+                      child=ExampleParsable(count=1), children=[ExampleParsable(count=2)],
+                      mapping={'a': ExampleParsable(count=4), 'b': ExampleParsable(count=5)})
+        values.update(kwargs)
+        return ExampleParsable(**values)
+
+    def test_fingerprint_of_equal_objects(self):
+        """Tests that equal objects have the same fingerprint, regardless of dict order, -0.0 and NaN payloads."""
+        first = self.create_example()
+        second = self.create_example(values=np.array([0.0, 0.0, -np.nan]),
+                                     mapping={'b': ExampleParsable(count=5), 'a': ExampleParsable(count=4)})
+        assert first.equals(second)
+        assert first.fingerprint() == second.fingerprint()
+        assert first.fingerprint_is_exact()
+        assert first.fingerprint() != self.create_example(values=np.array([0.0, 0.0, 1.0])).fingerprint()
+        assert first.fingerprint() != self.create_example(count=3.5).fingerprint()
+
+    def test_fingerprint_is_cached_and_invalidated_by_setters(self):
+        """Tests that the fingerprint is only recomputed after a setter of the object or of a nested object runs."""
+        example = self.create_example()
+        original = example.fingerprint()
+        with patch('plugnparse.parsable.FingerprintBuilder', wraps=FingerprintBuilder) as mock:
+            assert example.fingerprint() == original
+            mock.assert_not_called()
+
+            example.children[0].count = 7
+            changed = example.fingerprint()
+            assert changed != original
+            assert mock.call_count == 2
+
+        example.children[0].count = 2
+        assert example.fingerprint() == original
+        example.values[0] = 5.0
+        assert example.fingerprint() == original
+        example.invalidate_fingerprint()
+        assert example.fingerprint() != original
+
+    def test_equals_uses_cached_fingerprints(self):
+        """Tests that objects with different up to date fingerprints are not compared attribute by attribute."""
+        first = self.create_example(values=np.arange(3.0))
+        second = self.create_example(values=np.arange(3.0), count=4)
+        assert first.cached_fingerprint_digest() is None
+        first.fingerprint()
+        second.fingerprint()
+        with patch('plugnparse.parsable.equal') as mock:
+            assert not first.equals(second)
+            mock.assert_not_called()
+        assert first.equals(self.create_example(values=np.arange(3.0)))
+        assert first.equals(second, atol=1)
+        assert not first.equals(second, use_fingerprints=False)
+
+    def test_equals_after_in_place_changes(self):
+        """Tests that values mutated in place after fingerprinting are compared by content once they are marked."""
+        first = self.create_example(values=np.arange(3.0))
+        second = self.create_example(values=np.array([0.0, 5.0, 2.0]))
+        first.fingerprint()
+        second.fingerprint()
+        second.values[1] = 1.0
+        assert first.equals(second, use_fingerprints=False)
+        second.mark_changed('values')
+        assert second.cached_fingerprint_digest() is None
+        assert first.equals(second)
+
+    def test_fingerprint_does_not_keep_replaced_values_alive(self):
+        """Tests that the cached fingerprint only weakly references the arrays and Parsables it was computed from."""
+        example = self.create_example()
+        original = example.fingerprint()
+        values, child = weakref.ref(example.values), weakref.ref(example.child)
+        example.values = np.array([0.0, 0.0, np.nan])
+        example.child = ExampleParsable(count=1)
+        gc.collect()
+        assert values() is None and child() is None
+        assert example.cached_fingerprint_digest() is None
+        assert example.fingerprint() == original
+
+    ##########################################################################
+    # Test Change Tracking
+    ##########################################################################
+    @staticmethod
+    def create_tracked(**kwargs) -> "TrackedParsable":
+        values = dict(count=3, values=np.arange(4.0), label=ExampleEnum.Bar, scale=2.0,
+                      child=TrackedParsable(count=1), children=[TrackedParsable(count=2)],
+                      mapping={'a': TrackedParsable(count=4)})
+        values.update(kwargs)
+        return TrackedParsable(**values)
+
+    def test_to_dict_encodes_changed_attributes(self):
+        """Tests that a tracked Parsable only re-encodes the attributes which changed since the last serialization."""
+        example = self.create_tracked()
+        output = example.to_dict()
+        with patch.object(TrackedParsable, 'track_changes', False):
+            assert io.to_json_string(output) == io.to_json_string(example.to_dict())
+        assert ExampleParsable().revision() is None
+
+        revision = example.revision()
+        encodes = TrackedParsable.scale_encodes
+        example.to_dict()
+        assert TrackedParsable.scale_encodes == encodes
+
+        example.count = 5
+        assert example.revision() > revision
+        assert example.to_dict()['count'] == 5
+        assert TrackedParsable.scale_encodes == encodes
+
+        example.scale = 3.0
+        assert example.to_dict()['scale'] == {'value': 3.0}
+        assert TrackedParsable.scale_encodes == encodes + 1
+
+        example.mark_changed()
+        example.to_dict()
+        assert TrackedParsable.scale_encodes == encodes + 2
+
+    def test_to_dict_returns_fresh_containers(self):
+        """Tests that changing the dictionary returned by a tracked Parsable does not change its later outputs."""
+        example = self.create_tracked()
+        output = example.to_dict()
+        output['values'].append(99)
+        output['scale']['value'] = 5.0
+        output['children'][0]['count'] = 8
+        output = example.to_dict()
+        assert output['values'] == [0.0, 1.0, 2.0, 3.0]
+        assert output['scale'] == {'value': 2.0}
+        assert output['children'][0]['count'] == 2
+
+    def test_to_dict_tracks_nested_changes(self):
+        """Tests that changes of nested Parsables, and in place changes marked explicitly, are serialized."""
+        example = self.create_tracked()
+        example.to_dict()
+        example.children[0].count = 7
+        example.mapping['a'].update_property(8, 'count')
+        output = example.to_dict()
+        assert output['children'][0]['count'] == 7
+        assert output['mapping']['a']['count'] == 8
+
+        example.values[0] = 9.0
+        assert example.to_dict()['values'][0] == 0.0
+        example.mark_changed('values')
+        assert example.to_dict()['values'][0] == 9.0
+
+        example.child = ExampleParsable(count=6)
+        assert example.revision() is None
+        assert example.to_dict()['child']['count'] == 6
+        example.child.count = 10
+        assert example.to_dict()['child']['count'] == 10
+
+    def test_to_dict_tracks_setters_with_other_backing_fields(self):
+        """Tests that assignments to a field which is not named after its property mark the property as changed."""
+        example = WeightedParsable(count=1, weight=2.0)
+        assert example.to_dict()['weight'] == 2.0
+        example.update_property(3, 'weight')
+        assert example.to_dict()['weight'] == 3.0
+        example.reset_weight()
+        assert example.to_dict()['weight'] == 1.0
+        assert example.to_string() == io.to_json_string(example.to_dict())
+
+    def test_to_string_matches_to_dict(self):
+        """Tests that the incremental JSON string of a tracked Parsable matches the JSON of its dictionary."""
+        example = self.create_tracked(label=None)
+        assert example.to_string() == io.to_json_string(example.to_dict())
+        example.count = 11
+        example.children[0].label = ExampleEnum.Foo
+        assert example.to_string() == io.to_json_string(example.to_dict())
+        assert example.to_string(indent=2) == io.to_json_string(example.to_dict(), indent=2)
+
+
+class ExampleEnum(Enum):
+    Foo = auto()
+    Bar = auto()
+
+
+class ExampleParsable(Parsable):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['count', 'values'])
+        self._enum_attributes.extend(['label'])
+        self._parsable_attributes.extend(['child'])
+        self._specialized_attributes.extend(['scale'])
+        self._dict_of_parsables.extend(['mapping'])
+        self._list_of_parsables.extend(['children'])
+
+        self.count = kwargs.get('count')
+        self.values = kwargs.get('values')
+        self.label = kwargs.get('label')
+        self.child = kwargs.get('child')
+        self.scale = kwargs.get('scale')
+        self.mapping = kwargs.get('mapping')
+        self.children = kwargs.get('children')
+
+    @property
+    def has_count(self):
+        return self._count is not None
+
+    @property
+    def count(self):
+        return self._count
+
+    @count.setter
+    def count(self, value):
+        self._count = value
+
+    @property
+    def has_values(self):
+        return self._values is not None
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, value):
+        self._values = None if value is None else np.asarray(value)
+
+    @property
+    def has_label(self):
+        return self._label is not None
+
+    @property
+    def label(self):
+        return self._label
+
+    @label.setter
+    @enum_setter(ExampleEnum)
+    def label(self, value):
+        self._label = value
+
+    @property
+    def has_child(self):
+        return self._child is not None
+
+    @property
+    def child(self):
+        return self._child
+
+    @child.setter
+    @parsable_setter()
+    def child(self, value):
+        self._child = value
+
+    @property
+    def has_scale(self):
+        return self._scale is not None
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @scale.setter
+    def scale(self, value):
+        self._scale = value
+
+    def scale_encode(self):
+        return {'value': self.scale}
+
+    def scale_decode(self, input_value):
+        self.scale = input_value.get('value')
+
+    @property
+    def has_mapping(self):
+        return self._mapping is not None
+
+    @property
+    def mapping(self):
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, value):
+        self._mapping = value
+
+    @property
+    def has_children(self):
+        return self._children is not None
+
+    @property
+    def children(self):
+        return self._children
+
+    @children.setter
+    def children(self, value):
+        self._children = value
+
+
+class TrackedParsable(ExampleParsable):
+    track_changes = True
+    scale_encodes = 0
+
+    def scale_encode(self):
+        TrackedParsable.scale_encodes += 1
+        return super().scale_encode()
+
+
+class WeightedParsable(TrackedParsable):
+    field_owners = {'_stored_weight': 'weight'}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['weight'])
+        self.weight = kwargs.get('weight')
+
+    @property
+    def has_weight(self):
+        return self._stored_weight is not None
+
+    @property
+    def weight(self):
+        return self._stored_weight
+
+    @weight.setter
+    def weight(self, value):
+        self._stored_weight = value
+
+    def update_weight(self, value):
+        self._stored_weight = None if value is None else float(value)
+
+    def reset_weight(self):
+        self._stored_weight = 1.0
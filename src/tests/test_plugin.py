@@ -0,0 +1,182 @@
+# --- external imports ---
+import abc
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+import pytest
+from mock import patch
+# --- internal imports ---
+from plugnparse import Plugin
+from plugnparse import properties, manifest, plugin
+
+
+class BaseFoo(Plugin, abc.ABC):
+    plugin_property_name = 'foo_type'
+    plugin_module_property_name = 'foo_module'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.kwargs = kwargs
+
+
+class FooA(BaseFoo):
+    pass
+
+
+class FooB(FooA):
+    pass
+
+
+class EntryPointFoo(BaseFoo):
+    entry_point_group = 'test.foo.plugins'
+
+
+class BaseBar(Plugin, abc.ABC):
+    pass
+
+
+class BarA(BaseBar):
+    pass
+
+
+class TestPlugin:
+
+    ##########################################################################
+    # Test Registry
+    ##########################################################################
+    def test_subclasses_are_registered_on_definition(self):
+        """Tests that each plugin class is registered in its own and its bases' namespaces."""
+        assert BaseFoo.has_registry()
+        assert BaseFoo.has_registered_class('FooA')
+        assert BaseFoo.has_registered_class('FooB', __name__)
+        assert FooA.has_registered_class('FooB')
+        assert not FooB.has_registered_class('FooA')
+        assert Plugin.has_registered_class('BarA')
+
+    def test_namespaces_are_separate(self):
+        """Tests that a base plugin class cannot find the plugins of another base plugin class."""
+        assert BaseFoo.get_class('BarA', None) is None
+        assert BaseBar.get_class('BarA', None) is BarA
+        with pytest.raises(RuntimeError):
+            BaseBar.lookup('FooA', None)
+
+    def test_lookup_does_not_walk_the_subclass_tree(self):
+        """Tests that looking up a registered plugin does not rebuild the subclass map."""
+        with patch.object(properties, 'get_subclass_map') as mock:
+            assert BaseFoo.lookup('FooB', __name__) is FooB
+            assert BaseFoo.lookup('FooA', None) is FooA
+            mock.assert_not_called()
+
+    def test_duplicate_names_are_qualified(self):
+        """Tests that plugins with the same name in different modules do not collide."""
+        duplicate = type('FooA', (BaseFoo,), {'__module__': 'other.module'})
+        try:
+            assert BaseFoo.get_class('FooA', __name__) is FooA
+            assert BaseFoo.get_class('FooA', 'other.module') is duplicate
+            assert set(BaseFoo.get_registry().qualified_names()) >= {(__name__, 'FooA'), ('other.module', 'FooA')}
+        finally:
+            for registry_owner in (Plugin, BaseFoo, duplicate):
+                registry_owner.get_registry().unregister(duplicate)
+        assert BaseFoo.get_class('FooA', None) is FooA
+
+    def test_construct_from_parameters(self):
+        """Tests constructing a plugin from a parameters dictionary."""
+        plugin = BaseFoo.construct_from_parameters({'foo_type': 'FooB', 'foo_module': __name__}, value=1)
+        assert isinstance(plugin, FooB)
+        assert plugin.kwargs == {'value': 1}
+
+    ##########################################################################
+    # Test Manifest
+    ##########################################################################
+    def test_manifest_imports_only_the_needed_module(self, tmp_path, monkeypatch):
+        """Tests that a saved manifest lets a plugin be found by name, importing only its module."""
+        package = tmp_path / "manifest_plugins"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        for name in ("first", "second"):
+            (package / (name + ".py")).write_text(
+                "from tests.test_plugin import BaseFoo\n\n\n"
+                "class " + name.title() + "Foo(BaseFoo):\n"
+                "    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        # --- build and save the manifest, then forget about the scanned modules ---
+        built = manifest.build_plugin_manifest(["manifest_plugins"], base_type=BaseFoo)
+        assert sorted(entry['name'] for entry in built.plugins) == ['FirstFoo', 'SecondFoo']
+        manifest_path = built.save_to_json(tmp_path / "plugins")
+        for module_name in ("manifest_plugins", "manifest_plugins.first", "manifest_plugins.second"):
+            monkeypatch.delitem(sys.modules, module_name)
+        for registry_owner in (Plugin, BaseFoo):
+            registry = registry_owner.get_registry()
+            for module_name, class_name in registry.qualified_names():
+                if module_name.startswith("manifest_plugins"):
+                    registry.unregister(registry.find(class_name, module_name))
+
+        active = manifest.add_manifest(manifest_path)
+        try:
+            assert BaseBar.get_class('SecondFoo', None) is None
+            plugin_class = BaseFoo.lookup('SecondFoo', None)
+            assert plugin_class.__module__ == "manifest_plugins.second"
+            assert "manifest_plugins.second" in sys.modules
+            assert "manifest_plugins.first" not in sys.modules
+        finally:
+            manifest.remove_manifest(active)
+
+    ##########################################################################
+    # Test Entry Points
+    ##########################################################################
+    def test_entry_points_are_loaded_lazily(self, tmp_path, monkeypatch):
+        """Tests that plugins advertised by entry points are only imported when first looked up."""
+        (tmp_path / "entry_point_plugins.py").write_text(
+            "from tests.test_plugin import EntryPointFoo\n\n\n"
+            "class EntryFoo(EntryPointFoo):\n"
+            "    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        entry_points = [metadata.EntryPoint('entry-foo', 'entry_point_plugins:EntryFoo', 'test.foo.plugins')]
+
+        with patch.object(plugin, 'get_entry_points', return_value=entry_points) as mock:
+            assert EntryPointFoo.has_registered_class('EntryFoo') is False
+            assert EntryPointFoo.get_class('Missing', None) is None
+            mock.assert_called_once_with('test.foo.plugins')
+            assert EntryPointFoo.has_registered_class('entry-foo')
+            assert 'entry_point_plugins' not in sys.modules
+            assert EntryPointFoo.get_registry().find('EntryFoo', 'other_plugins') is None
+            assert 'entry_point_plugins' not in sys.modules
+
+            constructed = EntryPointFoo.construct('EntryFoo', None, value=2)
+            assert type(constructed).__name__ == 'EntryFoo'
+            assert constructed.kwargs == {'value': 2}
+            assert EntryPointFoo.lookup('entry-foo', None) is type(constructed)
+            assert mock.call_count == 1
+        monkeypatch.delitem(sys.modules, 'entry_point_plugins')
+
+    ##########################################################################
+    # Test Concurrency
+    ##########################################################################
+    def test_concurrent_construction(self, tmp_path, monkeypatch):
+        """Tests that many threads constructing plugins from a module which is not imported yet agree on the class."""
+        (tmp_path / "concurrent_plugins.py").write_text(
+            "from tests.test_plugin import BaseFoo\n\n\n"
+            "class ConcurrentFoo(BaseFoo):\n"
+            "    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        barrier = threading.Barrier(8)
+
+        def construct(index):
+            barrier.wait()
+            return BaseFoo.construct_from_parameters({'foo_type': 'ConcurrentFoo', 'foo_module': 'concurrent_plugins'},
+                                                     value=index)
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                constructed = list(executor.map(construct, range(64)))
+            assert len({type(item) for item in constructed}) == 1
+            assert [item.kwargs['value'] for item in constructed] == list(range(64))
+            registry = BaseFoo.get_registry()
+            assert [key for key in registry.qualified_names() if key[0] == 'concurrent_plugins'] == \
+                [('concurrent_plugins', 'ConcurrentFoo')]
+        finally:
+            for registry_owner in (Plugin, BaseFoo):
+                registry_owner.get_registry().unregister(sys.modules['concurrent_plugins'].ConcurrentFoo)
+            monkeypatch.delitem(sys.modules, 'concurrent_plugins')
@@ -0,0 +1,145 @@
+# --- external imports ---
+import pytest
+from mock import patch
+# --- internal imports ---
+from plugnparse import Parsable
+from plugnparse import properties
+
+
+class RequiredParsable(Parsable):
+
+    def __init__(self, name, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['name', 'value'])
+        self.name = name
+        self.value = kwargs.get('value')
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, input_value):
+        self._name = input_value
+
+    @property
+    def has_value(self):
+        return self._value is not None
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, input_value):
+        self._value = input_value
+
+
+class TestProperties:
+
+    ##########################################################################
+    # Test Parse Many
+    ##########################################################################
+    def test_parse_many(self):
+        """Tests that parse_many parses each dictionary and resolves each class only once."""
+        records = [RequiredParsable(name=str(index), value=index).to_dict() for index in range(5)]
+        records.append("not a dictionary")
+
+        with patch.object(properties, 'get_init_argument_extractor',
+                          wraps=properties.get_init_argument_extractor) as extractor_mock, \
+                patch.object(properties, 'get_class_type', wraps=properties.get_class_type) as class_type_mock:
+            parsed = properties.parse_many(records, throw_if_unable_to_parse=True)
+
+        assert [call.args[0] for call in extractor_mock.call_args_list].count(RequiredParsable) == 1
+        assert class_type_mock.call_count == 1
+        assert parsed[-1] == "not a dictionary"
+        for index, item in enumerate(parsed[:-1]):
+            assert isinstance(item, RequiredParsable)
+            assert item.name == str(index)
+            assert item.value == index
+
+    def test_parse_many_unable_to_parse(self):
+        """Tests that parse_many returns the dictionary or raises when it cannot be parsed."""
+        records = [{properties.generic_parsable_type: 'Missing', properties.generic_parsable_module: __name__}]
+        assert properties.parse_many(records) == records
+        with pytest.raises(RuntimeError):
+            properties.parse_many(records, throw_if_unable_to_parse=True)
+
+    def test_from_dicts(self):
+        """Tests that Parsable.from_dicts uses the calling class for dictionaries without a class keyword."""
+        parsed = RequiredParsable.from_dicts([{'name': 'a', 'value': 1}, RequiredParsable(name='b').to_dict()])
+        assert [type(item) for item in parsed] == [RequiredParsable, RequiredParsable]
+        assert [item.name for item in parsed] == ['a', 'b']
+        assert parsed[0].value == 1
+        assert not parsed[1].has_value
+
+    ##########################################################################
+    # Test Class Type Cache
+    ##########################################################################
+    def test_resolve_class_type_is_cached(self):
+        """Tests that class resolution only imports a module once per (module, class) pair."""
+        properties.clear_class_type_cache()
+        with patch.object(properties.importlib, 'import_module', wraps=properties.importlib.import_module) as mock:
+            for _ in range(3):
+                assert properties.resolve_class_type(__name__, 'RequiredParsable') == (RequiredParsable, None)
+            assert mock.call_count == 1
+
+    def test_resolve_class_type_caches_misses(self):
+        """Tests that failed lookups are cached until the cache is invalidated."""
+        properties.clear_class_type_cache()
+        with patch.object(properties.importlib, 'import_module', wraps=properties.importlib.import_module) as mock:
+            class_type, error = properties.resolve_class_type(__name__, 'LateParsable')
+            assert class_type is None
+            assert isinstance(error, AttributeError)
+            properties.resolve_class_type(__name__, 'LateParsable')
+            assert mock.call_count == 1
+
+            # --- invalidate after the class becomes available ---
+            globals()['LateParsable'] = RequiredParsable
+            try:
+                properties.clear_class_type_cache(module_str=__name__, class_str='LateParsable')
+                assert properties.resolve_class_type(__name__, 'LateParsable') == (RequiredParsable, None)
+                assert mock.call_count == 2
+            finally:
+                del globals()['LateParsable']
+                properties.clear_class_type_cache()
+
+    def test_class_type_cache_is_bounded(self):
+        """Tests that the least recently used entries are evicted from the class type cache."""
+        properties.clear_class_type_cache()
+        with patch.object(properties, 'class_type_cache_size', 2):
+            for class_str in ('A', 'B', 'C'):
+                properties.resolve_class_type(__name__, class_str)
+            assert list(properties._class_type_cache.keys()) == [(__name__, 'B'), (__name__, 'C')]
+        properties.clear_class_type_cache()
+
+    ##########################################################################
+    # Test Initialization Arguments
+    ##########################################################################
+    def test_required_parameter_for_class_init_is_cached(self):
+        """Tests that the init signatures are only inspected once per class."""
+        class CachedParsable(RequiredParsable):
+            pass
+
+        with patch.object(properties.inspect, 'signature', wraps=properties.inspect.signature) as mock:
+            assert properties.required_parameter_for_class_init(CachedParsable) == ['name']
+            call_count = mock.call_count
+            assert properties.required_parameter_for_class_init(CachedParsable) == ['name']
+            assert mock.call_count == call_count
+
+    def test_init_argument_extractor_invalidated(self):
+        """Tests that the cached required arguments are refreshed when '__init__' is replaced."""
+        class ReplacedParsable(RequiredParsable):
+            pass
+
+        assert properties.get_init_argument_extractor(ReplacedParsable)({'name': 'a', 'value': 1}) == {'name': 'a'}
+
+        def replaced_init(self, name, value, **kwargs):
+            RequiredParsable.__init__(self, name, value=value, **kwargs)
+
+        ReplacedParsable.__init__ = replaced_init
+        extractor = properties.get_init_argument_extractor(ReplacedParsable)
+        assert sorted(extractor.required_args) == ['name', 'value']
+        assert extractor({'name': 'a', 'value': 1}) == {'name': 'a', 'value': 1}
+        with pytest.raises(RuntimeError):
+            extractor({'name': 'a'})